@@ -0,0 +1,6 @@
+(defn fibonacci (n)
+ (if (< n 2)
+  n
+  (+ (fibonacci (- n 1)) (fibonacci (- n 2)))))
+
+(prn "Fibonacci numbers (computed using naive recursive algorithm) =>" (list (map fibonacci (range 15))))
@@ -0,0 +1,5 @@
+(defn prime? (n)
+ (and (> n 1)
+      (not (any (map (fn (d) (= 0 (mod n d))) (range 2 (inc (int (pow n 0.5)))))))))
+
+(prn "Prime numbers (found using the trial division, up to 500) =>" (list (filter prime? (range 500))))
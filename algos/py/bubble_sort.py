@@ -1,25 +1,18 @@
 import random
 
-import chiakilisp.features.core as core  # import ChiakiLisp core library
-import chiakilisp.features.forms as forms  # import ChiakiLisp various forms
-
 
 def _bubble_sort(ls: list) -> list:
 
-    x, y, tail = forms.bindings.let({
-        forms.destructurings.list([
-            'x', 'y'
-        ]): ls
-    }, ['x', 'y', 'tail'])
+    x, y, tail = (ls + [None, None])[0], (ls + [None, None])[1], ls[2:]
 
-    return ls if not x or y \
+    return ls if x is None or y is None \
         else [y, x, *_bubble_sort(tail)] if x > y else [x, *_bubble_sort(ls[1:])]
 
 
 def bubble_sort(ls: list) -> list:
 
     bubbled = _bubble_sort(ls)
-    return ls if ls == bubbled else _bubble_sort(bubbled)
+    return ls if ls == bubbled else bubble_sort(bubbled)
 
 
 source_list = [random.randint(i, i + 5) for i in range(10)]
@@ -0,0 +1,6 @@
+def fibonacci(n: int) -> int:
+
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+print("Fibonacci numbers (computed using naive recursive algorithm) =>", list(map(fibonacci, range(15))))
@@ -0,0 +1,6 @@
+def is_prime(n: int) -> bool:
+
+    return n > 1 and not any(n % d == 0 for d in range(2, int(n ** 0.5) + 1))
+
+
+print("Prime numbers (found using the trial division, up to 500) =>", list(filter(is_prime, range(500))))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import os
+import sys
+import timeit
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chiakilisp import hooks  # noqa: E402  # pylint: disable=wrong-import-position
+from chiakilisp.runtime import Runtime  # noqa: E402  # pylint: disable=wrong-import-position
+from chiakilisp.models.expression import Expression  # noqa: E402  # pylint: disable=wrong-import-position
+
+WORKLOAD = '(defn fib (n) (if (< n 2) n (+ (fib (- n 1)) (fib (- n 2)))))'
+
+
+def measure(runtime: Runtime, code: str, runs: int) -> list:
+
+    """Returns wall times of the code evaluation, in seconds"""
+
+    runtime.execute(code)  # <----------------------------------------------------------------------- warm up
+    return [timeit.timeit(lambda: runtime.execute(code), number=1) for _ in range(runs)]
+
+
+def noop(*_) -> None:
+
+    """A hook which does nothing, to measure the cost of a hook"""
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser('hooks - evaluator hooks overhead benchmark')
+    parser.add_argument('-n', '--runs', type=int, default=7, help='Number of measured runs of each case')
+    parser.add_argument('--fib', type=int, default=16, help='Argument of the fib function to evaluate')
+
+    args = parser.parse_args()
+
+    runtime = Runtime()
+    runtime.execute(WORKLOAD)
+    code = f'(fib {args.fib})'
+    original = Expression.execute
+
+    calls = [0]
+    hooks.add(hooks.ENTER, lambda *_: calls.__setitem__(0, calls[0] + 1))
+    runtime.execute(code)
+    hooks.clear()
+
+    results = {'never installed': measure(runtime, code, args.runs)}
+    hooks.add(hooks.BEFORE_FORM, noop)
+    hooks.add(hooks.ENTER, noop)
+    hooks.clear()
+    assert Expression.execute is original, 'the original Expression.execute() should have been put back'
+    results['installed, then removed'] = measure(runtime, code, args.runs)
+    hooks.add(hooks.ENTER, noop)
+    results['enter hook (no-op)'] = measure(runtime, code, args.runs)
+    hooks.clear()
+    hooks.add(hooks.BEFORE_FORM, noop)
+    results['before-form hook (no-op)'] = measure(runtime, code, args.runs)
+    hooks.clear()
+
+    for title, measured in results.items():
+        print(f'{code} ({title}): median {statistics.median(measured) * 1000:.1f} ms, min {min(measured) * 1000:.1f} ms')
+
+    # Without hooks, the only cost is the 'CALL_HOOKS is None' check in each function call, so its upper bound is
+    # the number of calls times the cost of the global lookup and the comparison (forms are not checked at all).
+
+    check = min(timeit.repeat('CALL_HOOKS is None', globals={'CALL_HOOKS': None}, number=1_000_000, repeat=5)) / 1_000_000
+    baseline = min(results['never installed'])
+    print(f'\n{calls[0]} calls x {check * 1e9:.1f} ns check = {calls[0] * check * 1000:.3f} ms, '
+          f'{calls[0] * check / baseline * 100:.3f}% of the evaluation time without hooks')
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHIAKILANG = os.path.join(ROOT, 'chiakilang')
+
+
+def wall_times(options: list, runs: int) -> list:
+
+    """Returns wall times of the `chiakilang -e nil` launches"""
+
+    command = [sys.executable, CHIAKILANG, '--settingsless', *options, '-e', 'nil']
+    subprocess.run(command, check=True, capture_output=True, cwd=ROOT)  # <------ warm up, and save core image
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True, cwd=ROOT)
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def import_times(top: int) -> list:
+
+    """Returns the (cumulative microseconds, module) slowest imports"""
+
+    command = [sys.executable, '-X', 'importtime', CHIAKILANG, '--settingsless', '-e', 'nil']
+    stderr = subprocess.run(command, check=True, capture_output=True, cwd=ROOT, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        if not module.startswith('  '):  # <------------------------- only top-level imports, nested ones add up
+            rows.append((int(cumulative), module.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser('startup - ChiakiLisp startup benchmark')
+    parser.add_argument('-n', '--runs', type=int, default=10, help='Number of launches to measure')
+    parser.add_argument('-t', '--top', type=int, default=10, help='Number of slowest imports to show')
+
+    args = parser.parse_args()
+
+    for title, options in (('with core image', []), ('without core image', ['--imageless']), ('coreless', ['--coreless'])):
+        measured = wall_times(options, args.runs)
+        print(f'chiakilang -e nil ({title}): median {statistics.median(measured) * 1000:.1f} ms, '
+              f'min {min(measured) * 1000:.1f} ms, max {max(measured) * 1000:.1f} ms')
+
+    print('\nslowest top-level imports (cumulative):')
+    for cumulative, module in import_times(args.top):
+        print(f'{cumulative / 1000:8.1f} ms  {module}')
@@ -0,0 +1,118 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import io
+import os
+import sys
+import glob
+import runpy
+import random
+import subprocess
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHIAKILANG = os.path.join(ROOT, 'chiakilang')
+
+sys.path.insert(0, ROOT)
+
+from chiakilisp.bench import Case  # noqa: E402  # pylint: disable=wrong-import-position
+from chiakilisp.lexer import Lexer  # noqa: E402  # pylint: disable=wrong-import-position
+from chiakilisp.parser import Parser  # noqa: E402  # pylint: disable=wrong-import-position
+from chiakilisp.runtime import Runtime, core_source_code, wood  # noqa: E402  # pylint: disable=wrong-import-position
+
+# Each case measures one stage or one kind of work, so a regression points to where it has been introduced: the
+# lexer and the parser (both on the core library source), evaluation of the already parsed forms, function calls,
+# collection operations, and the interpreter startup. Then, each algos/cl/<name>.cl is paired with algos/py/ one.
+
+EVALUATION = '''
+(let (xs [1 2 3 4 5] m {:a 1 :b 2})
+  (if (> (count xs) 3) (+ (get m :a) (get xs 0) (get m :b)) nil))
+'''
+
+FUNCTION_CALLS = '''
+(defn fib (n) (if (< n 2) n (+ (fib (- n 1)) (fib (- n 2)))))
+'''
+
+COLLECTION_OPS = '''
+(reduce conj [] (range 1000))
+(->> (range 1000) (map inc) (filter odd?) (reduce +))
+(reduce (fn (acc n) (assoc acc n (* n n))) {} (range 500))
+'''
+
+
+def _tokens(source: str) -> list:
+
+    """Returns the tokens the lexer produces from the source"""
+
+    lexer = Lexer(source, 'core.cl')
+    lexer.lex()
+    return lexer.tokens()
+
+
+def _evaluator(runtime: Runtime, source: str):
+
+    """Returns a function that executes pre-parsed source forms"""
+
+    nodes = wood(source, '<bench>')
+    environment = runtime.environment
+
+    def evaluate() -> None:
+        for node in nodes:
+            node.execute(environment)
+
+    return evaluate
+
+
+def _startup() -> None:
+
+    """Launches `chiakilang -e nil`, this measures startup time"""
+
+    subprocess.run([sys.executable, CHIAKILANG, '--settingsless', '-e', 'nil'], check=True, capture_output=True, cwd=ROOT)
+
+
+def _algorithm(run):
+
+    """Returns a function that runs algorithm with stdout muted"""
+
+    def silent() -> None:
+        random.seed(0)  # <--------------------------------------------------------- both sides sort the same data
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+
+    return silent
+
+
+def algorithms(runtime: Runtime) -> list:
+
+    """Returns algos/<name>/cl and algos/<name>/py case pairs"""
+
+    cases = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'algos', 'cl', '*.cl'))):
+        name = os.path.basename(path)[:-3]
+        python = os.path.join(ROOT, 'algos', 'py', name.replace('-', '_') + '.py')
+        if not os.path.exists(python):
+            continue
+        with open(path, 'r', encoding='utf-8') as reader:
+            source = reader.read()
+        cases.append(Case(f'algos/{name}/cl',
+                          _algorithm(lambda source=source, name=name: runtime.fork().execute(source, f'{name}.cl'))))
+        cases.append(Case(f'algos/{name}/py', _algorithm(lambda python=python: runpy.run_path(python, run_name='__main__'))))
+    return cases
+
+
+def cases() -> list:
+
+    """Returns all the benchmark cases of the suite, in order"""
+
+    runtime = Runtime(images=None)
+    source = core_source_code()
+    tokens = _tokens(source)
+
+    runtime.execute(FUNCTION_CALLS)
+
+    return [Case('lexer/core', lambda: _tokens(source)),
+            Case('parser/core', lambda: Parser(tokens).parse()),
+            Case('evaluation/forms', _evaluator(runtime, EVALUATION), number=1000),
+            Case('calls/fib-15', _evaluator(runtime, '(fib 15)')),
+            Case('collections/ops', _evaluator(runtime, COLLECTION_OPS), number=10),
+            Case('startup/eval-nil', _startup)] + algorithms(runtime)
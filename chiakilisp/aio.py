@@ -0,0 +1,267 @@
+# pylint: disable=line-too-long
+# pylint: disable=protected-access
+# pylint: disable=too-many-locals
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-statements
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-return-statements
+# pylint: disable=import-outside-toplevel
+
+import weakref
+import concurrent.futures
+from typing import Any, Callable, Iterable
+from chiakilisp import channels
+from chiakilisp.models.token import Token
+from chiakilisp.spec import rules
+from chiakilisp.utils import pairs, steps
+from chiakilisp.models.literal import Literal, NotFound, Nil
+from chiakilisp.models.expression import Expression, Py3xError, MANAGED_ERRORS, \
+    TAIL_IS_VALID, SE_ASSERT, RE_ASSERT, NE_ASSERT
+
+# (async-fn) body is evaluated by evaluate() below: a form that has no (await) inside is executed as usual, by the
+# Expression.execute(), and only forms that do have (await) inside are walked here, so the coroutine can suspend.
+# Functions defined inside of the (async-fn) are ordinary ones, so their bodies are never walked for an (await).
+# The asyncio is only imported on the first use, as the core library imports this module, and it takes a while.
+
+FUNCTION_FORMS = ('fn', 'async-fn', 'defn', 'defn?', 'defn-memo', 'async-defn', 'deftest', 'future')
+
+SUPPORTED_FORMS = ('await', 'do', 'and', 'or', 'if', 'when', 'cond', 'let', 'try', '->', '->>', 'for', 'while')
+
+_AWAITS = weakref.WeakKeyDictionary()  # <------------------ whether form has an (await) inside, computed only once
+
+
+def _awaits(node: Any) -> bool:
+
+    """Returns whether the form has an (await) inside"""
+
+    if not isinstance(node, Expression) or node.is_inline_fn():
+        return False
+
+    awaits = _AWAITS.get(node)
+    if awaits is None:
+        nodes = node.nodes()
+        head = nodes[0] if nodes else None
+        name = head.token().value() if isinstance(head, Literal) and head.token().is_identifier() else None
+        if name == 'await':
+            awaits = True
+        elif name in FUNCTION_FORMS:
+            awaits = False  # <------------------------ function body belongs to that function, not to this one
+        else:
+            awaits = any(_awaits(child) for child in nodes)
+        _AWAITS[node] = awaits
+    return awaits
+
+
+def _call(where: tuple, function: Callable, arguments: list) -> Any:
+
+    """Calls the function the same way Expression.execute() does"""
+
+    try:
+        return function(*arguments)
+    except Exception as _error_:
+        if not isinstance(_error_, MANAGED_ERRORS):
+            raise Py3xError(f'{":".join(map(str, where))}: {_error_.__class__.__name__}: {_error_.__str__()}')
+        raise _error_
+
+
+async def _body(nodes: list, environ: dict) -> Any:
+
+    """Evaluates each form, then returns the last result"""
+
+    result = None
+    for node in nodes:
+        result = await evaluate(node, environ)
+    return result
+
+
+async def evaluate(node: Any, environ: dict) -> Any:
+
+    """Evaluates the form in the (async-fn) function body"""
+
+    if not _awaits(node):
+        return node.execute(environ, False)  # <---------------------------- there is nothing to suspend on here
+
+    head, *tail = node.nodes()
+    where = head.token().position() if isinstance(head, Literal) else ()
+    SE_ASSERT(where, isinstance(head, Literal),       'Expression[execute]: head of the expression should be a Literal')
+
+    if head.token().type() == Token.Keyword:
+        get = environ.get('get')
+        RE_ASSERT(where, get,      "Expression[execute]: unable to use keyword as a function without `core/get`")
+        SE_ASSERT(where, 1 <= len(tail) <= 2,  'Expression[execute]: keyword must be followed by one or two args')
+        collection, default = tail if len(tail) == 2 else (tail[0], Nil)
+        computed = await evaluate(collection, environ)
+        if type(computed) is dict:  # pylint: disable=unidiomatic-typecheck  # <----- subclasses go to `core/get`
+            return computed.get(head.execute(environ, False), await evaluate(default, environ))  # the fast path
+        return get(computed, head.execute(environ, False), await evaluate(default, environ))
+
+    form = head.token().value()
+
+    if form == 'await':
+        import asyncio
+        import inspect
+        TAIL_IS_VALID(tail, 'await', where,                                   'Expression[execute]: await: {why}')
+        awaited = channels.AWAITED.set(True)  # <------------- a channel operation in here may return an awaitable
+        try:
+            awaitable = await evaluate(tail[0], environ)
+        finally:
+            channels.AWAITED.reset(awaited)
+        if isinstance(awaitable, concurrent.futures.Future):
+            awaitable = asyncio.wrap_future(awaitable)  # <- so it is possible to (await (future ...)) as well
+        RE_ASSERT(where, inspect.isawaitable(awaitable), 'Expression[execute]: await: the value is not awaitable')
+        return await awaitable
+
+    if form == 'do':
+        return await _body(tail, environ)
+
+    if form == 'or':
+        result = None
+        for cond in tail:
+            result = await evaluate(cond, environ)
+            if result:
+                return result
+        return result
+
+    if form == 'and':
+        result = True
+        for cond in tail:
+            result = await evaluate(cond, environ)
+            if not result:
+                return result
+        return result
+
+    if form == 'if':
+        arity = TAIL_IS_VALID(tail, 'if', where,                                 'Expression[execute]: if: {why}')
+        cond, true, false = (tail if arity == 3 else tail + [Nil])
+        return await evaluate(true if await evaluate(cond, environ) else false, environ)
+
+    if form == 'when':
+        TAIL_IS_VALID(tail, 'when', where,                                     'Expression[execute]: when: {why}')
+        cond, *extras = tail
+        return await _body(extras, environ) if await evaluate(cond, environ) else None
+
+    if form == 'cond':
+        if not tail:
+            return None
+        TAIL_IS_VALID(tail, 'cond', where,                                     'Expression[execute]: cond: {why}')
+        for cond, expr in pairs(tail):
+            if await evaluate(cond, environ):
+                return await evaluate(expr, environ)
+        return None
+
+    if form == 'let':
+        TAIL_IS_VALID(tail, 'let', where,                                       'Expression[execute]: let: {why}')
+        bindings, *body = tail
+        let = {}
+        let.update(environ)
+        for raw, value in pairs(bindings.nodes()):
+            node._destructure(let, raw, await evaluate(value, let))
+        return await _body(body or [Nil], let)
+
+    if form == 'try':
+        TAIL_IS_VALID(tail, 'try', where,                                       'Expression[execute]: try: {why}')
+        main, catch = tail
+        TAIL_IS_VALID(catch.nodes(), 'catch', where,                          'Expression[execute]: catch: {why}')
+        _, klass, alias, *block = catch.nodes()
+        obj = klass.execute(environ, False)
+        try:
+            return await evaluate(main, environ)
+        except obj as exception:
+            closure = {}
+            closure.update(environ)
+            closure[alias.token().value()] = exception
+            return await _body(block, closure)
+
+    if form in ('->', '->>'):
+        if not tail:
+            return None
+        if len(tail) == 1:
+            return await evaluate(tail[0], environ)
+        return await evaluate(Expression._thread(tail, form == '->>'), environ)
+
+    if form == 'for':
+        TAIL_IS_VALID(tail, 'for', where,                                       'Expression[execute]: for: {why}')
+        get = environ.get('get')
+        RE_ASSERT(where, get,                   'Expression[execute]: for: for-loop requires `core/get` function')
+        bindings, body = tail
+        aliases, collections = [], []
+        for alias, collection in pairs(bindings.nodes()):
+            aliases.append(alias.token().value())
+            collections.append(await evaluate(collection, environ))
+        for step in steps(collections, get):
+            env = {}
+            env.update(environ)
+            env.update(zip(aliases, step))
+            await evaluate(body, env)
+        return None
+
+    if form == 'while':
+        TAIL_IS_VALID(tail, 'while', where,                                   'Expression[execute]: while: {why}')
+        condition, body = tail
+        while await evaluate(condition, environ):
+            if await evaluate(body, environ) == '$loop-control:break':
+                break
+        return None
+
+    if form.startswith('.') and not form == '...':
+        SE_ASSERT(where, len(form) > 1,                 'Expression[execute]: dot-form: method name is mandatory')
+        TAIL_IS_VALID(tail, 'dot-form', where,                             'Expression[execute]: dot-form: {why}')
+        handle_name, *method_args = tail
+        handle_instance = await evaluate(handle_name, environ)
+        handle_method = getattr(handle_instance, form[1:], NotFound)
+        NE_ASSERT(where,
+                  handle_method is not NotFound,
+                  f"Expression[execute]: dot-form: the '{handle_instance.__class__.__name__}' object has no method '{form[1:]}'")
+        return _call(where, handle_method, [await evaluate(argument, environ) for argument in method_args])
+
+    SE_ASSERT(where, form not in rules or form in SUPPORTED_FORMS,
+              f'Expression[execute]: await: can not use (await) inside of the ({form}) form')
+
+    handle = head.execute(environ, False)
+    node._assert_even_number_of_dict_literals()
+    return _call(where, handle, [await evaluate(argument, environ) for argument in tail])
+
+
+async def gather(awaitables: Iterable, limit: int = None) -> list:
+
+    """Awaits all the awaitables, at most 'limit' ones at a time"""
+
+    import asyncio
+
+    if limit is None:
+        return list(await asyncio.gather(*awaitables))
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(awaitable) -> Any:
+
+        """Awaits the awaitable when the semaphore lets it"""
+
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*map(bounded, awaitables)))
+
+
+def run(awaitable: Any) -> Any:
+
+    """Runs an event loop until awaitable is done, returns result"""
+
+    import asyncio
+
+    async def main() -> Any:
+
+        """asyncio.run() only accepts coroutine objects"""
+
+        return await awaitable
+
+    return asyncio.run(main())
+
+
+def sleep(seconds: float, result: Any = None) -> Any:
+
+    """Returns coroutine that completes after the given seconds"""
+
+    import asyncio
+
+    return asyncio.sleep(seconds, result)
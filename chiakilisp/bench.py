@@ -0,0 +1,157 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-few-public-methods
+
+import os
+import sys
+import json
+import math
+import time
+import fnmatch
+import argparse
+import platform
+import statistics
+import importlib.util
+from typing import Callable, List
+
+# `chiakilang bench` runs the benchmarks suite (benchmarks/suite.py by default, its cases() function returns a list
+# of Case objects): each case is warmed up, then timed several times, and median/p95 time of a single call is shown.
+# Cases named 'group/name/cl' and 'group/name/py' are the same algorithm written in ChiakiLisp and in Python 3, so
+# the report shows how many times ChiakiLisp is slower. Results can be saved as JSON, and compared with the saved
+# baseline: a case whose median has grown by more than the threshold is a regression (the exit code is 1 then).
+
+DEFAULT_SUITE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'suite.py')
+
+DEFAULT_THRESHOLD = 0.1  # <------------------------------------------- 10% slower than the baseline is a regression
+
+
+class Case:
+
+    """A benchmark: the function to time, and how many calls a run has"""
+
+    def __init__(self, name: str, function: Callable, number: int = 1) -> None:
+
+        self.name = name
+        self.function = function
+        self.number = number  # <------------------------------------- a very fast function is called many times a run
+
+    def run(self) -> float:
+
+        """Returns wall time of a single call, averaged over a run"""
+
+        function, number = self.function, self.number
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        return (time.perf_counter() - started) / number
+
+
+def summary(times: List[float]) -> dict:
+
+    """Returns median, p95 (nearest-rank), min and max of the times"""
+
+    ordered = sorted(times)
+    return {'median': statistics.median(ordered),
+            'p95': ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)],
+            'min': ordered[0],
+            'max': ordered[-1],
+            'runs': len(ordered)}
+
+
+def measure(case: Case, warmup: int, runs: int) -> dict:
+
+    """Warms the case up, then returns the summary of its run times"""
+
+    for _ in range(warmup):
+        case.run()
+    return summary([case.run() for _ in range(runs)])
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[tuple]:
+
+    """Returns [(name, ratio)] of the cases slower than the baseline"""
+
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and before['median'] > 0:
+            ratio = result['median'] / before['median']
+            if ratio > 1 + threshold:
+                regressions.append((name, ratio))
+    return regressions
+
+
+def load_suite(path: str) -> List[Case]:
+
+    """Returns the cases that the suite module's cases() returns"""
+
+    spec = importlib.util.spec_from_file_location('chiakilisp_bench_suite', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.cases()
+
+
+def _milliseconds(seconds: float) -> str:
+
+    """Formats time in milliseconds, with the reasonable precision"""
+
+    return f'{seconds * 1000:.3f}' if seconds < 0.01 else f'{seconds * 1000:.1f}'
+
+
+def report(results: dict, baseline: dict = None) -> None:
+
+    """Prints results table, ChiakiLisp/Python ratios, and changes"""
+
+    width = max(map(len, results), default=4)
+    print(f'{"case":<{width}} {"median, ms":>12} {"p95, ms":>12}' + ('  vs baseline' if baseline else ''))
+    for name, result in results.items():
+        line = f'{name:<{width}} {_milliseconds(result["median"]):>12} {_milliseconds(result["p95"]):>12}'
+        before = (baseline or {}).get(name)
+        if before and before['median'] > 0:
+            line += f'  {(result["median"] / before["median"] - 1) * 100:+.1f}%'
+        print(line)
+
+    pairs = [(name[:-3], results[name], results.get(name[:-3] + '/py')) for name in results if name.endswith('/cl')]
+    pairs = [(name, cl, py) for name, cl, py in pairs if py and py['median'] > 0]
+    if pairs:
+        print('\nChiakiLisp vs Python 3 (median):')
+        for name, cl, py in pairs:
+            print(f'{name:<{width}} {cl["median"] / py["median"]:>12.1f}x slower')
+
+
+def main(argv: List[str]) -> int:
+
+    """Entry point of the `chiakilang bench`, returns an exit code"""
+
+    parser = argparse.ArgumentParser('chiakilang bench - ChiakiLisp benchmarks')
+    parser.add_argument('pattern', nargs='?', default='*', help='Only run cases matching the glob pattern')
+    parser.add_argument('-s', '--suite', default=DEFAULT_SUITE, help='Path to the suite module')
+    parser.add_argument('-n', '--runs', type=int, default=10, help='Number of measured runs of each case')
+    parser.add_argument('-w', '--warmup', type=int, default=2, help='Number of warm-up runs of each case')
+    parser.add_argument('-o', '--output', metavar='PATH', help='Write results as JSON to the file')
+    parser.add_argument('-b', '--baseline', metavar='PATH', help='Compare results with JSON baseline')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown ratio to treat as a regression')
+
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as reader:
+            baseline = json.load(reader)['results']
+
+    results = {}
+    for case in load_suite(args.suite):
+        if fnmatch.fnmatchcase(case.name, args.pattern):
+            results[case.name] = measure(case, args.warmup, args.runs)
+
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as writer:
+            json.dump({'python': sys.version, 'platform': platform.platform(), 'results': results}, writer, indent=2)
+
+    regressions = compare(results, baseline, args.threshold) if baseline else []
+    for name, ratio in regressions:
+        print(f'REGRESSION: {name} is {(ratio - 1) * 100:.1f}% slower than the baseline', file=sys.stderr)
+    return 1 if regressions else 0
@@ -0,0 +1,196 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from chiakilisp.proxies.keyword import Keyword
+
+LRU, TTL = 'lru', 'ttl'  # <------------------------------------------------- supported cache eviction policies
+
+DEFAULT_MAX_SIZE = 128  # <------------------------------------------ the same default as functools.lru_cache has
+
+Uncacheable = object()  # <----------- stub value that freeze() returns when the argument can not be a cache key
+
+
+class _NotCached:  # pylint: disable=too-few-public-methods  # its okay
+
+    """Stub class to display that there is no such a key in cache"""
+
+
+NotCached = _NotCached()
+
+
+def freeze(value: Any) -> Hashable:
+
+    """Returns hashable presentation of the value, or Uncacheable"""
+
+    # Type is always the part of the key: otherwise 1, 1.0 and true, or :a and "a" would share one cache entry
+
+    if isinstance(value, (list, tuple)):
+        frozen = tuple(map(freeze, value))
+        return Uncacheable if Uncacheable in frozen else (type(value), frozen)
+
+    if isinstance(value, (set, frozenset)):
+        frozen = frozenset(map(freeze, value))
+        return Uncacheable if Uncacheable in frozen else (type(value), frozen)
+
+    if isinstance(value, dict):
+        frozen = frozenset((freeze(k), freeze(v)) for k, v in value.items())
+        return Uncacheable if any(Uncacheable in pair for pair in frozen) else (type(value), frozen)
+
+    try:
+        hash(value)
+    except TypeError:
+        return Uncacheable  # <- arbitrary mutable Python 3 objects can not be cached safely, so do not cache them
+
+    return type(value), value
+
+
+class Cache:
+
+    """
+    Cache is the class that stores bounded number of computed results and evicts them with LRU or TTL policy
+    """
+
+    _lock: threading.Lock
+    _entries: OrderedDict  # <---------------------- key -> (stored at, value), the oldest/least-recently is first
+    _policy: str
+    _max_size: int
+    _ttl: float or None
+    _hits, _misses, _evictions = 0, 0, 0
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, policy: str = LRU, ttl: float = None) -> None:
+
+        """Initialize Cache instance"""
+
+        if policy not in (LRU, TTL):
+            raise ValueError(f"Cache: unknown eviction policy '{policy}', use either :lru or :ttl")
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError('Cache: max-size should be a positive integer')
+        if policy == TTL and (not isinstance(ttl, (int, float)) or ttl <= 0):
+            raise ValueError('Cache: :ttl policy requires positive :ttl value (in seconds)')
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._policy = policy
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def lookup(self, key: Hashable) -> Any:
+
+        """Returns cached value by its key, or NotCached, counts hits and misses"""
+
+        with self._lock:
+            entry = self._entries.get(key, NotCached)
+            if entry is not NotCached and self._policy == TTL \
+                    and time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]  # <-------------------------------------- entry has expired, drop it
+                self._evictions += 1
+                entry = NotCached
+            if entry is NotCached:
+                self._misses += 1
+                return NotCached
+            if self._policy == LRU:
+                self._entries.move_to_end(key)  # <------------------ mark entry as the most recently used one
+            self._hits += 1
+            return entry[1]
+
+    def store(self, key: Hashable, value: Any) -> None:
+
+        """Stores value by its key, evicts entries to respect max size"""
+
+        with self._lock:
+            now = time.monotonic()
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            if self._policy == TTL:
+                while self._entries:  # <-------- entries are ordered by insertion time, so drop expired head
+                    oldest_key, (stored_at, _) = next(iter(self._entries.items()))
+                    if now - stored_at < self._ttl:
+                        break
+                    del self._entries[oldest_key]
+                    self._evictions += 1
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)  # <------- evict least recently used (or oldest) entry first
+                self._evictions += 1
+
+    def clear(self) -> None:
+
+        """Drops all the entries and resets the counters"""
+
+        with self._lock:
+            self._entries.clear()
+            self._hits, self._misses, self._evictions = 0, 0, 0
+
+    def stats(self) -> dict:
+
+        """Returns a dictionary of counters, keys are keywords"""
+
+        with self._lock:
+            total = self._hits + self._misses
+            return {Keyword(':hits'): self._hits,
+                    Keyword(':misses'): self._misses,
+                    Keyword(':evictions'): self._evictions,
+                    Keyword(':size'): len(self._entries),
+                    Keyword(':max-size'): self._max_size,
+                    Keyword(':policy'): Keyword(f':{self._policy}'),
+                    Keyword(':hit-rate'): (self._hits / total) if total else 0.0}
+
+
+def memoize(function: Callable, options: dict = None) -> Callable:
+
+    """
+    Returns memoized version of the function, options are: {:max-size 128 :policy :lru :ttl nil}
+    """
+
+    options = options or {}
+    cache = Cache(options.get('max-size', DEFAULT_MAX_SIZE),
+                  str(options.get('policy', LRU)),
+                  options.get('ttl'))
+
+    def memoized(*arguments, **kwargs):
+
+        """Memoized function handle object"""
+
+        key = freeze((arguments, kwargs))
+        if key is Uncacheable:
+            return function(*arguments, **kwargs)  # <---------- can not cache, so just call original function
+        value = cache.lookup(key)
+        if value is NotCached:
+            value = function(*arguments, **kwargs)
+            cache.store(key, value)
+        return value
+
+    memoized.x__cache__x = cache  # <------------------------------- make it possible to get statistics later
+    memoized.x__options__x = options  # <------------------ chiakilisp.parallel memoizes shipped functions again
+    for attribute in ('x__source__x', 'x__environ__x'):  # <--- keep the source, so chiakilisp.parallel can ship it
+        if hasattr(function, attribute):
+            setattr(memoized, attribute, getattr(function, attribute))
+    memoized.x__custom_name__x = getattr(function, 'x__custom_name__x', getattr(function, '__name__', 'memoized'))
+    return memoized  # <--------------------------------------------------------- return memoized function handle
+
+
+def _cache_of(function: Callable) -> Cache:
+
+    """Returns the Cache instance of memoized function"""
+
+    cache = getattr(function, 'x__cache__x', None)
+    if cache is None:
+        raise TypeError('the function has not been memoized, use (memoize) or (defn-memo) first')
+    return cache
+
+
+def stats(function: Callable) -> dict:
+
+    """Returns cache statistics of memoized function"""
+
+    return _cache_of(function).stats()
+
+
+def clear(function: Callable) -> None:
+
+    """Clears cache of memoized function"""
+
+    _cache_of(function).clear()
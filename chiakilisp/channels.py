@@ -0,0 +1,308 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import sys
+import random
+import threading
+import contextvars
+from collections import deque
+from typing import Any, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+# All the channels share one condition: a channel operation is cheap, and one lock makes (alts!) simple, as it
+# needs to wait on several channels at once. Each operation either blocks the calling thread or, when called
+# by the event loop thread (from an (async-fn) function), returns an awaitable that suspends until it's done. The
+# (await) form sets AWAITED while it evaluates its argument, and the first operation takes it: an operation that's
+# not awaited can neither block the event loop thread, nor return the awaitable that nobody awaits, so it raises.
+
+_CHANGED = threading.Condition()
+_WAITERS = []  # <------------------------------------ (loop, future) pairs to wake up on any channel change
+
+AWAITED = contextvars.ContextVar('chiakilisp_channel_operation_awaited', default=False)
+
+_BLOCKED = object()  # <--------------------------------------- returned by an attempt that would have to wait
+
+DEFAULT_BUFFER_SIZE = 1
+
+
+class Channel:
+
+    """A bounded FIFO buffer that is shared by producers/consumers"""
+
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE) -> None:
+
+        if size < 1:
+            raise ValueError('Channel: buffer size should be at least 1')
+
+        self._size = size
+        self._buffer = deque()
+        self._closed = False
+
+    def offer(self, value: Any) -> Any:
+
+        """Puts value unless the buffer is full (lock is held)"""
+
+        if value is None:
+            raise ValueError('Channel: can not put nil on a channel')
+        if self._closed:
+            return False
+        if len(self._buffer) >= self._size:
+            return _BLOCKED
+        self._buffer.append(value)
+        return True
+
+    def poll(self) -> Any:
+
+        """Takes value unless the buffer is empty (lock is held)"""
+
+        if self._buffer:
+            return self._buffer.popleft()
+        if self._closed:
+            return None
+        return _BLOCKED
+
+    def close(self) -> None:
+
+        """Marks channel closed, buffered values can still be taken"""
+
+        self._closed = True
+
+    def __str__(self) -> str:
+
+        return f'#<Channel {len(self._buffer)}/{self._size}{" closed" if self._closed else ""}>'
+
+
+def _notify() -> None:
+
+    """Wakes everybody up who waits on a channel (lock is held)"""
+
+    _CHANGED.notify_all()
+    for loop, future in _WAITERS:
+        loop.call_soon_threadsafe(lambda f: f.done() or f.set_result(None), future)
+    _WAITERS.clear()
+
+
+def _in_event_loop() -> bool:
+
+    """Returns whether it's called by the event loop thread"""
+
+    asyncio = sys.modules.get('asyncio')  # <----------- if asyncio has not been imported, no loop is running
+    return asyncio is not None and asyncio._get_running_loop() is not None  # pylint: disable=protected-access
+
+
+def _block(attempt: Callable) -> Any:
+
+    """Retries the attempt, blocking calling thread until it's done"""
+
+    with _CHANGED:
+        while True:
+            result = attempt()
+            if result is not _BLOCKED:
+                _notify()
+                return result
+            _CHANGED.wait()
+
+
+async def _suspend(attempt: Callable) -> Any:
+
+    """Retries the attempt, suspending coroutine until it's done"""
+
+    loop = sys.modules['asyncio'].get_running_loop()
+    while True:
+        with _CHANGED:
+            result = attempt()
+            if result is not _BLOCKED:
+                _notify()
+                return result
+            future = loop.create_future()
+            _WAITERS.append((loop, future))
+        await future
+
+
+def _perform(attempt: Callable) -> Any:
+
+    """Performs the channel operation the way the caller needs"""
+
+    if not _in_event_loop():
+        return _block(attempt)
+    if not AWAITED.get():
+        raise RuntimeError('channel operation is called by the event loop thread, but it is not awaited: use '
+                           '(await (>! ch x)) in the (async-fn), or call it from another thread')
+    AWAITED.set(False)  # <--------------------------------- only the outermost operation in the (await) is awaited
+    return _suspend(attempt)
+
+
+def chan(size: int = DEFAULT_BUFFER_SIZE) -> Channel:
+
+    """Returns a new channel with the buffer of the given size"""
+
+    return Channel(size)
+
+
+def put(channel: Channel, value: Any) -> Any:
+
+    """Puts value, waits while buffer is full, false if closed"""
+
+    return _perform(lambda: channel.offer(value))
+
+
+def take(channel: Channel) -> Any:
+
+    """Takes value, waits while buffer is empty, nil if closed"""
+
+    return _perform(channel.poll)
+
+
+def close(channel: Channel) -> None:
+
+    """Closes the channel, wakes up everybody waiting on it"""
+
+    with _CHANGED:
+        channel.close()
+        _notify()
+
+
+def alts(operations: Iterable) -> Any:
+
+    """Performs the first ready operation, returns [value channel]"""
+
+    operations = list(operations)
+
+    def attempt() -> Any:
+
+        """Tries each operation, in a random order, for fairness"""
+
+        for operation in random.sample(operations, len(operations)):
+            if isinstance(operation, Channel):
+                result = operation.poll()  # <------------------------------- a channel means take from it
+                if result is not _BLOCKED:
+                    return [result, operation]
+            else:
+                channel, value = operation  # <----------------------- a [channel value] pair means put on it
+                result = channel.offer(value)
+                if result is not _BLOCKED:
+                    return [result, channel]
+        return _BLOCKED
+
+    return _perform(attempt)
+
+
+def _closing(channel: Channel, producer: Callable) -> Channel:
+
+    """Runs producer in a thread, closes the channel afterwards"""
+
+    def target() -> None:
+
+        """Runs producer, closes channel even if producer fails"""
+
+        try:
+            producer()
+        finally:
+            close(channel)
+
+    threading.Thread(target=target, daemon=True).start()
+    return channel
+
+
+def thread_call(function: Callable, *arguments) -> Channel:
+
+    """Calls function in a new thread, returns channel with result"""
+
+    result = Channel(1)
+
+    def produce() -> None:
+
+        """Puts the function result unless the result is nil"""
+
+        value = function(*arguments)
+        if value is not None:
+            put(result, value)
+
+    return _closing(result, produce)
+
+
+def to_chan(collection: Iterable, size: int = DEFAULT_BUFFER_SIZE) -> Channel:
+
+    """Returns channel that gets collection values, then closes"""
+
+    channel = Channel(size)
+
+    def produce() -> None:
+
+        """Puts each value, blocking while the channel is full"""
+
+        for value in collection:
+            if not put(channel, value):
+                break  # <----------------------------------------- consumer has closed the channel already
+
+    return _closing(channel, produce)
+
+
+def _deliver(channel: Channel, value: Any) -> bool:
+
+    """Puts value unless the buffer is full, never waits for room"""
+
+    with _CHANGED:
+        delivered = channel.offer(value) is True
+        _notify()
+    return delivered
+
+
+def pipeline(parallelism: int, to: Channel, function: Callable, source: Channel, close_to: bool = True) -> Channel:
+
+    """Takes from source, calls function in n threads, puts to 'to'"""
+
+    # Values keep their order: a reader submits each value to the thread pool and puts the pending result on a
+    # channel of size n, a writer puts results in that order; so at most n values are in flight at a time, and
+    # when 'to' is full, the writer, then the reader, then the producers of the source wait (backpressure). The
+    # function returning nil drops that value, so a function can filter values as well as transform them. When
+    # the function raises, the writer closes the pending channel and the reader drains the source (it is never
+    # closed, as it belongs to the caller), so its producers are never stuck. The error is the value of returned
+    # channel (it is true when everything has been done), and it's put to 'to' as well, if there's room for it.
+
+    executor = ThreadPoolExecutor(parallelism)
+    pending = Channel(parallelism)
+
+    def read() -> None:
+
+        """Submits each value taken from source to the pool"""
+
+        failed = False
+        while True:
+            value = take(source)
+            if value is None:
+                return  # <------------------------------------------------------------ the source is exhausted
+            if failed:
+                continue  # <---------------------------------- the writer has failed, so the source is drained
+            try:
+                future = executor.submit(function, value)
+            except RuntimeError:  # <------------------------------------- the pool has been shut down meanwhile
+                failed = True
+                continue
+            if not put(pending, future):
+                future.cancel()  # <------------------------------------------ nobody is going to take the result
+                failed = True
+
+    def write() -> Any:
+
+        """Puts each result (in order) to the 'to' channel"""
+
+        try:
+            while True:
+                future = take(pending)
+                if future is None:
+                    return True
+                value = future.result()
+                if value is not None:
+                    put(to, value)
+        except Exception as error:  # pylint: disable=broad-except  # it's delivered, so it is never lost
+            close(pending)
+            _deliver(to, error)
+            return error
+        finally:
+            executor.shutdown(wait=False)
+            if close_to:
+                close(to)
+
+    _closing(pending, read)
+    return thread_call(write)
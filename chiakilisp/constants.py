@@ -0,0 +1,136 @@
+# pylint: disable=line-too-long
+# pylint: disable=protected-access
+# pylint: disable=missing-module-docstring
+
+from typing import Any
+from chiakilisp.models.token import Token
+from chiakilisp.models.literal import Literal
+from chiakilisp.models.expression import Expression
+
+# The lexer turns [1 2], {:a 1}, #{1 2} and #[1 2] into (listy 1 2), (dicty :a 1), (setty 1 2) and (tuply 1 2)
+# calls, so a lookup table written inside a function is built again on every call. When the parser has read such
+# an expression and all its items are constants (numbers, strings, keywords, booleans, nil, slices, or constant
+# collections themselves), hoist() builds the collection once and keeps it in the expression as a template. Then
+# the expression returns the template itself when it's immutable (a tuple of immutable items), and a fresh copy
+# of it otherwise, since the code may conj to, or assoc into, what it has got. With SHARED set to True (see the
+# --shared-literals option), mutable templates are returned as they are as well: it's faster, but then the code
+# must never mutate a collection literal, as the same object is returned on each evaluation of the literal.
+# Templates are only used while the environment has the builtin listy/dicty/setty/tuply, not replaced ones.
+
+SHARED = False
+
+ATOMS = (Token.Nil, Token.Number, Token.String, Token.Keyword, Token.Boolean, Token.Slice)
+
+
+def listy(*args) -> list:
+
+    """Builds a list, [1 2] is a (listy 1 2) call"""
+
+    return list(args)
+
+
+def dicty(*args) -> dict:
+
+    """Builds a dict, {:a 1} is a (dicty :a 1) call"""
+
+    return {args[idx]: args[idx + 1] for idx in range(0, len(args), 2)}
+
+
+def setty(*args) -> set:
+
+    """Builds a set, #{1 2} is a (setty 1 2) call"""
+
+    return set(args)
+
+
+def tuply(*args) -> tuple:
+
+    """Builds a tuple, #[1 2] is a (tuply 1 2) call"""
+
+    return tuple(args)
+
+
+BUILDERS = {'listy': listy, 'dicty': dicty, 'setty': setty, 'tuply': tuply}
+
+
+def _fresh(value: Any) -> Any:
+
+    """Returns a copy of the template that shares no mutable parts"""
+
+    kind = type(value)
+    if kind is list:
+        return [_fresh(item) for item in value]
+    if kind is dict:
+        return {key: _fresh(item) for key, item in value.items()}  # <----------- hashable keys are immutable ones
+    if kind is tuple:
+        return tuple(_fresh(item) for item in value)
+    if kind is set:
+        return set(value)  # <------------------------------------------------------ set items are immutable too
+    return value
+
+
+class Constant:
+
+    """Prebuilt value of a collection literal, and how to copy it"""
+
+    def __init__(self, name: str, template: Any, immutable: bool, flat: bool) -> None:
+
+        self.name = name
+        self.builder = BUILDERS[name]  # <-------------------------------- template is only valid for this builder
+        self.template = template
+        self.immutable = immutable  # <------------------------------------- a tuple that only has immutable items
+        self.flat = flat  # <-------------------------------------------- no nested mutable items, so .copy() does
+
+    def value(self) -> Any:
+
+        """Returns the template, or its copy if it may be mutated"""
+
+        if self.immutable or SHARED:
+            return self.template
+        if self.flat:
+            return self.template.copy()
+        return _fresh(self.template)
+
+
+def _item(node: Any) -> tuple:
+
+    """Returns (is constant, value, is immutable) for an item node"""
+
+    if isinstance(node, Literal):
+        if node.token().type() in ATOMS:
+            return True, node.execute({}), True
+        return False, None, False
+    if isinstance(node, Expression) and node.constant() is not None:
+        constant = node.constant()
+        return True, constant.template, constant.immutable
+    return False, None, False
+
+
+def hoist(expression: Expression) -> Expression:
+
+    """Prebuilds the expression if it's a constant collection literal"""
+
+    nodes = expression.nodes()
+    if expression.is_inline_fn() or not nodes or not isinstance(nodes[0], Literal):
+        return expression
+    head = nodes[0].token()
+    if head.type() != Token.Identifier or head.value() not in BUILDERS:
+        return expression
+    if head.value() == 'dicty' and len(nodes) % 2 == 0:
+        return expression  # <--------------------------------------- odd number of items, let it raise at runtime
+
+    values, immutables = [], []
+    for node in nodes[1:]:
+        is_constant, value, immutable = _item(node)
+        if not is_constant:
+            return expression
+        values.append(value)
+        immutables.append(immutable)
+
+    try:
+        template = BUILDERS[head.value()](*values)
+    except TypeError:
+        return expression  # <-------------------------------- unhashable set item or dict key, let it raise then
+
+    expression._constant = Constant(head.value(), template, head.value() == 'tuply' and all(immutables), all(immutables))
+    return expression
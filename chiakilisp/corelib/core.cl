@@ -8,18 +8,35 @@
      functools/reduce)
 
 (import chiakilisp.proxies.keyword)  ;; `keyword?` function requires
+(import chiakilisp.proxies.atom)     ;; `atom`, `swap!` and `reset!`
 
 (import chiakilisp.lexer)
 (import chiakilisp.parser)
-(import chiakilisp.runtime)  ;; <- import ChiakiLisp module for eval
+(import chiakilisp.runtime)  ;; <- `runtime/Runtime` to embed ChiakiLisp
+(import chiakilisp.cache)    ;; <- `memoize` requires Python 3 cache
+(import chiakilisp.parallel) ;; <- `pmap`, `pcalls` need process pool
+(import chiakilisp.aio)      ;; <- `async-run` needs asyncio event loop
+(import chiakilisp.channels) ;; <- `chan`, `>!`, `<!` are bounded queues
+(import chiakilisp.edn)      ;; <- `read-edn` reads data, evaluates none
+(import chiakilisp.records)  ;; <- `read-jsonl`, `read-csv` lazy readers
+(import chiakilisp.files)    ;; <- `slurp`, `spit` close files they open
+(import chiakilisp.hooks)    ;; <- `add-hook` lets observe the evaluator
 
-(defn slurp                  ;; <- read file and return its contents
-  (path)
-    (-> path (open "r") (.read)))
+(def slurp                   ;; <- read file and return its contents
+     files/slurp)
 
 (defn slurp-json             ;; <- read json, and return parsed data
   (path)
-    (-> path (open "r") json/load))
+    (-> path slurp json/loads))
+
+(def slurp-bytes             ;; <- (slurp-bytes path) returns memoryview
+     files/slurp_bytes)      ;;    of memory-mapped file, copying nothing
+(def read-region             ;; <- (read-region path offset length), it
+     files/read_region)      ;;    returns bytes, reading only the region
+(def line-seq                ;; <- (line-seq path) returns lazy lines of
+     files/line_seq)         ;;    the file, without the line endings
+(def spit                    ;; <- (spit path content append? buf-size),
+     files/spit)             ;;    content is a string, bytes or strings
 
 (defn identity (x)           ;; I.e.: (identity "foo") returns "foo"
   x)
@@ -97,13 +114,17 @@
    (cond (= 2 (count args)) (get coll item nil)
          (= 3 (count args))
          (let (default   (.__getitem__ args 2))
-          (cond (set? coll) (when (contains? coll item) item)
+          (cond (set? coll) (if (contains? coll item) item default)
+                (and (or (str? coll) (list? coll) (tuple? coll))
+                     (slice? item))
+                (.__getitem__ coll item)
                 (and (or (str? coll) (list? coll) (tuple? coll))
-                     (or (int? item) (slice? item)))
-                (try (.__getitem__ coll item)
-                  (catch IndexError _ default))
-                (dict? coll) (try (.__getitem__ coll item)
-                                   (catch KeyError __ default))))))))
+                     (int? item))   ;; <- dot-form wraps IndexError, check
+                (if (and (< item (count coll)) (>= item (- 0 (count coll))))
+                  (.__getitem__ coll item)
+                  default)
+                (dict? coll) (.get coll item default)
+                true default))))))   ;; <- nil, a number, or a bad index type
 
 (defn first (coll)                 ;; Returns a first collection item
  (when (or (list? coll) (tuple? coll) (str? coll))
@@ -186,6 +207,80 @@
        parser  (parser/Parser (.tokens lexer))
        _       (.parse parser)
        environ {}
-       _       (.update environ runtime/ENVIRONMENT))
+       _       (.update environ __globals__)) ;; <- see runtime/Runtime
   (->> (.wood parser)
        (map (fn (an-expression) (.execute an-expression environ))))))
+
+(def memoize                   ;; <- (memoize f {:max-size 128 :policy
+     cache/memoize)            ;;                :lru :ttl nil}), or :ttl
+(def memo-stats                ;; <- returns {:hits :misses :evictions
+     cache/stats)              ;;         :size :max-size :hit-rate ...}
+(def memo-clear                ;; <- drops memoized function results
+     cache/clear)
+
+(def pmap                      ;; <- the same as map, but it's eager, and
+     parallel/pmap)            ;;    it calls function in process pool
+(def pcalls                    ;; <- (pcalls f g) calls each function in
+     parallel/pcalls)          ;;    process pool, returns their results
+(def future-call               ;; <- (future-call f), see also (future)
+     parallel/future_call)
+(def deref                     ;; <- (deref future timeout-ms timeout-val)
+     parallel/deref)
+
+(def async-run                 ;; <- (async-run (f)) runs an event loop
+     aio/run)                  ;;    until coroutine is done, returns it
+(def async-gather              ;; <- (async-gather coroutines limit) runs
+     aio/gather)               ;;    them concurrently, at most limit ones
+(def async-sleep               ;; <- (await (async-sleep seconds))
+     aio/sleep)
+
+(def chan                      ;; <- (chan n) returns channel that holds
+     channels/chan)            ;;    at most n values, 1 by default
+(def >!                        ;; <- (>! ch x) waits while ch is full, it
+     channels/put)             ;;    returns false if ch has been closed
+(def <!                        ;; <- (<! ch) waits while ch is empty, it
+     channels/take)            ;;    returns nil once ch has been closed
+(def close!                    ;; <- (close! ch), values can still be taken
+     channels/close)
+(def alts!                     ;; <- (alts! [ch1 [ch2 x]]) takes from ch1
+     channels/alts)            ;;    or puts x to ch2, returns [value ch]
+(def thread-call               ;; <- (thread-call f & args) calls f in new
+     channels/thread_call)     ;;    thread, returns channel with result
+(def to-chan!                  ;; <- (to-chan! coll n) puts coll values to
+     channels/to_chan)         ;;    new channel with buffer n, closes it
+(def pipeline                  ;; <- (pipeline n to f from) calls f in n
+     channels/pipeline)        ;;    threads on values taken from 'from'
+
+(def read-edn                  ;; <- (read-edn path readers) returns the
+     edn/read_file)            ;;    first value, readers are {tag fn}
+(def read-edn-string           ;; <- (read-edn-string s readers), the same
+     edn/read_string)
+(def read-edn-seq              ;; <- (read-edn-seq path readers) returns
+     edn/read_file_stream)     ;;    lazy values, file is read by chunks
+
+(def read-jsonl                ;; <- (read-jsonl path batch-size) returns
+     records/read_jsonl)       ;;    lazy values (or batches), line by line
+(def read-csv                  ;; <- (read-csv path batch-size header?) has
+     records/read_csv)         ;;    {:column value} maps, or row lists
+(def write-jsonl               ;; <- (write-jsonl path coll append?), returns
+     records/write_jsonl)      ;;    the number of values written
+(def write-csv                 ;; <- (write-csv path coll columns append?)
+     records/write_csv)        ;;    writes maps or lists, returns count
+
+(def add-hook                  ;; <- (add-hook :enter f), :exit, :def, :error,
+     hooks/add)                ;;    :before-form and :after-form are events
+(def remove-hook               ;; <- (remove-hook :enter f), returns true
+     hooks/remove)             ;;    if f has been added as the hook before
+(def clear-hooks               ;; <- removes all the hooks of all events
+     hooks/clear)
+
+(def swap!                     ;; <- (swap! a f & args) sets the value of
+     atom/swap)                ;;    atom to (f value & args), retrying
+(def reset!                    ;; <- (reset! a v) sets the value to v
+     atom/reset)
+(def compare-and-set!          ;; <- (compare-and-set! a old new) is true
+     atom/compare_and_set)     ;;    if the value was identical to old
+(def atom?                     ;; <- Returns true if 'x' is an atom
+     atom/is_atom)
+(def atom                      ;; <- (atom x), use (deref a) to get value
+     atom/Atom)                ;;    note: it rebinds `atom` module name
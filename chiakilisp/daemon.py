@@ -0,0 +1,221 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=import-outside-toplevel
+
+import io
+import os
+import sys
+import json
+import socket
+import signal
+import struct
+import threading
+import traceback
+from typing import List
+
+# `chiakilang --daemon` keeps a pool of warm processes listening on a Unix domain socket: the daemon process loads
+# the core library once, then forks the workers, and each of them waits for a connection, runs exactly one script
+# and exits, while the daemon forks a replacement. So a script runs in the process which already has the warm core
+# environment (nothing is loaded per script), and no script ever sees what the other ones have defined or changed.
+# `chiakilang run script.cl args...` is the thin client: it does not import the interpreter, it sends the request,
+# then streams stdout and stderr of the script, and exits with its exit code. Stdin is not forwarded to the script.
+
+# Request is the JSON line: {"path": "script.cl" or null, "source": "code" or null, "args": [...], "cwd": "..."}.
+# Response is frames of: kind byte (b'o' for stdout, b'e' for stderr, b'x' for exit code), 4-byte length, payload.
+
+SOCKET_VARIABLE = 'CHIAKILISP_SOCKET'
+
+STDOUT, STDERR, EXIT = b'o', b'e', b'x'
+
+_HEADER = struct.Struct('>cI')
+
+
+def default_socket_path() -> str:
+
+    """Returns CHIAKILISP_SOCKET, or the socket in ChiakiLisp home"""
+
+    return os.environ.get(SOCKET_VARIABLE) or os.path.join(os.path.expanduser('~'), '.chiakilisp', 'daemon.sock')
+
+
+def send_frame(connection: socket.socket, kind: bytes, payload: bytes) -> None:
+
+    """Sends one frame of the response"""
+
+    connection.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def receive_exactly(connection: socket.socket, length: int) -> bytes:
+
+    """Returns length bytes, or less if the connection is closed"""
+
+    chunks, remaining = [], length
+    while remaining:
+        chunk = connection.recv(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+class FrameWriter(io.TextIOBase):
+
+    """Text stream which sends each write as a frame of the kind"""
+
+    def __init__(self, connection: socket.socket, kind: bytes, lock: threading.Lock) -> None:
+
+        super().__init__()
+        self._connection = connection
+        self._kind = kind
+        self._lock = lock  # <----------------------------------------- stdout and stderr frames never interleave
+
+    def write(self, text: str) -> int:
+
+        if text:
+            with self._lock:
+                send_frame(self._connection, self._kind, text.encode('utf-8'))
+        return len(text)
+
+    def writable(self) -> bool:
+
+        return True
+
+
+def _job(connection: socket.socket, runtime) -> int:
+
+    """Runs the requested script in this process, returns exit code"""
+
+    reader = connection.makefile('rb')
+    request = json.loads(reader.readline() or b'{}')
+    reader.close()
+
+    os.chdir(request.get('cwd') or os.getcwd())
+    path = request.get('path')
+    sys.argv = [path or '<daemon>'] + list(request.get('args') or [])
+    try:
+        if path is not None:
+            runtime.modules.search_path.insert(0, os.path.dirname(os.path.abspath(path)))  # <------ Python-like
+            with open(path, 'r', encoding='utf-8') as script:
+                source_code, source_code_file_name = script.read(), os.path.basename(path)
+        else:
+            source_code, source_code_file_name = request.get('source') or '', '<daemon>'
+        for node in runtime.parse(source_code, source_code_file_name):
+            node.execute(runtime.environment)
+        return 0
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except (Exception,):  # pylint: disable=broad-except  # the same as the uncaught one in chiakilang
+        traceback.print_exc()
+        return 1
+    finally:
+        for pooled in ('chiakilisp.parallel', 'chiakilisp.registry'):  # <- (pmap) and (require) parser workers
+            if pooled in sys.modules:
+                sys.modules[pooled].shutdown()  # <------------------- would outlive this process, as it _exit()s
+
+
+def _worker(listener: socket.socket, runtime) -> None:
+
+    """Serves one connection, then exits (it's a forked process)"""
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    status = 1
+    try:
+        connection, _ = listener.accept()
+        listener.close()
+        lock = threading.Lock()
+        sys.stdout = FrameWriter(connection, STDOUT, lock)
+        sys.stderr = FrameWriter(connection, STDERR, lock)
+        code = _job(connection, runtime)
+        send_frame(connection, EXIT, str(code).encode('utf-8'))
+        connection.close()
+        status = 0
+    finally:
+        os._exit(status)  # pylint: disable=protected-access  # never return to the daemon's loop
+
+
+def serve(path: str, runtime, workers: int) -> None:
+
+    """Forks warm workers, keeps their number, until it's stopped"""
+
+    if os.path.exists(path):
+        os.unlink(path)  # <------------------------------------------- a socket left by the daemon that has died
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(128)
+
+    def stop(*_) -> None:
+
+        """Turns SIGTERM into the same exit as Ctrl+C does"""
+
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    children = set()
+    try:
+        while True:
+            while len(children) < workers:
+                pid = os.fork()
+                if pid == 0:
+                    _worker(listener, runtime)
+                children.add(pid)
+            pid, _ = os.wait()  # <------------------------------------- a worker has served its job, replace it
+            children.discard(pid)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def client(argv: List[str]) -> int:
+
+    """Entry point of the `chiakilang run`, returns an exit code"""
+
+    import argparse
+
+    parser = argparse.ArgumentParser('chiakilang run - run the script by the ChiakiLisp daemon')
+    parser.add_argument('source', nargs='?', help='Path to the source code')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments of the script')
+    parser.add_argument('-e', '--eval', metavar='CODE', help='Evaluate the code instead')
+    parser.add_argument('-s', '--socket', default=default_socket_path(), help='Path to the daemon socket')
+
+    args = parser.parse_args(argv)
+    if args.source is None and args.eval is None:
+        parser.error('either the source or --eval is required')
+
+    path = os.path.abspath(args.source) if args.eval is None else None
+    request = {'path': path, 'source': args.eval, 'args': args.args, 'cwd': os.getcwd()}
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(args.socket)
+    except OSError:
+        print(f'chiakilang run: no daemon is listening on {args.socket}, start one with chiakilang --daemon',
+              file=sys.stderr)
+        return 1
+
+    with connection:
+        connection.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        streams = {STDOUT: sys.stdout.buffer, STDERR: sys.stderr.buffer}
+        while True:
+            header = receive_exactly(connection, _HEADER.size)
+            if len(header) < _HEADER.size:
+                print('chiakilang run: the daemon worker has died', file=sys.stderr)
+                return 1
+            kind, length = _HEADER.unpack(header)
+            payload = receive_exactly(connection, length)
+            if kind == EXIT:
+                return int(payload)
+            streams[kind].write(payload)
+            streams[kind].flush()
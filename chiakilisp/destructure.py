@@ -0,0 +1,147 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+from typing import Any, Callable
+from chiakilisp.utils import get_assertion_closure
+from chiakilisp.proxies.keyword import Keyword
+from chiakilisp.models.forward import ExpressionType
+
+# A (let) left-hand-side pattern is compiled once into an unpacker: a closure that binds the names of the pattern
+# to the parts of the value, without calling `core/get` for each name. Semantics are the ones of `core/get` still:
+# a missing item is nil, lists, tuples and strings (but keywords) are indexed, dicts are looked up, and anything
+# else gives nil for every name. Patterns:
+#   name            binds the whole value
+#   (a b c)         binds items by position, [a b c] works the same way
+#   (a & rest)      binds the first item, then the rest of the list, tuple or string (or nil if there are none)
+#   ((a b) {c d})   sequence patterns can be nested
+#   {a b}           binds the dict values by the names (which are the keys), so {"a" 1} and {:a 1} work alike
+
+Unpacker = Callable[[dict, Any], None]
+
+SE_ASSERT = get_assertion_closure(SyntaxError)  # <----- raises SyntaxError
+
+
+def _sequential(value: Any) -> bool:
+
+    """Returns whether `core/get` would index the value by int"""
+
+    return isinstance(value, (list, tuple)) or (isinstance(value, str) and not isinstance(value, Keyword))
+
+
+def nth(value: Any, index: int) -> Any:
+
+    """Returns the item by index, like `core/get` does, or nil"""
+
+    if _sequential(value):
+        return value[index] if -len(value) <= index < len(value) else None
+    if isinstance(value, dict):
+        return value.get(index)
+    if isinstance(value, set):
+        return index if index in value else None
+    return None
+
+
+def lookup(value: Any, key: str) -> Any:
+
+    """Returns the item by key, like `core/get` does, or nil"""
+
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, set):
+        return key if key in value else None
+    return None
+
+
+def _name(node: Any) -> str:
+
+    """Returns name of the identifier node of the pattern"""
+
+    return node.token().value()
+
+
+def _dictionary(keys: list) -> Unpacker:
+
+    """Compiles {a b} pattern into the direct dict get unpacker"""
+
+    def unpack(environ: dict, value: Any) -> None:
+        if type(value) is dict:  # pylint: disable=unidiomatic-typecheck  # <-------------- exact dict is common
+            for key in keys:
+                environ[key] = value.get(key)
+        else:
+            for key in keys:
+                environ[key] = lookup(value, key)
+
+    return unpack
+
+
+def _flat(names: list) -> Unpacker:
+
+    """Compiles (a b c) pattern into sequence unpacking with padding"""
+
+    count = len(names)
+    padding = (None,) * count
+
+    def unpack(environ: dict, value: Any) -> None:
+        kind = type(value)
+        if kind is list or kind is tuple or kind is str:
+            head = value[:count]
+            environ.update(zip(names, head if len(head) == count else tuple(head) + padding[len(head):]))
+        else:
+            for index, name in enumerate(names):
+                environ[name] = nth(value, index)
+
+    return unpack
+
+
+def _nested(parts: list, rest: Unpacker or None) -> Unpacker:
+
+    """Compiles sequence pattern with nested patterns, or with a rest"""
+
+    count = len(parts)
+
+    def unpack(environ: dict, value: Any) -> None:
+        for index, part in enumerate(parts):
+            part(environ, nth(value, index))
+        if rest is not None:
+            rest(environ, (value[count:] or None) if _sequential(value) else None)
+
+    return unpack
+
+
+def _binder(name: str) -> Unpacker:
+
+    """Compiles a name pattern, it binds the whole value to the name"""
+
+    def unpack(environ: dict, value: Any) -> None:
+        environ[name] = value
+
+    return unpack
+
+
+def unpacker(pattern: Any) -> Unpacker:
+
+    """Compiles the let-form left-hand-side pattern into unpacker"""
+
+    if not isinstance(pattern, ExpressionType):
+        return _binder(_name(pattern))
+
+    nodes = pattern.nodes()
+    head = nodes[0] if nodes else None
+    if head is not None and not isinstance(head, ExpressionType) and head.token().is_identifier():
+        if head.token().value() == 'dicty':
+            return _dictionary([_name(node) for node in nodes[1:]])
+        if head.token().value() == 'listy':
+            nodes = nodes[1:]  # <--------------------------------------------- [a b] is (listy a b) after the lexer
+
+    rest = None
+    ampersand = [index for index, node in enumerate(nodes)
+                 if not isinstance(node, ExpressionType) and node.token().value() == '&']
+    if ampersand:
+        SE_ASSERT(nodes[ampersand[0]].token().position(), len(nodes) - ampersand[0] == 2,
+                  "Expression[execute]: let: '&' should be followed by exactly one pattern")
+        rest = unpacker(nodes[-1])
+        nodes = nodes[:ampersand[0]]
+
+    if rest is None and not any(isinstance(node, ExpressionType) for node in nodes):
+        return _flat([_name(node) for node in nodes])
+    return _nested([unpacker(node) for node in nodes], rest)
@@ -0,0 +1,260 @@
+# pylint: disable=line-too-long
+# pylint: disable=too-many-locals
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-statements
+# pylint: disable=missing-module-docstring
+
+import re
+import uuid
+import datetime
+from fractions import Fraction
+from typing import Any, Generator, IO
+from chiakilisp.proxies.keyword import Keyword
+
+# EDN data is read by this dedicated reader, not by Lexer -> Parser -> Expression.execute(): one compiled regular
+# expression splits the input into tokens, and the values are built right away, using an explicit stack instead
+# of the recursion, so nesting depth is not limited. Input is read in chunks, and a token is only decoded once it
+# is known to be complete (it ends well before the end of the chunk read so far), so any size files are streamed.
+# Vectors become lists, lists become tuples, maps become dicts, and sets become sets; a collection which is used
+# as a map key or a set element is frozen: it becomes a tuple (or a frozenset), as Python 3 needs hashable ones.
+
+CHUNK_SIZE = 1 << 20
+
+TOKEN_MARGIN = 16  # <------- a token that ends that close to the end of the chunk may continue in the next one
+
+_TOKEN = re.compile(r"""
+    (?:[\s,]+|;[^\n]*(?![^\n]))*  # <-------------------------------------- whitespace and comments are skipped
+    (?:
+      (?P<keyword>:[^\s,()\[\]{}"\;]+)
+    | (?P<string>"[^"\\]*(?:\\.[^"\\]*)*")
+    | (?P<open>\#\{|[(\[{])
+    | (?P<close>[)\]}])
+    | (?P<int>[+-]?\d+)(?![^\s,()\[\]{}"\;])
+    | (?P<float>[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)(?![^\s,()\[\]{}"\;])
+    | (?P<discard>\#_)
+    | (?P<tag>\#[a-zA-Z][^\s,()\[\]{}"\;]*)
+    | (?P<char>\\(?:newline|space|tab|return|formfeed|backspace|u[0-9a-fA-F]{4}|[^\s,()\[\]{}]))
+    | (?P<atom>[^\s,()\[\]{}"\;\#][^\s,()\[\]{}"\;]*)
+    | (?P<error>[^\s,;])
+    | (?P<end>\Z)
+    )
+""", re.VERBOSE)
+
+_NUMBER = re.compile(r'[+-]?\d+N|[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?M')
+_RATIO = re.compile(r'[+-]?\d+/\d+')
+_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)')
+
+_ESCAPES = {'"': '"', '\\': '\\', 'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', '/': '/'}
+_CHARACTERS = {'newline': '\n', 'space': ' ', 'tab': '\t', 'return': '\r', 'formfeed': '\f', 'backspace': '\b'}
+_CONSTANTS = {'nil': None, 'true': True, 'false': False}
+_CLOSING = {'(': ')', '[': ']', '{': '}', '#{': '}'}
+
+_DISCARD = object()  # <------------------------------------------------------------------- #_ prefix marker
+
+
+def _unescape(match) -> str:
+
+    """Returns the character the string escape sequence stands for"""
+
+    escape = match.group(1)
+    if escape[0] == 'u' and len(escape) == 5:
+        return chr(int(escape[1:], 16))
+    if escape not in _ESCAPES:
+        raise SyntaxError(f'EDN: unknown string escape sequence: \\{escape}')
+    return _ESCAPES[escape]
+
+
+def _freeze(value: Any) -> Any:
+
+    """Returns hashable version of the value, for map keys and sets"""
+
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_freeze, value))
+    if isinstance(value, dict):
+        return frozenset((_freeze(key), _freeze(item)) for key, item in value.items())
+    return value
+
+
+def _collection(opening: str, items: list, offset: int) -> Any:
+
+    """Returns the collection value built from its items"""
+
+    if opening == '[':
+        return items
+    if opening == '(':
+        return tuple(items)
+    if opening == '#{':
+        return set(map(_freeze, items))
+    if len(items) % 2:
+        raise SyntaxError(f'EDN: map literal at offset {offset} should contain even number of forms')
+    keys, values = items[::2], items[1::2]
+    try:
+        return dict(zip(keys, values))
+    except TypeError:
+        return dict(zip(map(_freeze, keys), values))  # <-------------------- a collection is used as a map key
+
+
+def _atom(token: str, offset: int) -> Any:
+
+    """Returns the value of a symbol, constant or special number"""
+
+    if token in _CONSTANTS:
+        return _CONSTANTS[token]
+    if token[0].isdigit() or (len(token) > 1 and token[0] in '+-' and token[1].isdigit()):
+        if _NUMBER.fullmatch(token):
+            return int(token[:-1]) if token[-1] == 'N' else float(token[:-1])
+        if _RATIO.fullmatch(token):
+            return Fraction(token)
+        raise SyntaxError(f'EDN: invalid number at offset {offset}: {token}')
+    return token  # <--------------------------------------------------------------- symbols are read as strings
+
+
+def _character(token: str) -> str:
+
+    """Returns the character which \\x (\\newline, etc) stands for"""
+
+    character = token[1:]
+    if character in _CHARACTERS:
+        return _CHARACTERS[character]
+    if len(character) == 5 and character[0] == 'u':
+        return chr(int(character[1:], 16))
+    return character
+
+
+def _default_readers() -> dict:
+
+    """Returns the readers for the built-in tagged EDN elements"""
+
+    return {'inst': lambda value: datetime.datetime.fromisoformat(value.replace('Z', '+00:00')),
+            'uuid': uuid.UUID}
+
+
+def read_stream(reader: IO, readers: dict = None) -> Generator:
+
+    """Yields top-level values, reading file object chunk by chunk"""
+
+    readers = {**_default_readers(), **(readers or {})}
+    keywords = {}  # <------------------------------------------------ the same keyword is only created once
+    stack = []  # <------------------------------------------------ (opening, items, prefixes, offset) tuples
+    items, prefixes = None, []  # <------ items and pending #_/#tag prefixes of the innermost open collection
+    buffer, consumed, position, eof = '', 0, 0, False
+
+    while True:
+        limit = len(buffer) + 1 if eof else len(buffer) - TOKEN_MARGIN
+        for match in _TOKEN.finditer(buffer, position):
+            end = match.end()
+            if end > limit:
+                break  # <--------------------------------------- the token may continue in the next chunk
+            position = end
+            kind = match.lastgroup
+
+            if kind == 'keyword':
+                token = match.group(kind)
+                value = keywords.get(token)
+                if value is None:
+                    value = keywords[token] = Keyword(token)
+            elif kind == 'string':
+                value = match.group(kind)[1:-1]
+                if '\\' in value:
+                    value = _ESCAPE.sub(_unescape, value)
+            elif kind == 'int':
+                value = int(match.group(kind))
+            elif kind == 'open':
+                stack.append((match.group(kind), items, prefixes, consumed + match.start(kind)))
+                items, prefixes = [], []
+                continue
+            elif kind == 'close':
+                if not stack or _CLOSING[stack[-1][0]] != match.group(kind):
+                    raise SyntaxError(f"EDN: unexpected '{match.group(kind)}' at offset {consumed + match.start(kind)}")
+                opening, outer_items, outer_prefixes, offset = stack.pop()
+                if prefixes:
+                    raise SyntaxError(f'EDN: #_ or a tag at offset {consumed + match.start(kind)} is not followed by a form')
+                value = _collection(opening, items, offset)
+                items, prefixes = outer_items, outer_prefixes
+            elif kind == 'float':
+                value = float(match.group(kind))
+            elif kind == 'atom':
+                value = _atom(match.group(kind), consumed + match.start(kind))
+            elif kind == 'discard':
+                prefixes.append(_DISCARD)
+                continue
+            elif kind == 'tag':
+                tag = match.group(kind)[1:]
+                if tag not in readers:
+                    raise SyntaxError(f"EDN: there is no reader for the '#{tag}' tag")
+                prefixes.append(tag)
+                continue
+            elif kind == 'char':
+                value = _character(match.group(kind))
+            elif kind == 'end':
+                break
+            elif not eof:
+                position = match.start()  # <------------------ it may be a string which ends in the next chunk
+                break
+            else:
+                raise SyntaxError(f'EDN: unexpected input at offset {consumed + match.start(kind)}: {buffer[match.start(kind):match.start(kind) + 20]!r}')
+
+            if prefixes:  # <-------------------------------- the nearest prefix applies first: #_ #_ a b, #a #b c
+                while prefixes:
+                    prefix = prefixes.pop()
+                    if prefix is _DISCARD:
+                        value = _DISCARD
+                        break
+                    value = readers[prefix](value)
+                if value is _DISCARD:
+                    continue
+            if items is None:
+                yield value
+            else:
+                items.append(value)
+
+        if eof:
+            if stack or prefixes:
+                raise SyntaxError('EDN: unexpected end of input, some collection is not closed')
+            return
+        chunk = reader.read(CHUNK_SIZE)
+        eof = not chunk
+        consumed += position
+        buffer, position = buffer[position:] + chunk, 0
+
+
+class _StringReader:
+
+    """Makes a string look like file object, for read_stream()"""
+
+    def __init__(self, string: str) -> None:
+
+        self._string = string
+
+    def read(self, _: int) -> str:
+
+        """Returns the whole string, and then an empty string"""
+
+        string, self._string = self._string, ''
+        return string
+
+
+def read_string(string: str, readers: dict = None) -> Any:
+
+    """Returns the first value of EDN string, or nil if it's empty"""
+
+    return next(read_stream(_StringReader(string), readers), None)
+
+
+def read_file(path: str, readers: dict = None) -> Any:
+
+    """Returns the first value of EDN file, or nil if it's empty"""
+
+    with open(path, 'r', encoding='utf-8') as reader:
+        return next(read_stream(reader, readers), None)
+
+
+def read_file_stream(path: str, readers: dict = None) -> Generator:
+
+    """Yields the top-level values of EDN file one by one, lazily"""
+
+    with open(path, 'r', encoding='utf-8') as reader:
+        yield from read_stream(reader, readers)
+
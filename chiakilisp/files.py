@@ -0,0 +1,67 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import os
+import mmap
+from typing import Generator, Iterable
+
+# Every function opens the file in a `with` block, so the file handle is closed when the function returns (or the
+# line-seq generator is exhausted or dropped), not whenever the garbage collector decides to. slurp-bytes maps the
+# file into memory instead of reading it: the pages are loaded by the OS on access and the memoryview is zero-copy,
+# so a log can be searched with re/search or sliced without decoding it, or copying the whole file into the heap.
+# The file is closed right after it is mapped, and the mapping is released when the last view of it is collected.
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def slurp(path: str, encoding: str = 'utf-8') -> str:
+
+    """Returns the whole file contents decoded to a string"""
+
+    with open(path, 'r', encoding=encoding) as reader:
+        return reader.read()
+
+
+def slurp_bytes(path: str) -> memoryview:
+
+    """Returns the memory-mapped file contents as a memoryview"""
+
+    with open(path, 'rb') as reader:
+        if os.fstat(reader.fileno()).st_size == 0:
+            return memoryview(b'')  # <------------------------------------------- an empty file can not be mapped
+        return memoryview(mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ))  # <- the map outlives the file
+
+
+def read_region(path: str, offset: int, length: int) -> bytes:
+
+    """Returns at most length bytes of the file, starting at offset"""
+
+    if offset < 0 or length < 0:
+        raise ValueError('read-region: offset and length should not be negative')
+    with open(path, 'rb', buffering=0) as reader:  # <-------------- unbuffered, so only the region itself is read
+        reader.seek(offset)
+        return reader.read(length)
+
+
+def line_seq(path: str, encoding: str = 'utf-8', buffer_size: int = DEFAULT_BUFFER_SIZE) -> Generator:
+
+    """Yields lines of the file, without line endings, lazily"""
+
+    with open(path, 'r', encoding=encoding, buffering=buffer_size) as reader:
+        for line in reader:
+            yield line.rstrip('\r\n')
+
+
+def spit(path: str, content: str or bytes or Iterable, append: bool = False, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+
+    """Writes string, bytes, or each of the strings to the file"""
+
+    pieces = (content,) if isinstance(content, (str, bytes, bytearray, memoryview)) else content
+    pieces = iter(pieces)
+    first = next(pieces, '')
+    binary = isinstance(first, (bytes, bytearray, memoryview))
+    mode = ('a' if append else 'w') + ('b' if binary else '')
+    with open(path, mode, buffering=buffer_size, **({} if binary else {'encoding': 'utf-8'})) as writer:
+        writer.write(first)
+        for piece in pieces:
+            writer.write(piece)
@@ -0,0 +1,131 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import sys
+import threading
+from typing import Any, Callable
+from chiakilisp.models import expression
+from chiakilisp.models.expression import Expression
+
+# Hooks observe the evaluator: tracers, coverage tools, debuggers and the profiler are built on them. They cost
+# nothing when there are none: form hooks are called by the instrumented Expression.execute() copy, which is only
+# put in place of the original one while there is at least one form hook, and function handles and (def)-like
+# forms check one module global, which chiakilisp.hooks sets only while there is a function (or a def) hook.
+
+# Events and their hook arguments:
+#   before-form (form environment)          - before an expression is evaluated
+#   after-form  (form environment result)   - after it has been evaluated
+#   error       (form error)                - when the evaluation has raised, only reported by the innermost form
+#   enter       (name where arguments)      - when a ChiakiLisp function is called, where is its definition
+#   exit        (name where result)         - when a function has returned, or raised (then, the result is nil)
+#   def         (name value)                - when (def), (defn) and friends have defined a global
+
+BEFORE_FORM, AFTER_FORM, ERROR, ENTER, EXIT, DEF = 'before-form', 'after-form', 'error', 'enter', 'exit', 'def'
+
+EVENTS = (BEFORE_FORM, AFTER_FORM, ERROR, ENTER, EXIT, DEF)
+
+_HOOKS = {event: () for event in EVENTS}  # <--------------- tuples are replaced, not changed, so no lock to read
+_LOCK = threading.Lock()
+_LOCAL = threading.local()  # <------------ hooks are not reported to hooks, even if they're ChiakiLisp functions
+
+_EXECUTE = Expression.execute
+
+
+def _fire(event: str, *arguments) -> None:
+
+    """Calls the hooks of the event, unless it's called by a hook"""
+
+    if getattr(_LOCAL, 'running', False):
+        return
+    _LOCAL.running = True
+    try:
+        for hook in _HOOKS[event]:
+            hook(*arguments)
+    finally:
+        _LOCAL.running = False
+
+
+def _execute(self: Expression, environ: dict, top: bool = True) -> Any:
+
+    """Expression.execute() that is instrumented with form hooks"""
+
+    _fire(BEFORE_FORM, self, environ)
+    try:
+        result = _EXECUTE(self, environ, top)
+    except Exception as error:
+        if not getattr(error, 'x__hooked__x', False):  # <----------------- outer forms see the same error again
+            try:
+                error.x__hooked__x = True
+            except AttributeError:
+                pass
+            _fire(ERROR, self, error)
+        raise
+    _fire(AFTER_FORM, self, environ, result)
+    return result
+
+
+def enter(name: str, where: tuple, arguments: tuple) -> None:
+
+    """Reports ChiakiLisp function call, called by function handles"""
+
+    _fire(ENTER, name, where, arguments)
+
+
+def exit(name: str, where: tuple, result: Any) -> None:  # pylint: disable=redefined-builtin
+
+    """Reports function return, called by the function handles"""
+
+    _fire(EXIT, name, where, result)
+
+
+def defined(name: str, value: Any) -> None:
+
+    """Reports a global definition, called by (def), (defn), etc."""
+
+    _fire(DEF, name, value)
+
+
+def _install() -> None:
+
+    """Puts instrumented evaluator in place, or the original one"""
+
+    form_hooks = _HOOKS[BEFORE_FORM] or _HOOKS[AFTER_FORM] or _HOOKS[ERROR]
+    Expression.execute = _execute if form_hooks else _EXECUTE
+    expression.CALL_HOOKS = sys.modules[__name__] if _HOOKS[ENTER] or _HOOKS[EXIT] else None
+    expression.DEF_HOOKS = sys.modules[__name__] if _HOOKS[DEF] else None
+
+
+def add(event: str, hook: Callable) -> Callable:
+
+    """Registers the hook for the event, returns the hook itself"""
+
+    if event not in EVENTS:
+        raise ValueError(f"add-hook: unknown event '{event}', use one of: {', '.join(EVENTS)}")
+    with _LOCK:
+        _HOOKS[event] = _HOOKS[event] + (hook,)
+        _install()
+    return hook
+
+
+def remove(event: str, hook: Callable) -> bool:
+
+    """Unregisters the hook, returns whether it has been there"""
+
+    with _LOCK:
+        hooks = _HOOKS.get(event, ())
+        if hook not in hooks:
+            return False
+        index = hooks.index(hook)
+        _HOOKS[event] = hooks[:index] + hooks[index + 1:]
+        _install()
+    return True
+
+
+def clear() -> None:
+
+    """Unregisters all the hooks of all the events"""
+
+    with _LOCK:
+        for event in EVENTS:
+            _HOOKS[event] = ()
+        _install()
@@ -0,0 +1,68 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+
+# Most of the startup time is spent on lexing and parsing the core library, and each launch does exactly the same
+# thing, so its AST (Expression/Literal/Token are plain picklable objects) is saved as an image, then the next one
+# unpickles it and only executes it, which is required anyway to populate environment with modules and functions.
+# Image file name is the hash of the source code, mtimes of every chiakilisp module (the lexer, the parser and what
+# it calls, like constants.hoist(), shape the AST as well as the AST classes do) and the Python 3 version, so any
+# change of those just makes the image unused (and another one to be saved) instead of the image that's outdated.
+
+IMAGE_FORMAT = 4  # <------------------------------------------------ bump it when the AST classes change somehow
+
+
+def package_modules() -> list:
+
+    """Returns paths of all the chiakilisp package Python 3 modules"""
+
+    package = os.path.dirname(os.path.abspath(__file__))
+    return sorted(os.path.join(directory, name)
+                  for directory, _, names in os.walk(package) for name in names if name.endswith('.py'))
+
+
+def image_path(directory: str, source_code: str) -> str:
+
+    """Returns the path of the image for the given source code"""
+
+    digest = hashlib.sha256()
+    digest.update(f'{IMAGE_FORMAT}:{sys.version}:'.encode('utf-8'))
+    for path in package_modules():
+        digest.update(f'{path}:{os.path.getmtime(path)}:'.encode('utf-8'))
+    digest.update(source_code.encode('utf-8'))
+    return os.path.join(directory, f'{digest.hexdigest()[:32]}.image')
+
+
+def load(path: str) -> list or None:
+
+    """Returns nodes from the image, or None if there is no image"""
+
+    try:
+        with open(path, 'rb') as reader:
+            return pickle.load(reader)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None  # <------------------- a missing or broken image is not an error, source code is parsed then
+
+
+def save(path: str, nodes: list) -> None:
+
+    """Saves nodes as the image, does nothing if it can not do that"""
+
+    directory = os.path.dirname(path)
+    writer = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as writer:
+            pickle.dump(nodes, writer, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(writer.name, path)  # <----------------- so concurrent launches never read half-written image
+    except (OSError, TypeError, pickle.PicklingError, RecursionError):  # <- read-only home, full disk, deep AST
+        if writer is not None and os.path.exists(writer.name):
+            try:
+                os.unlink(writer.name)  # <------------------------------------- do not leave half-written image
+            except OSError:
+                pass
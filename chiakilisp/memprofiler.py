@@ -0,0 +1,210 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import sys
+import threading
+import tracemalloc
+from typing import Any, IO
+from chiakilisp import hooks
+from chiakilisp.profiler import label, position
+
+# tracemalloc attributes every allocation to a Python line, and for ChiakiLisp code that's always expression.py or
+# one of the core functions: it can't tell which `.cl` form made the environment copies or the conj'ed list. So,
+# like the profiler, the memory profiler is an enter/exit hook that keeps the (function name, definition position)
+# stack (top-level forms are frames too), and on each frame switch it reads the traced memory size: the change is
+# attributed to the innermost frame. These are net bytes (allocated and not freed yet), which is what bloats, and
+# the profiler's own bookkeeping is not counted. Traced memory size is per-process, so run one thread to profile.
+
+_ACTIVE = None  # <--------------------------------------------------------- snapshot() reads the running profiler
+
+
+def _traced() -> int:
+
+    """Returns the current size of the traced memory, in bytes"""
+
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _reset_peak() -> None:
+
+    """Resets the traced memory peak (or the traces, on Python 3.8)"""
+
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.clear_traces()  # <- Python 3.8 has no reset_peak(): forget traces, frees of those go unnoticed
+
+
+class Snapshot:
+
+    """Net bytes per ChiakiLisp function at some point of the run"""
+
+    def __init__(self, stats: dict, traced: int) -> None:
+
+        self.stats = stats  # <---------------------------------------------------- key -> (calls, net bytes, peak)
+        self.traced = traced
+
+
+class MemoryProfiler:
+
+    """Allocation profiler for the ChiakiLisp functions and forms"""
+
+    def __init__(self) -> None:
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {}  # <-------------------------------- key -> [calls, self bytes, cumulative bytes, peak]
+        self._started = False  # <----------------------------- whether tracemalloc has been started by this one
+
+    def start(self) -> 'MemoryProfiler':
+
+        """Starts tracemalloc, makes function handles report here"""
+
+        global _ACTIVE  # pylint: disable=global-statement  # there's one traced memory per process anyway
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        hooks.add(hooks.ENTER, self._entered)
+        hooks.add(hooks.EXIT, self._exited)
+        _ACTIVE = self
+        return self
+
+    def stop(self) -> None:
+
+        """Stops function handles reporting, and tracemalloc"""
+
+        global _ACTIVE  # pylint: disable=global-statement  # there's one traced memory per process anyway
+        hooks.remove(hooks.ENTER, self._entered)
+        hooks.remove(hooks.EXIT, self._exited)
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        if _ACTIVE is self:
+            _ACTIVE = None
+
+    def _entered(self, name: str, where: tuple, _: tuple) -> None:
+
+        """The enter hook: a function is called"""
+
+        self.enter(name, where)
+
+    def _exited(self, *_) -> None:
+
+        """The exit hook: a function has returned"""
+
+        self.leave()
+
+    def _thread(self) -> tuple:
+
+        """Returns ([key, entry, mark, self bytes] frames, active)"""
+
+        if not hasattr(self._local, 'frames'):
+            self._local.frames, self._local.active = [], {}
+        return self._local.frames, self._local.active  # <------------- active is key -> its frames on the stack
+
+    def enter(self, name: str, where: tuple) -> None:
+
+        """Pushes a frame, when a function (or a form) is entered"""
+
+        now = _traced()
+        frames, active = self._thread()
+        key = (name, where)
+        active[key] = active.get(key, 0) + 1
+        if frames:
+            frames[-1][3] += now - frames[-1][2]  # <---------------------- caller's allocations, up to this call
+        frame = [key, now, 0, 0]
+        frames.append(frame)
+        frame[2] = _traced()  # <------------------------------------ so the frame list itself is not counted in
+        frame[1] += frame[2] - now
+
+    def leave(self) -> None:
+
+        """Pops a frame, when a function (or a form) has returned"""
+
+        now = _traced()
+        frames, active = self._thread()
+        key, entered, mark, own = frames.pop()
+        own += now - mark
+        active[key] -= 1
+        with self._lock:
+            stats = self._stats.setdefault(key, [0, 0, 0, 0])
+            stats[0] += 1
+            stats[1] += own
+            if not active[key]:  # <------------------------------ cumulative bytes of the recursion counted once
+                stats[2] += now - entered
+        if frames:
+            frames[-1][2] = _traced()  # <---------------------------- the caller's allocations are counted again
+
+    def execute(self, node: Any, environment: dict) -> Any:
+
+        """Executes top-level form, and records its memory peak"""
+
+        key = ('<top-level form>', position(node))
+        _reset_peak()
+        started = _traced()
+        self.enter(*key)
+        try:
+            return node.execute(environment)
+        finally:
+            self.leave()
+            peak = tracemalloc.get_traced_memory()[1] - started
+            with self._lock:
+                stats = self._stats[key]
+                stats[3] = max(stats[3], peak)
+
+    def stats(self) -> list:
+
+        """Returns [(key, calls, self, cumulative, peak)], sorted"""
+
+        with self._lock:
+            rows = [(key, *stats) for key, stats in self._stats.items()]
+        return sorted(rows, key=lambda row: (row[2], row[3]), reverse=True)
+
+    def snapshot(self) -> Snapshot:
+
+        """Returns the snapshot of net bytes allocated so far"""
+
+        with self._lock:
+            stats = {key: (calls, own, peak) for key, (calls, own, _, peak) in self._stats.items()}
+        return Snapshot(stats, _traced())
+
+    def report(self, writer: IO, limit: int = None) -> None:
+
+        """Writes text report, sorted by the net bytes allocated"""
+
+        writer.write(f'{"calls":>10} {"self, KiB":>12} {"cumulative, KiB":>16} {"peak, KiB":>12}  function or form (defined at)\n')
+        for key, calls, own, cumulative, peak in self.stats()[:limit]:
+            writer.write(f'{calls:>10} {own / 1024:>12.1f} {cumulative / 1024:>16.1f} '
+                         f'{(f"{peak / 1024:.1f}" if peak else "-"):>12}  {label(key)}\n')
+
+
+def snapshot() -> Snapshot:
+
+    """Returns the snapshot taken by the running memory profiler"""
+
+    if _ACTIVE is None:
+        raise RuntimeError('snapshot: memory profiler is not running, start it, or run chiakilang with --memprofile')
+    return _ACTIVE.snapshot()
+
+
+def compare(older: Snapshot, newer: Snapshot) -> list:
+
+    """Returns [(key, calls, net bytes)] added between snapshots"""
+
+    rows = []
+    for key, (calls, own, _) in newer.stats.items():
+        before_calls, before_own, _ = older.stats.get(key, (0, 0, 0))
+        if calls != before_calls or own != before_own:
+            rows.append((key, calls - before_calls, own - before_own))
+    return sorted(rows, key=lambda row: abs(row[2]), reverse=True)
+
+
+def diff(older: Snapshot, newer: Snapshot, writer: IO = None, limit: int = None) -> None:
+
+    """Writes what has been allocated between the two snapshots"""
+
+    writer = writer or sys.stderr
+    writer.write(f'traced memory: {(newer.traced - older.traced) / 1024:+.1f} KiB\n')
+    writer.write(f'{"calls":>10} {"self, KiB":>12}  function or form (defined at)\n')
+    for key, calls, own in compare(older, newer)[:limit]:
+        writer.write(f'{calls:>+10} {own / 1024:>+12.1f}  {label(key)}\n')
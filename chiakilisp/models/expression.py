@@ -10,7 +10,9 @@
 # pylint: disable=unnecessary-dunder-call
 # pylint: disable=too-many-return-statements
 
+import types
 import importlib
+import threading
 from copy import deepcopy
 from typing import List, Any, Callable
 from chiakilisp.models.token import Token
@@ -20,7 +22,10 @@ from chiakilisp.models.literal import\
     Literal, NotFound, Nil
 from chiakilisp.models.forward import\
     ExpressionType, CommonType
-from chiakilisp.utils import get_assertion_closure, pairs
+from chiakilisp.utils import get_assertion_closure, pairs, steps, wrap
+from chiakilisp.destructure import unpacker
+from chiakilisp.cache import memoize
+from chiakilisp.parallel import future_call
 
 
 class Py3xError(Exception):
@@ -36,6 +41,7 @@ class ArityError(SyntaxError):
 NE_ASSERT = get_assertion_closure(NameError)  # <--------- raises NameError
 SE_ASSERT = get_assertion_closure(SyntaxError)  # <----- raises SyntaxError
 RE_ASSERT = get_assertion_closure(RuntimeError)  # <--- raises RuntimeError
+AE_ASSERT = get_assertion_closure(AssertionError)  # <- (is) raises this one
 
 # MANAGED_ERRORS are required to properly raise exceptions, while executing
 # an expressions
@@ -50,6 +56,49 @@ MANAGED_ERRORS = (
     NameError, SyntaxError, RuntimeError)  # tuple may be updated in future
 
 
+# Environments are plain dicts, so they may be shared between threads: each single update (like (def), (defn) or
+# (import)) is atomic, and each function call copies its defining environment atomically, so a call observes the
+# value of every global either before or after a concurrent (def). Check-then-define forms, (def?) and (defn?),
+# additionally guarantee that the first definition wins, use atoms (see chiakilisp.proxies.atom) for the rest.
+
+DEFINITIONS_LOCK = threading.Lock()
+
+# Each dot-form call site has an inline cache: receiver type -> its unbound method, so the next (.upper s) with a
+# str receiver calls str.upper(s) directly, without looking up the attribute. Only methods of the types that can't
+# be changed (builtin and other immutable types, whose instances have no __dict__ to shadow the methods) are cached,
+# so a cached method is always the one getattr() would find. A call site that has seen more receiver types than
+# INLINE_CACHE_SIZE is megamorphic, so its new receiver types are just looked up, as they were before caching.
+
+INLINE_CACHE_SIZE = 4
+MUTABLE_TYPE = 1 << 9  # <----------------------------------------- Py_TPFLAGS_HEAPTYPE: a class defined in Python
+IMMUTABLE_TYPE = 1 << 8  # <------------------------------------------- Py_TPFLAGS_IMMUTABLETYPE: set since 3.10
+METHOD_TYPES = (types.MethodDescriptorType, types.WrapperDescriptorType)
+
+
+def unbound_method(kind: type, name: str) -> Any:
+
+    """Returns the method of the type to cache, or NotFound"""
+
+    if kind.__flags__ & MUTABLE_TYPE and not kind.__flags__ & IMMUTABLE_TYPE or kind.__dictoffset__:
+        return NotFound
+    for base in kind.__mro__:
+        if name in base.__dict__:
+            method = base.__dict__[name]
+            return method if isinstance(method, METHOD_TYPES) else NotFound
+    return NotFound
+
+CALL_HOOKS = None  # <------------- chiakilisp.hooks sets itself here while there are function enter or exit hooks
+DEF_HOOKS = None  # <---------------------------- and here, while there are hooks for (def), (defn) and so forth
+
+
+def defined(name: str, value: Any) -> None:
+
+    """Reports the global definition to the hooks, if any"""
+
+    if DEF_HOOKS is not None:
+        DEF_HOOKS.defined(name, value)
+
+
 def IDENTIFIER_ASSERT(lit: Literal, message: str) -> None:
 
     """Handy shortcut to make assertion that Literal is Identifier"""
@@ -76,6 +125,10 @@ class Expression(ExpressionType):
 
     _nodes: list
     _is_inline_fn: bool = False
+    _constant: Any = None  # <------------------------ chiakilisp.constants.hoist() prebuilds collection literals
+    _unpacker: Any = None  # <---------------------- chiakilisp.destructure.unpacker() of the let-form pattern
+    _inline_cache: dict = None  # <------------------------------- dot-form receiver type -> its unbound method
+    _folded: Any = None  # <------------------------- chiakilisp.optimizer.Folded value (or branch) and its guards
 
     def __init__(self, nodes: list, **props) -> None:
 
@@ -84,12 +137,34 @@ class Expression(ExpressionType):
         self._nodes = nodes
         self._is_inline_fn = props.get('is_inline_fn', False)
 
+    def __getstate__(self) -> dict:
+
+        """Returns picklable state, compiled closures are dropped"""
+
+        state = dict(self.__dict__)
+        state.pop('_unpacker', None)  # <----------- closures can not be pickled, so they're compiled once again
+        state.pop('_inline_cache', None)  # <--------------------------------- and caches are filled once again
+        state.pop('_folded', None)  # <--------------------------------- guards are functions, and may be closures
+        return state
+
     def nodes(self) -> list:
 
         """Returns expression nodes"""
 
         return self._nodes
 
+    def is_inline_fn(self) -> bool:
+
+        """Returns whether it is an inline function"""
+
+        return self._is_inline_fn
+
+    def constant(self) -> Any:
+
+        """Returns prebuilt collection literal, or None"""
+
+        return self._constant
+
     def dump(self, indent: int) -> None:
 
         """Dumps an entire expression with all its nodes"""
@@ -126,9 +201,47 @@ class Expression(ExpressionType):
             position = self.nodes()[0].token().position()
             SE_ASSERT(position, is_even, 'Dictionary key literal must be followed by a value')
 
+    @staticmethod
+    def _thread(tail: list, last: bool) -> CommonType:
+
+        """Rewrites threading macro arguments into a single target expression, 'last' stands for ->> macro"""
+
+        tail = deepcopy(tail)  # <------------- it could be slow when tail if really complex nested data structure
+
+        target, *rest = tail  # <----------- split tail for the first time to initialize target and rest variables
+        while len(tail) > 1:  # <------ do not leave the loop while there is at least one element left in the tail
+            _ = rest[0]
+            if isinstance(_, Literal):
+                rest[0] = Expression([_])  # <------------ each argument except first should be cast to Expression
+            if last:
+                rest[0].nodes().append(target)  # <---- in case of last-threading-macro, append to the end of args
+            else:
+                rest[0].nodes().insert(1, target)  # <------- in case of first-threading-macro, insert as 1st arg
+            rest[0]._constant = None  # <------------------- it's not the collection literal it has been parsed as
+            rest[0]._folded = None  # <------------------------------------ and its folded value is not valid anymore
+            tail = [rest[0]] + rest[1:]  # <----- override tail: modified expression and the tail rest with offset
+            target, *rest = tail  # <------------------------------- do the same we did before entering while-loop
+
+        return target  # <--------------------------------------------------- return the rewritten target expression
+
+    @staticmethod
+    def _destructure(environ: dict, raw: CommonType, computed: Any) -> None:
+
+        """Binds the computed value to the let-form left-hand-side: an identifier, a list or a dictionary form"""
+
+        if isinstance(raw, Expression):  # <------------------------------- if the left-hand-side seems to be a coll
+            unpack = raw._unpacker  # pylint: disable=protected-access  # <------- the pattern is compiled only once
+            if unpack is None:
+                unpack = raw._unpacker = unpacker(raw)  # pylint: disable=protected-access  # it's the same class
+            unpack(environ, computed)
+
+        else:  # <---------------------------------------------- if the left-hand-side seems to be an identifier
+            environ[raw.token().value()] = computed  # <--------------------------- directly assign computed rhs
+
     @staticmethod
     def _parse_function_and_create_a_handle(  # pylint: disable=too-many-arguments
-            domain_: str, where: tuple, environ: dict, name: str, parameters: 'Expression', body: list):
+            domain_: str, where: tuple, environ: dict, name: str, parameters: 'Expression', body: list,
+            is_async: bool = False):
 
         """
         Takes necessary parameters like position in the source code and current environment
@@ -164,9 +277,9 @@ class Expression(ExpressionType):
         integrity_spec_rule = s.Rule(s.Arity(s.AtLeast(positional_parameters_length)
                                              if can_take_extras else s.Exactly(positional_parameters_length)))
 
-        def handle(*c_arguments, **kwargs):
+        def computation_environment(c_arguments: tuple, kwargs: dict) -> dict:
 
-            """User-function handle object"""
+            """Validates arguments and returns new computation environment"""
 
             fn_valid, _, fn_why = integrity_spec_rule.valid(c_arguments)  # first, validate function integrity
             SE_ASSERT(where, fn_valid,                                                    f'{name}: {fn_why}')
@@ -182,10 +295,77 @@ class Expression(ExpressionType):
             fn.update(environ)  # <--------------------------------------------- update it with the global one
             fn.update({'kwargs': kwargs})  # <--------------------------- update environment with keyword args
             fn.update(dict(zip(names, c_arguments)))  # <-------------- associate parameters with their values
-            return [node.execute(fn, False) for node in body][-1]  # <- and return the last computation result
+            return fn
+
+        if is_async:
+            from chiakilisp.aio import evaluate  # pylint: disable=import-outside-toplevel  # aio imports us
+
+            async def handle(*c_arguments, **kwargs):
+
+                """User-function (coroutine function) handle object"""
+
+                fn = computation_environment(c_arguments, kwargs)
+                result = None
+                for node in body:
+                    result = await evaluate(node, fn)  # <- forms without (await) inside are executed as usual
+                return result  # <---------------------------------------- and return the last computation result
+
+        else:
+            def handle(*c_arguments, **kwargs):
+
+                """User-function handle object"""
+
+                fn = computation_environment(c_arguments, kwargs)
+                hooks = CALL_HOOKS  # <------------------ the body may remove the last hook, so read it only once
+                if hooks is None:
+                    return [node.execute(fn, False) for node in body][-1]  # return the last computation result
+                hooks.enter(name, where, c_arguments)  # <----------------------- the same, but report to hooks
+                result = None
+                try:
+                    result = [node.execute(fn, False) for node in body][-1]
+                    return result
+                finally:
+                    hooks.exit(name, where, result)
+
+        handle.x__source__x = Expression([Literal(Token(Token.Identifier, 'async-fn' if is_async else 'fn', where)),
+                                          parameters] + body)
+        handle.x__environ__x = environ  # <-- source AST and defining environment let chiakilisp.parallel ship it
 
         return handle  # <---------- return a closure that will be a good handle for the user defined function
 
+    def _dot(self, environ: dict) -> Any:
+
+        """Executes the dot-form, looks up the inline cache first"""
+
+        head, handle_name, *method_args = self.nodes()
+        where = head.token().position()
+        handle_instance = handle_name.execute(environ, False)  # <------- get the handle instance from environment
+        kind = type(handle_instance)
+        cache = self._inline_cache
+        method = cache.get(kind)
+        if method is None:
+            method = unbound_method(kind, head.token().value()[1:])
+            if len(cache) < INLINE_CACHE_SIZE:
+                cache[kind] = method
+        if method is NotFound:
+            method_name = head.token().value()[1:]  # <-------------- parse handle name from the first literal
+            SE_ASSERT(where,
+                      hasattr(handle_instance, '__class__'),
+                      'Expression[execute]: dot-form: use object/method, module/method to invoke a static method')
+            handle_alias = handle_instance.__class__.__name__  # <--------- get the actual instance class name
+            handle_method: Callable = getattr(handle_instance, method_name, NotFound)  # get the method handle
+            NE_ASSERT(where,
+                      handle_method is not NotFound,
+                      f"Expression[execute]: dot-form: the '{handle_alias}' object has no method '{method_name}'")
+        try:
+            if method is not NotFound:
+                return method(handle_instance, *[node.execute(environ, False) for node in method_args])  # cached
+            return handle_method(*(node.execute(environ, False) for node in method_args))  # <---- catch an error
+        except Exception as _err_:
+            if not isinstance(_err_, MANAGED_ERRORS):
+                raise Py3xError(f'{":".join(map(str, where))}: {_err_.__class__.__name__}: {_err_.__str__()}')
+            raise _err_  # re-raise the error if it is managed, raise Py3xError if its arbitrary Python 3x one
+
     def execute(self, environ: dict, top: bool = True) -> Any:
 
         """Execute here - is to return Python 3 value related to the expression: string, number, and vice versa"""
@@ -194,6 +374,17 @@ class Expression(ExpressionType):
 
         assert self.nodes(),              'Expression[execute]: current expression is empty, unable to execute it'
 
+        folded = self._folded
+        if folded is not None and folded.holds(environ):  # <--- folded by chiakilisp.optimizer, and not rebound
+            return folded.value if folded.node is None else folded.node.execute(environ, False)
+
+        constant = self._constant
+        if constant is not None and environ.get(constant.name) is constant.builder:
+            return constant.value()  # <-------------------- constant collection literal has been built just once
+
+        if self._inline_cache is not None:
+            return self._dot(environ)  # <-------------------------- a dot-form call site that has been validated
+
         # TODO: implement something like chiakilisp.libs.core module to store symbols like `get` and `first` there
         get = environ.get('get')  # <------- some features like destructing or keyword-as-fn will require core/get
         first = environ.get('first')  # <----- some feature like inline function or others will require core/first
@@ -207,8 +398,10 @@ class Expression(ExpressionType):
             SE_ASSERT(where, len(tail) >= 1,  'Expression[execute]: keyword must be followed by at least one arg')
             SE_ASSERT(where, len(tail) <= 2,   'Expression[execute]: keyword can be followed by at most two args')
             collection, default = tail if len(tail) == 2 else (tail[0], Nil)  # <--- define collection and default
-            return get(
-                collection.execute(environ, False), head.execute(environ, False), default.execute(environ, False))
+            computed = collection.execute(environ, False)
+            if type(computed) is dict:  # pylint: disable=unidiomatic-typecheck  # <- subclasses go to `core/get`
+                return computed.get(head.execute(environ, False), default.execute(environ, False))  # the fast path
+            return get(computed, head.execute(environ, False), default.execute(environ, False))
 
         if self._is_inline_fn:  # <--- if this expression is actually an inline function: i.e.: #(prn "Hello," %1)
             RE_ASSERT(where, first,     'Expression[execute]: unable to use inline function without `core/first`')
@@ -222,9 +415,20 @@ class Expression(ExpressionType):
                 # env.update({'%&': ...})  # TODO: implement %& parameter, probably, requires body functon parsing
                 ifn.update({f'%{argument_index +1}': args[argument_index] for argument_index in range(len(args))})
 
-                return [every_body_node.execute(ifn, False) for every_body_node in [Expression(self.nodes())]][-1]
+                hooks = CALL_HOOKS  # <------------------ the body may remove the last hook, so read it only once
+                if hooks is None:
+                    return [every_body_node.execute(ifn, False) for every_body_node in [Expression(self.nodes())]][-1]
+                hooks.enter('<anonymous function>', where, args)  # <------------ the same, but report to hooks
+                result = None
+                try:
+                    result = Expression(self.nodes()).execute(ifn, False)
+                    return result
+                finally:
+                    hooks.exit('<anonymous function>', where, result)
 
             handler.x__custom_name__x = '<anonymous function>'  # <------- give an anonymous function its own name
+            handler.x__source__x = self  # <------------ inline function source is this expression (with the flag)
+            handler.x__environ__x = environ  # <-------------- remember defining environment to ship the function
             return handler  # <------------------------------------------------------------ and return its handler
 
         assert isinstance(head, Literal),        'Expression[execute]: head of the expression should be a Literal'
@@ -273,67 +477,21 @@ class Expression(ExpressionType):
                 closure[alias.token().value()] = exception  # <-- associate exception instance with a chosen alias
                 return [expr.execute(closure, False) for expr in block][-1]  # <- return exception handling result
 
-        if head.token().value() == '->':
-            if not tail:
-                return None  # <------------------------------------------------- if there are no tail, return nil
-
-            if len(tail) == 1:
-                return tail[-1].execute(environ, False)  # <------------ if there is only one argument, execute it
-
-            tail = deepcopy(tail)  # <--------- it could be slow when tail if really complex nested data structure
-
-            target, *rest = tail  # <------- split tail for the first time to initialize target and rest variables
-            while len(tail) > 1:  # <-- do not leave the loop while there is at least one element left in the tail
-                _ = rest[0]
-                if isinstance(_, Literal):
-                    rest[0] = Expression([_])  # <-------- each argument except first should be cast to Expression
-                rest[0].nodes().insert(1, target)  # <---- in case of first-threading-macro, insert as the 1st arg
-                tail = [rest[0]] + rest[1:]  # <- override tail: modified expression and the tail rest with offset
-                target, *rest = tail  # <--------------------------- do the same we did before entering while-loop
-
-            return target.execute(environ, False)  # <----- at the end, return target' expression execution result
-
-        if head.token().value() == '->>':
+        if head.token().value() in ('->', '->>'):
             if not tail:
                 return None  # <------------------------------------------------- if there are no tail, return nil
 
             if len(tail) == 1:
                 return tail[-1].execute(environ, False)  # <------------ if there is only one argument, execute it
 
-            tail = deepcopy(tail)  # <--------- it could be slow when tail if really complex nested data structure
-
-            target, *rest = tail  # <------- split tail for the first time to initialize target and rest variables
-            while len(tail) > 1:  # <-- do not leave the loop while there is at least one element left in the tail
-                _ = rest[0]
-                if isinstance(_, Literal):
-                    rest[0] = Expression([_])  # <-------- each argument except first should be cast to Expression
-                rest[0].nodes().append(target)  # <---- in case of last-threading-macro, append to the end of args
-                tail = [rest[0]] + rest[1:]  # <- override tail: modified expression and the tail rest with offset
-                target, *rest = tail  # <--------------------------- do the same we did before entering while-loop
-
-            return target.execute(environ, False)  # <----- at the end, return target' expression execution result
+            return self._thread(tail, head.token().value() == '->>').execute(environ, False)  # <- execute target
 
         if head.token().value().startswith('.') and not head.token().value() == '...':   # it could be an Ellipsis
             SE_ASSERT(where,
                       len(head.token().value()) > 1,    'Expression[execute]: dot-form: method name is mandatory')
             TAIL_IS_VALID(tail,                         'dot-form', where, 'Expression[execute]: dot-form: {why}')
-            handle_name, *method_args = tail  # <------------------------ parse dot-form handle name and arguments
-            method_name = head.token().value()[1:]  # <------------------ parse handle name from the first literal
-            handle_instance = handle_name.execute(environ, False)  # <--- get the handle instance from environment
-            SE_ASSERT(where,
-                      hasattr(handle_instance, '__class__'),
-                      'Expression[execute]: dot-form: use object/method, module/method to invoke a static method')
-            handle_alias = handle_instance.__class__.__name__  # <------------- get the actual instance class name
-            handle_method: Callable = getattr(handle_instance, method_name, NotFound)  # <-- get the method handle
-            NE_ASSERT(where,
-                      handle_method is not NotFound,
-                      f"Expression[execute]: dot-form: the '{handle_alias}' object has no method '{method_name}'")
-            try:
-                return handle_method(*(node.execute(environ, False) for node in method_args))  # <- catch an error
-            except Exception as _err_:
-                if not isinstance(_err_, MANAGED_ERRORS):
-                    raise Py3xError(f'{":".join(map(str, where))}: {_err_.__class__.__name__}: {_err_.__str__()}')
-                raise _err_  # re-raise the error if it is managed, raise Py3xError if its arbitrary Python 3x one
+            self._inline_cache = {}  # <------------ the call site is valid, so next time it goes straight to _dot()
+            return self._dot(environ)
 
         if head.token().value() == 'if':
             arity = TAIL_IS_VALID(tail, 'if', where,                             'Expression[execute]: if: {why}')
@@ -360,25 +518,7 @@ class Expression(ExpressionType):
             let = {}  # <---------------------------------------------------------- initialize a local environment
             let.update(environ)  # <------------------------------------------------ update it with the global one
             for raw, value in pairs(bindings.nodes()):  # <-------------------------------- for the each next pair
-
-                computed_right_hand_side = value.execute(let, False)  # <------- compute the right-hand-side value
-
-                if isinstance(raw, Expression):  # <--------------------- if the left-hand-side seems to be a coll
-                    RE_ASSERT(where, get,  "Expression[execute]: let: destructuring requires `core/get` function")
-
-                    get_by_idx = True
-                    skip_first = False
-                    if (raw.nodes() and
-                            self._is_identifier_matching(raw.nodes()[0], 'dicty')):  # <- dictionary destructuring
-                        skip_first = True
-                        get_by_idx = False
-
-                    for idx, k_alias in enumerate(map(lambda v: v.token().value(),
-                                                      raw.nodes()[1:] if skip_first else raw.nodes())):
-                        let.update({k_alias: get(computed_right_hand_side, idx if get_by_idx else k_alias, None)})
-
-                else:  # <---------------------------------------- if the left-hand-side seems to be an identifier
-                    let.update({raw.token().value(): computed_right_hand_side})  # <- directly assign computed rhs
+                self._destructure(let, raw, value.execute(let, False))  # <------- compute rhs, then bind its value
 
             if not body:
                 body = [Nil]  # <---------- if there is no 'let' block body, let's just return a simple nil literal
@@ -396,22 +536,41 @@ class Expression(ExpressionType):
             handle.x__custom_name__x = '<anonymous function>'  # set the function name to the <anonymous function>
             return handle  # <-------------------------------------------------- return the function handle object
 
+        if head.token().value() == 'async-fn':
+            TAIL_IS_VALID(tail, 'async-fn', where,                         'Expression[execute]: async-fn: {why}')
+            parameters, *body = tail  # <---------------------------- parse anonymous function parameters and body
+
+            handle = self._parse_function_and_create_a_handle(
+                'async-fn', where, environ, '<anonymous function>', parameters, body, is_async=True
+            )
+
+            handle.x__custom_name__x = '<anonymous function>'  # set the function name to the <anonymous function>
+            return handle  # <--------------------------------------------- return the coroutine function handle
+
+        if head.token().value() == 'await':
+            RE_ASSERT(where, False,  'Expression[execute]: await: can only use (await) inside (async-fn) function')
+
         if head.token().value() == 'def':
             SE_ASSERT(where, top,   'Expression[execute]: def: can only use (def) form at the top of the program')
             TAIL_IS_VALID(tail, 'def', where,                                   'Expression[execute]: def: {why}')
             name, value = tail  # <-------------------------------------------------- assign value as a CommonType
             computed = value.execute(environ, False)  # <-------------------------------- store the computed value
             environ.update({name.token().value(): computed})  # <------------------- assign it to its binding name
+            defined(name.token().value(), computed)  # <------------------ bump the version, report it to the hooks
             return computed   # <----------------------------------------------------------- return computed value
 
         if head.token().value() == 'def?':
             SE_ASSERT(where, top, 'Expression[execute]: def?: can only use (def?) form at the top of the program')
             TAIL_IS_VALID(tail, 'def?', where,                                 'Expression[execute]: def?: {why}')
             name, value = tail  # <-------------------------------------------------- assign value as a CommonType
-            from_env = environ.get(name.token().value()) if (name.token().value() in environ.keys()) else NotFound
-            computed = value.execute(environ, False) if from_env is NotFound else from_env  # try to find existing
-            environ.update({name.token().value(): computed})  # assign existing/computed value to its binding name
-            return computed   # <----------------------------------------------------------- return computed value
+            from_env = environ.get(name.token().value(), NotFound)  # <---------------------- try to find existing
+            if from_env is not NotFound:
+                return from_env  # <---------------------------------------- if it does exist, just return the value
+            computed = value.execute(environ, False)  # <-------------------------------- otherwise, compute a value
+            found = environ.setdefault(name.token().value(), computed)  # <--- a concurrent (def?) could win a race
+            if found is computed:
+                defined(name.token().value(), computed)  # <--------------- bump the version, report it to the hooks
+            return found
 
         if head.token().value() == 'defn':
             SE_ASSERT(where, top, 'Expression[execute]: defn: can only use (defn) form at the top of the program')
@@ -424,6 +583,7 @@ class Expression(ExpressionType):
 
             handle.x__custom_name__x = name.token().value()  # set the function name to whatever a user decided to
             environ.update({name.token().value(): handle})   # update environment to access defined function later
+            defined(name.token().value(), handle)  # <------------------ bump the version, report it to the hooks
             return handle  # <-------------------------------------------------- return the function handle object
 
         if head.token().value() == 'defn?':
@@ -438,30 +598,97 @@ class Expression(ExpressionType):
                 'defn', where, environ, name.token().value(), parameters, body  # let the shortcut do all the work
             )
 
+            handle.x__custom_name__x = name.token().value()  # set the function name to whatever a user decided to
+            with DEFINITIONS_LOCK:  # <---------------------------- check and define atomically, as (def?) does too
+                if environ.get(name.token().value()):  # <-------- a concurrent (defn?) could have defined it already
+                    return environ.get(name.token().value())
+                environ.update({name.token().value(): handle})  # <----- update environment to access it later
+            defined(name.token().value(), handle)  # <------------------ bump the version, report it to the hooks
+            return handle  # <-------------------------------------------------- return the function handle object
+
+        if head.token().value() == 'async-defn':
+            SE_ASSERT(where, top,   'Expression[execute]: async-defn: can only use async-defn at top of the program')
+            TAIL_IS_VALID(tail, 'async-defn', where,                     'Expression[execute]: async-defn: {why}')
+            name, parameters, *body = tail  # <-------------------- parse named function name, parameters and body
+
+            handle = self._parse_function_and_create_a_handle(
+                'async-defn', where, environ, name.token().value(), parameters, body, is_async=True
+            )
+
             handle.x__custom_name__x = name.token().value()  # set the function name to whatever a user decided to
             environ.update({name.token().value(): handle})   # update environment to access defined function later
+            defined(name.token().value(), handle)  # <------------------ bump the version, report it to the hooks
+            return handle  # <--------------------------------------------- return the coroutine function handle
+
+        if head.token().value() == 'defn-memo':
+            SE_ASSERT(where, top, 'Expression[execute]: defn-memo: can only use defn-memo at the top of the program')
+            TAIL_IS_VALID(tail, 'defn-memo', where,                       'Expression[execute]: defn-memo: {why}')
+            name, parameters, *body = tail  # <-------------------- parse named function name, parameters and body
+
+            handle = self._parse_function_and_create_a_handle(
+                'defn-memo', where, environ, name.token().value(), parameters, body  # let the shortcut do the work
+            )
+
+            handle.x__custom_name__x = name.token().value()  # set the function name to whatever a user decided to
+            handle = memoize(handle)  # <------ wrap function handle with a bounded (LRU, 128 entries) result cache
+            environ.update({name.token().value(): handle})   # update environment to access defined function later
+            defined(name.token().value(), handle)  # <------------------ bump the version, report it to the hooks
+            return handle  # <-------------------------------------------------- return the function handle object
+
+        if head.token().value() == 'deftest':
+            SE_ASSERT(where, top,     'Expression[execute]: deftest: can only use deftest at the top of the program')
+            TAIL_IS_VALID(tail, 'deftest', where,                           'Expression[execute]: deftest: {why}')
+            name, *body = tail  # <---------------------------------- parse test name and body, a test has no args
+
+            handle = self._parse_function_and_create_a_handle(
+                'deftest', where, environ, name.token().value(), Expression([]), body  # let the shortcut do the work
+            )
+
+            handle.x__custom_name__x = name.token().value()  # set the function name to whatever a user decided to
+            handle.x__test__x = where  # <------------------------ `chiakilang test` finds tests by this attribute
+            environ.update({name.token().value(): handle})   # update environment to access defined function later
+            defined(name.token().value(), handle)  # <------------------ bump the version, report it to the hooks
             return handle  # <-------------------------------------------------- return the function handle object
 
+        if head.token().value() == 'is':
+            TAIL_IS_VALID(tail, 'is', where,                                     'Expression[execute]: is: {why}')
+            form, message = tail if len(tail) == 2 else (tail[0], Nil)  # <------------- message is optional one
+            message = message.execute(environ, False)
+            nodes = form.nodes() if isinstance(form, Expression) and not form.is_inline_fn() else []
+            if len(nodes) == 3 and isinstance(nodes[0], Literal) and nodes[0].token().value() == '=':
+                expected, actual = nodes[1].execute(environ, False), nodes[2].execute(environ, False)
+                equal = nodes[0].execute(environ, False)  # <--------------------- it respects user rebinding of `=`
+                same = equal(expected, actual)
+                if same is NotImplemented:  # <- core `=` is __eq__, which does not fall back like == does, so do it
+                    same = expected == actual
+                AE_ASSERT(where, same,
+                          f'{message or "is"}: expected: {wrap(expected)}, got: {wrap(actual)}')
+                return True
+            AE_ASSERT(where, form.execute(environ, False),           f'{message or "is"}: the assertion failed')
+            return True
+
+        if head.token().value() == 'future':
+            TAIL_IS_VALID(tail, 'future', where,                             'Expression[execute]: future: {why}')
+
+            handle = self._parse_function_and_create_a_handle(
+                'future', where, environ, '<future>', Expression([]), tail  # body becomes a function without args
+            )
+
+            handle.x__custom_name__x = '<future>'  # <--------------------- set the function name to the <future>
+            return future_call(handle)  # <---------- compute body in the process pool, (deref) returns the value
+
         if head.token().value() == 'for':
             TAIL_IS_VALID(tail, 'for', where,                                   'Expression[execute]: for: {why}')
             RE_ASSERT(where, get,               'Expression[execute]: for: for-loop requires `core/get` function')
             bindings, body = tail  # <------------------------------------------- parse for-loop bindings and body
-            env: dict = {}  # <--(for some reason this type hint is necessary)----- initialize a local environment
-            env.update(environ)  # <------------------------------------------------ update it with the global one
-            max_length = 0  # <- as we go through all given collections, we need to define maximum number of steps
-            gathered_binding_alias_list = []  # <- go through all the coll element aliases, we need to gather them
+            aliases, collections = [], []  # <----------------- go through all the coll element aliases and colls
             for alias, collection in pairs(bindings.nodes()):  # for each next coll element alias and collection..
-                computed_collection = collection.execute(environ, False)  # we first compute collection from input
-                computed_collection_length = len(computed_collection)  # then store its length to compare bellow |
-                max_length = computed_collection_length if computed_collection_length > max_length else max_length
-                gathered_binding_alias_list.append(alias.token().value())   # then we append the alias to the list
-                env.update({f'$_{alias.token().value()}': collection.execute(environ, False)})  # should be hidden
-            for element_idx in range(max_length):  # for each next index (remember we computed maximum length) ...
+                aliases.append(alias.token().value())  # <--------------------- we append the alias to the list
+                collections.append(collection.execute(environ, False))  # and compute collection from the input
+            for step in steps(collections, get):  # <- lazy collections (generators, files) are not read at once
                 current_collection_element_temporary_env = {}  # create a current collection temporary environment
-                current_collection_element_temporary_env.update(env)  # <------------ update it with the local one
-                for alias in gathered_binding_alias_list:  # for each next alias, remember we have hidden variable
-                    current_collection = env.get(f'$_{alias}')  # get computed collection via that hidden variable
-                    current_collection_element_temporary_env.update({alias: get(current_collection, element_idx)})
+                current_collection_element_temporary_env.update(environ)  # <------- update it with the global one
+                current_collection_element_temporary_env.update(zip(aliases, step))  # <- bind each element alias
                 body.execute(current_collection_element_temporary_env, False)  # <------- and finally compute body
             return None  # <--------------------- behave as imperative loop where there is no return value but nil
 
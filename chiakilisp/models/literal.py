@@ -6,6 +6,7 @@
 # pylint: disable=too-many-return-statements
 # pylint: disable=unnecessary-lambda-assignment
 
+import types
 from functools import partial
 from typing import Any, Callable
 from chiakilisp.proxies.keyword import Keyword  # <------ for Keyword
@@ -15,6 +16,12 @@ from chiakilisp.models.forward import LiteralType  # forward declared
 
 _ASSERT: Callable = get_assertion_closure(NameError)  # for NameError
 
+# A qualified symbol, like random/randint, is split once, when its Literal is built, and each reference site keeps
+# the (module, member) it has resolved last time: while the environment has the same module under that name, and
+# the module still has the same member under the member name, the member is returned right away, skipping all the
+# lookup checks. The module dict is always checked, so a member rebound by (setattr), or by Python 3 code, is seen
+# at once. Only module members are cached, since attributes of the other objects are often computed properties.
+
 
 class NotFound:  # pylint: disable=too-few-public-methods  # its okay
 
@@ -30,12 +37,30 @@ class Literal(LiteralType):
     """
 
     _token: Token
+    _keyword: Keyword or None
+    _name: str or None
+    _qualified: tuple or None
+    _cache: tuple = None  # <----------------------------------------------- (module, member) resolved last time
 
     def __init__(self, token: Token) -> None:
 
         """Initialize Literal instance"""
 
         self._token = token
+        self._keyword = Keyword(token.value()) if token.type() == Token.Keyword else None  # <- interned once
+        self._name = token.value() if token.type() == Token.Identifier else None
+        self._qualified = None
+        name = self._name or ''
+        if not name.startswith('/') and not name.endswith('/') and '/' in name:   # <---- catch that precisely
+            self._qualified = tuple(name.split('/')[:2])  # <---------------- skip over leading garbage, if any
+
+    def __getstate__(self) -> dict:
+
+        """Returns picklable state, the cached module is dropped"""
+
+        state = dict(self.__dict__)
+        state.pop('_cache', None)  # <----------------------------------------------- modules can not be pickled
+        return state
 
     def token(self) -> Token:
 
@@ -55,6 +80,18 @@ class Literal(LiteralType):
 
         """Execute, here, is to return Python value tied to the literal: number, string, boolean, etc ..."""
 
+        if self._name is not None:  # <---------------------- identifiers are the most common ones, so check first
+
+            if self._qualified is not None:
+                return self._member(environment)  # <--------------------- qualified name, like random/randint
+
+            found = environment.get(self._name, NotFound)  # <---------------- name that is not qualified
+
+            if found is NotFound:
+                _ASSERT(self.token().position(), False,                 f"no '{self._name}' symbol in this scope.")
+
+            return found  # <- return found Python 3 value (from the current environment) or raise NameError
+
         if self.token().type() == Token.Nil:
 
             return None
@@ -74,31 +111,31 @@ class Literal(LiteralType):
 
         if self.token().type() == Token.Keyword:
 
-            return Keyword(self.token().value())
+            return self._keyword
 
         if self.token().type() == Token.Boolean:
 
             return self.token().value() == 'true'
 
-        if self.token().type() == Token.Identifier:
-
-            name = self.token().value()  # <------------- because we reference token().value() so many times
-            ASSERT = partial(_ASSERT, self.token().position())  # <---- create the ASSERT() partial function
+    def _member(self, environment: dict) -> Any:
 
-            if not name.startswith('/') and not name.endswith('/') and '/' in name:   # catch that precisely
-                handle_name, member_name, *_ = name.split('/')  # <-----  *_ is to skip over leading garbage
-                handle_object = environment.get(handle_name, NotFound)    # try to get a handle object first
-                ASSERT(handle_object is not NotFound,           f"no '{handle_name}' symbol in this scope.")
-                member_object = getattr(handle_object, member_name, NotFound)   # try to get a member handle
-                ASSERT(member_object is not NotFound,
-                       f'the handle named: \'{handle_name}\' has no such a member named: \'{member_name}\'')
-                return member_object  # <------------------ we return handle member object found by its name
+        """Returns the member the qualified name refers to, cached"""
 
-            found = environment.get(name, NotFound)  # <--- handle case when identifier name isn't qualified
+        handle_name, member_name = self._qualified
+        handle_object = environment.get(handle_name, NotFound)    # <----------- try to get a handle object first
 
-            ASSERT(found is not NotFound,                              f"no '{name}' symbol in this scope.")
+        cache = self._cache
+        if cache is not None and cache[0] is handle_object and vars(handle_object).get(member_name, NotFound) is cache[1]:
+            return cache[1]  # <----------------------------------------- the same module, and the same member there
 
-            return found  # <- return found Python 3 value (from the current environment) or raise NameError
+        ASSERT = partial(_ASSERT, self.token().position())  # <-------------- create the ASSERT() partial function
+        ASSERT(handle_object is not NotFound,                       f"no '{handle_name}' symbol in this scope.")
+        member_object = getattr(handle_object, member_name, NotFound)   # <------------- try to get a member handle
+        ASSERT(member_object is not NotFound,
+               f'the handle named: \'{handle_name}\' has no such a member named: \'{member_name}\'')
+        if isinstance(handle_object, types.ModuleType) and vars(handle_object).get(member_name, NotFound) is member_object:
+            self._cache = (handle_object, member_object)  # <---- not the one returned by the module's __getattr__()
+        return member_object  # <------------------------------ we return handle member object found by its name
 
 
 Nil = Literal(Token(Token.Nil, 'nil', ()))  # predefined Nil Literal; useful for empty defn, fn and let body
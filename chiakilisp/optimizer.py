@@ -0,0 +1,260 @@
+# pylint: disable=line-too-long
+# pylint: disable=protected-access
+# pylint: disable=missing-module-docstring
+# pylint: disable=import-outside-toplevel
+
+import builtins
+from typing import Any
+from chiakilisp.models.token import Token
+from chiakilisp.models.literal import Literal, Nil
+from chiakilisp.models.expression import Expression
+from chiakilisp.constants import hoist, ATOMS
+from chiakilisp.proxies.keyword import Keyword
+from chiakilisp.utils import pairs
+
+# optimize() is an optional pass over the parsed wood (see the --optimize option), it returns the rewritten copy of
+# the wood, and never changes the given one (modules' wood is cached and shared). A call to the known pure function
+# with the constant arguments, like (* 60 60 24), is computed once, here, and the expression keeps the value along
+# with the guards: the functions it has called, by their names. The value is only returned while the environment
+# still has the same functions under those names, so (def + -) or (let (+ -) ...) just make it evaluate the call,
+# as it would without this pass. Only immutable values are kept, as the same one is returned by each evaluation.
+# Branches of (if), (when) and (cond) whose test is the constant literal are pruned, and the test which has been
+# folded into the guarded value picks the branch at the runtime, without evaluating the test; nested (do) blocks
+# are flattened. Threading macros, inline functions, (import) and (require) are left exactly as they have been.
+
+RUNTIME_PURE = ('+', '-', '*', '/', 'mod')
+
+BUILTIN_PURE = ('abs', 'min', 'max', 'round', 'pow', 'str', 'int', 'float', 'bool', 'len', 'ord', 'chr', 'hex', 'oct', 'bin')
+
+CORE_PURE = ('=', '<', '>', '<=', '>=', 'not', 'inc', 'dec', 'odd?', 'even?', 'zero?', 'positive?', 'nil?', 'count')
+
+IMMUTABLE = (int, float, complex, str, bytes, bool, type(None), Keyword)
+
+FUNCTION_FORMS = ('fn', 'async-fn')
+
+NAMED_FUNCTION_FORMS = ('defn', 'defn?', 'defn-memo', 'async-defn')
+
+UNTOUCHED_FORMS = ('->', '->>', 'import', 'require')
+
+
+class Folded:  # pylint: disable=too-few-public-methods  # its okay
+
+    """Value (or the branch) of an expression, and its guards"""
+
+    def __init__(self, guards: tuple, value: Any = None, node: Any = None) -> None:
+
+        self.guards = guards  # <------------------------------------------------------ ((name, function), ...)
+        self.value = value
+        self.node = node  # <------------------------------------- the branch to evaluate, instead of the value
+
+    def holds(self, environ: dict) -> bool:
+
+        """Returns whether the environment has the same functions"""
+
+        for name, function in self.guards:
+            if environ.get(name) is not function:
+                return False
+        return True
+
+
+def _is_core(function: Any, name: str) -> bool:
+
+    """Returns whether it's the function core library has defined"""
+
+    source = getattr(function, 'x__source__x', None)
+    return (getattr(function, 'x__custom_name__x', None) == name
+            and source is not None and source.nodes()[0].token().position()[0] == 'corelib.cl')
+
+
+def pure_functions(environment: dict) -> dict:
+
+    """Returns {name: function} of the pure ones the environment has"""
+
+    from chiakilisp.runtime import RUNTIME  # <-------------------------------------- runtime imports this module
+
+    pure = {name: environment[name] for name in RUNTIME_PURE if environment.get(name) is RUNTIME[name]}
+    pure.update({name: environment[name] for name in BUILTIN_PURE if environment.get(name) is getattr(builtins, name)})
+    pure.update({name: environment[name] for name in CORE_PURE if _is_core(environment.get(name), name)})
+    return pure
+
+
+def _name(node: Any) -> str or None:
+
+    """Returns the name if node is the identifier, None otherwise"""
+
+    if isinstance(node, Literal) and node.token().type() == Token.Identifier:
+        return node.token().value()
+    return None
+
+
+def _static(node: Any) -> tuple:
+
+    """Returns (is known, value, guards) of the node value"""
+
+    if isinstance(node, Literal):
+        if node.token().type() in ATOMS:
+            return True, node.execute({}), ()
+        return False, None, ()
+    if isinstance(node, Expression):
+        if node.constant() is not None and node.constant().immutable:
+            return True, node.constant().template, ()
+        folded = node._folded
+        if folded is not None and folded.node is None:
+            return True, folded.value, folded.guards
+    return False, None, ()
+
+
+def _expression(nodes: list, like: Expression = None) -> Expression:
+
+    """Returns new expression of the nodes, collection literal too"""
+
+    return hoist(Expression(nodes, is_inline_fn=like.is_inline_fn() if like is not None else False))
+
+
+def _identifier(name: str, like: Literal) -> Literal:
+
+    """Returns new identifier, at the same position as the given one"""
+
+    return Literal(Token(Token.Identifier, name, like.token().position()))
+
+
+def _lift(node: Any, head: Literal, top: bool) -> Any:
+
+    """Returns the node, or (do node) for the top one (def stays illegal)"""
+
+    if top and isinstance(node, Expression):
+        return _expression([_identifier('do', head), node])
+    return node
+
+
+def _children(name: str, tail: list, pure: dict) -> list:
+
+    """Returns the tail, where only evaluated nodes are optimized"""
+
+    if name in FUNCTION_FORMS and tail:
+        return tail[:1] + [_walk(node, pure) for node in tail[1:]]
+    if name in NAMED_FUNCTION_FORMS and len(tail) >= 2:
+        return tail[:2] + [_walk(node, pure) for node in tail[2:]]
+    if name in ('def', 'def?', 'deftest') and tail:
+        return tail[:1] + [_walk(node, pure) for node in tail[1:]]
+    if name in ('let', 'for') and tail and isinstance(tail[0], Expression):
+        bindings = []
+        for pair in pairs(tail[0].nodes()):
+            bindings.extend([pair[0]] + [_walk(node, pure) for node in pair[1:]])
+        return [_expression(bindings, tail[0])] + [_walk(node, pure) for node in tail[1:]]
+    if name == 'try' and len(tail) == 2 and isinstance(tail[1], Expression):
+        catch = tail[1].nodes()
+        return [_walk(tail[0], pure), _expression(catch[:3] + [_walk(node, pure) for node in catch[3:]], tail[1])]
+    return [_walk(node, pure) for node in tail]
+
+
+def _do(expression: Expression) -> Expression:
+
+    """Flattens nested (do) blocks, drops unused constant literals"""
+
+    head, *tail = expression.nodes()
+    flat = []
+    for idx, node in enumerate(tail):
+        if isinstance(node, Expression) and not node.is_inline_fn() and node.nodes() and _name(node.nodes()[0]) == 'do':
+            flat.extend(node.nodes()[1:] or ([Nil] if idx == len(tail) - 1 else []))  # <- (do) at the end is nil
+        else:
+            flat.append(node)
+    flat = [node for node in flat[:-1] if not (isinstance(node, Literal) and node.token().type() in ATOMS)] + flat[-1:]
+    return _expression([head] + flat)
+
+
+def _branch(expression: Expression, top: bool) -> Any:
+
+    """Prunes dead branches of (if), (when) and (cond) expressions"""
+
+    head, *tail = expression.nodes()
+    name = _name(head)
+
+    if name == 'cond':
+        if len(tail) % 2:
+            return expression  # <------------------------------------------- let it raise SyntaxError at runtime
+        clauses = []
+        for test, branch in pairs(tail):
+            known, value, guards = _static(test)
+            if known and not guards and not value:
+                continue  # <--------------------------------------------------- the clause is never chosen, drop it
+            if known and not guards:
+                if not clauses:
+                    return _lift(branch, head, top)  # <--------------------------- the first clause is always chosen
+                clauses.extend([test, branch])
+                break  # <------------------------------------------------------- the rest clauses are never reached
+            clauses.extend([test, branch])
+        return _expression([head] + clauses) if clauses else Nil
+
+    if name == 'if' and len(tail) in (2, 3):
+        test, chosen, otherwise = tail if len(tail) == 3 else tail + [Nil]
+    elif name == 'when' and len(tail) >= 2:
+        test, body = tail[0], tail[1:]
+        chosen = body[0] if len(body) == 1 else _do(_expression([_identifier('do', head)] + body))
+        otherwise = Nil
+    else:
+        return expression
+
+    known, value, guards = _static(test)
+    if not known:
+        return expression
+    if not guards:
+        return _lift(chosen if value else otherwise, head, top)
+    expression._folded = Folded(guards, node=chosen if value else otherwise)
+    return expression
+
+
+def _fold(expression: Expression, pure: dict) -> Expression:
+
+    """Computes a call to the pure function with constant arguments"""
+
+    head, *tail = expression.nodes()
+    name = _name(head)
+    function = pure.get(name)
+    if function is None:
+        return expression
+
+    values, guards = [], {name: function}
+    for node in tail:
+        known, value, node_guards = _static(node)
+        if not known:
+            return expression
+        values.append(value)
+        guards.update(node_guards)
+
+    try:
+        value = function(*values)
+    except (Exception,):  # pylint: disable=broad-except  # let it raise at runtime, as it would without this pass
+        return expression
+    if type(value) not in IMMUTABLE:  # pylint: disable=unidiomatic-typecheck  # subclasses may be mutable ones
+        return expression
+
+    expression._folded = Folded(tuple(guards.items()), value=value)
+    return expression
+
+
+def _walk(node: Any, pure: dict, top: bool = False) -> Any:
+
+    """Returns optimized copy of the node, or the node as it is"""
+
+    if not isinstance(node, Expression) or node.is_inline_fn() or not node.nodes():
+        return node
+    head, *tail = node.nodes()
+    name = _name(head)
+    if name in UNTOUCHED_FORMS:
+        return node
+
+    expression = _expression([head] + _children(name, tail, pure), node)
+    if name == 'do':
+        return _do(expression)
+    if name in ('if', 'when', 'cond'):
+        return _branch(expression, top)
+    return _fold(expression, pure)
+
+
+def optimize(nodes: list, environment: dict) -> list:
+
+    """Returns optimized copy of the wood, nodes are not changed"""
+
+    pure = pure_functions(environment)
+    return [_walk(node, pure, True) for node in nodes]
@@ -0,0 +1,385 @@
+# pylint: disable=global-statement
+# pylint: disable=line-too-long
+# pylint: disable=too-few-public-methods
+# pylint: disable=missing-module-docstring
+# pylint: disable=import-outside-toplevel
+
+import os
+import array
+import types
+import importlib
+import threading
+from typing import Any, Callable, List
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from chiakilisp.models.literal import Literal, NotFound
+from chiakilisp.cache import memoize
+
+# User functions are closures over a dict environment, so they can not be pickled. Instead, each function is
+# shipped to a worker process as its source AST (Expression/Literal/Token are plain picklable objects) plus the
+# bindings it has captured: a binding that every fresh environment has (see runtime.remember_core()) is shipped
+# by its name, a module is shipped by its qualified name, and homogeneous numeric lists which are big enough
+# are placed in the shared memory instead of being pickled. A worker rebuilds the function in its own warm one.
+# The multiprocessing is only imported on the first use, as the core library imports this module at startup.
+
+SHARED_MEMORY_THRESHOLD = 1 << 16  # <------------- numeric lists shorter than that are cheaper to simply pickle
+
+CHUNKS_PER_WORKER = 4  # <------------------------------------- (pmap) splits collections into that many chunks
+
+_POOL = None  # <-------------------------------------- ProcessPoolExecutor, it is created on the first use
+_POOL_LOCK = threading.Lock()
+
+_ENVIRONMENT: dict or None = None  # <------------ warm environment, it is only initialized in a worker process
+
+
+class _Reference:
+
+    """A binding that worker has, it will be resolved by the name"""
+
+    def __init__(self, name: str) -> None:
+
+        self.name = name
+
+
+class _Module:
+
+    """A Python 3 module, it will be imported by the worker again"""
+
+    def __init__(self, name: str) -> None:
+
+        self.name = name
+
+
+class _SharedArray:
+
+    """A part of the numeric list that is placed in shared memory"""
+
+    def __init__(self, segment: str, typecode: str, start: int, stop: int) -> None:
+
+        self.segment = segment
+        self.typecode = typecode
+        self.start = start
+        self.stop = stop
+
+    def part(self, start: int, stop: int) -> '_SharedArray':
+
+        """Returns the part of this shared array (same segment)"""
+
+        return _SharedArray(self.segment, self.typecode, self.start + start, self.start + stop)
+
+    def load(self) -> list:
+
+        """Reads values from the shared memory segment to list"""
+
+        from multiprocessing import shared_memory
+
+        segment = shared_memory.SharedMemory(name=self.segment)
+        try:
+            with segment.buf.cast(self.typecode) as view:
+                return view[self.start:self.stop].tolist()
+        finally:
+            segment.close()
+
+
+class _Function:
+
+    """A user function: its source AST and captured bindings"""
+
+    def __init__(self, name: str or None, source, memoize_options: dict or None) -> None:
+
+        self.name = name
+        self.source = source
+        self.captured = {}
+        self.memoize_options = memoize_options  # <--------- if it's not None, function has been memoized
+
+
+def _free_names(source) -> set:
+
+    """Returns the names the function source may refer to"""
+
+    nodes = source.nodes()
+    parameters = set()
+    if (not source.is_inline_fn()
+            and nodes and isinstance(nodes[0], Literal) and nodes[0].token().value() in ('fn', 'async-fn')):
+        parameters = {parameter.token().value() for parameter in nodes[1].nodes()}
+        nodes = nodes[2:]  # <-------------------- skip over 'fn' literal and parameters, only walk the body then
+
+    names = set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if not isinstance(node, Literal):
+            pending.extend(node.nodes())
+            continue
+        if not node.token().is_identifier():
+            continue
+        name = node.token().value()
+        if not name.startswith('/') and not name.endswith('/') and '/' in name:
+            name = name.split('/')[0]  # <-------------- qualified symbol refers to the handle, like `random`
+        names.add(name)
+    return names - parameters
+
+
+def _typecode(values: list) -> str or None:
+
+    """Returns array typecode for homogeneous numeric list"""
+
+    if all(type(value) is int for value in values):  # pylint: disable=unidiomatic-typecheck  # skip bools
+        return 'q'
+    if all(type(value) is float for value in values):  # pylint: disable=unidiomatic-typecheck
+        return 'd'
+    return None
+
+
+class _Packer:
+
+    """Packs values for worker processes, owns shared memory"""
+
+    def __init__(self) -> None:
+
+        import chiakilisp.runtime as runtime  # <-------- runtime imports (indirectly) this module, so import here
+
+        self._core = runtime.ENVIRONMENT.get('__core__', {})
+        self._functions = {}
+        self._segments = []
+
+    def pack(self, value: Any, name: str = None, core: dict = None) -> Any:
+
+        """Returns picklable presentation of the given value"""
+
+        core = self._core if core is None else core
+
+        if name is None and callable(value):
+            name = next((n for n, v in core.items() if v is value), None)  # <- maybe worker already has it
+        if name is not None and core.get(name, NotFound) is value:
+            return _Reference(name)
+
+        if isinstance(value, types.ModuleType):
+            return _Module(value.__name__)
+
+        source = getattr(value, 'x__source__x', None)
+        if source is not None:
+            return self._pack_function(value, source)
+
+        if isinstance(value, list) and len(value) >= SHARED_MEMORY_THRESHOLD:
+            return self._share(value) or value
+
+        return value  # <--------- any other value is pickled as is (and it raises if that can not be done)
+
+    def _pack_function(self, function: Callable, source) -> _Function:
+
+        """Returns picklable presentation of the user function"""
+
+        packed = self._functions.get(id(function))
+        if packed is None:
+            environ = getattr(function, 'x__environ__x', {})
+            core = environ.get('__core__', self._core)
+            packed = self._functions[id(function)] = _Function(getattr(function, 'x__custom_name__x', None),
+                                                               source,
+                                                               getattr(function, 'x__options__x', None))
+            for name in _free_names(source):  # <- already registered above, so recursive functions are fine
+                value = environ.get(name, NotFound)
+                if value is not NotFound:
+                    packed.captured[name] = self.pack(value, name, core)
+        return packed
+
+    def _share(self, values: list) -> _SharedArray or None:
+
+        """Places numeric list in shared memory, if possible"""
+
+        from multiprocessing import shared_memory
+
+        typecode = _typecode(values)
+        if typecode is None:
+            return None
+        try:
+            buffer = array.array(typecode, values)
+        except OverflowError:
+            return None  # <--------------------------------- int is too large for int64, so just pickle it
+        size = len(buffer) * buffer.itemsize
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        self._segments.append(segment)
+        segment.buf[:size] = memoryview(buffer).cast('B')
+        return _SharedArray(segment.name, typecode, 0, len(buffer))
+
+    def release(self) -> None:
+
+        """Releases all the shared memory segments it owns"""
+
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+
+def _unpack(packed: Any, functions: dict) -> Any:
+
+    """Turns packed value back to the value (in a worker)"""
+
+    if isinstance(packed, _Reference):
+        return _ENVIRONMENT[packed.name]
+
+    if isinstance(packed, _Module):
+        return importlib.import_module(packed.name)
+
+    if isinstance(packed, _SharedArray):
+        return packed.load()
+
+    if isinstance(packed, _Function):
+        function = functions.get(id(packed))
+        if function is None:
+            environ = dict(_ENVIRONMENT)
+            function = packed.source.execute(environ, False)
+            if packed.name:
+                function.x__custom_name__x = packed.name
+            if packed.memoize_options is not None:
+                function = memoize(function, packed.memoize_options)  # <- worker has its own separate cache
+            functions[id(packed)] = function
+            for name, value in packed.captured.items():  # populate after, the function reads it on each call
+                environ[name] = _unpack(value, functions)
+        return function
+
+    return packed
+
+
+def _warm_up() -> None:
+
+    """Initializes a worker process: loads the core library"""
+
+    global _ENVIRONMENT
+
+    import chiakilisp.runtime as runtime  # <-------- runtime imports (indirectly) this module, so import here
+    from multiprocessing import resource_tracker
+
+    # Worker only attaches to the segments that parent process owns and unlinks, so do not let the worker track
+    # them too, otherwise resource tracker reports them as leaked ones (see https://bugs.python.org/issue39959)
+
+    register, unregister = resource_tracker.register, resource_tracker.unregister
+    resource_tracker.register = lambda name, rtype: rtype == 'shared_memory' or register(name, rtype)
+    resource_tracker.unregister = lambda name, rtype: rtype == 'shared_memory' or unregister(name, rtype)
+
+    _ENVIRONMENT = runtime.Runtime().environment
+
+
+def _call(function: _Function) -> Any:
+
+    """Calls shipped function without arguments (in a worker)"""
+
+    return _unpack(function, {})()
+
+
+def _call_chunk(function: _Function, columns: List[Any]) -> list:
+
+    """Maps shipped function over shipped chunk (in a worker)"""
+
+    function = _unpack(function, {})
+    return [function(*arguments) for arguments in zip(*(_unpack(column, {}) for column in columns))]
+
+
+def pool_size() -> int:
+
+    """Returns the number of worker processes in the pool"""
+
+    return int(os.environ.get('CHIAKILISP_POOL_SIZE') or os.cpu_count() or 1)
+
+
+def pool():
+
+    """Returns the process pool, creates it on the first use"""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(pool_size(), initializer=_warm_up)
+        return _POOL
+
+
+def shutdown() -> None:
+
+    """Shuts the process pool down, it is re-created on demand"""
+
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown()
+        _POOL = None
+
+
+def pmap(function: Callable, *collections) -> list:
+
+    """Behaves the same as map, but calls function in the pool"""
+
+    collections = [list(collection) for collection in collections]
+    if _ENVIRONMENT is not None or not collections:
+        return list(map(function, *collections))  # <--- do not spawn a pool from a worker, just map in place
+
+    length = min(map(len, collections))
+    chunk = max(1, -(-length // (pool_size() * CHUNKS_PER_WORKER)))
+
+    packer = _Packer()
+    futures = []
+    try:
+        packed_function = packer.pack(function)
+        packed_columns = [packer.pack(collection) for collection in collections]
+        for start in range(0, length, chunk):
+            stop = min(start + chunk, length)
+            futures.append(pool().submit(_call_chunk, packed_function, [
+                column.part(start, stop) if isinstance(column, _SharedArray) else column[start:stop]
+                for column in packed_columns]))
+        return [result for future in futures for result in future.result()]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        packer.release()
+
+
+def future_call(function: Callable) -> Future:
+
+    """Calls function without arguments in the pool, returns future"""
+
+    if _ENVIRONMENT is not None:
+        future = Future()  # <-------------- do not spawn a pool from a worker, just compute the value in place
+        try:
+            future.set_result(function())
+        except Exception as exception:  # pylint: disable=broad-except  # it will be re-raised by (deref)
+            future.set_exception(exception)
+        return future
+
+    packer = _Packer()
+    try:
+        future = pool().submit(_call, packer.pack(function))
+    except BaseException:
+        packer.release()
+        raise
+    future.add_done_callback(lambda _: packer.release())
+    return future
+
+
+def pcalls(*functions: Callable) -> list:
+
+    """Calls each function in the pool, returns list of results"""
+
+    return [deref(future) for future in [future_call(function) for function in functions]]
+
+
+def deref(reference: Any, timeout_ms: int = None, timeout_value: Any = None) -> Any:
+
+    """Returns the value of the reference: future, atom and so on"""
+
+    if callable(getattr(reference, 'deref', None)):
+        return reference.deref()  # <---------------------- atoms (and other references) know their values
+
+    if isinstance(reference, Future):
+        if timeout_ms is None:
+            return reference.result()
+        try:
+            return reference.result(timeout_ms / 1000)
+        except FutureTimeoutError:
+            return timeout_value
+
+    raise TypeError(f"deref: can not dereference '{reference.__class__.__name__}' instance")
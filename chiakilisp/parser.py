@@ -6,6 +6,7 @@ from typing import List
 from chiakilisp.models.token import Token
 from chiakilisp.models.literal import Literal
 from chiakilisp.models.expression import Expression
+from chiakilisp.constants import hoist
 
 
 Node = Literal or Expression  # define the type for one node
@@ -39,58 +40,24 @@ class Parser:
         self._wood = read(self._tokens)  # utilizes dedicated read() func
 
 
-def find_nearest_closing_paren(filtered: list, visited: list) -> tuple:
-
-    """This function takes a token collection list and finds the nearest closing paren position"""
-
-    _all = tuple(filter(lambda p: p not in visited and p[1].type() == Token.ClosingParen, filtered))
-    if not _all:
-        raise SyntaxError('Parser::find_nearest_closing_paren() there is no nearest ClosingParen token')
-    return _all[0]
-
-
-def find_nearest_opening_paren(filtered: list, visited: list) -> tuple:
-
-    """This function takes a token collection list and finds the nearest opening paren position"""
-
-    _all = tuple(filter(lambda p: p not in visited and p[1].type() == Token.OpeningParen, filtered))
-    if not _all:
-        raise SyntaxError('Parser::find_nearest_closing_paren() there is no nearest OpeningParen token')
-    return _all[0]
-
-
-def boundary(lst: List[Token]) -> int:
+def boundary(lst: List[Token], start: int = 0) -> int:
 
     """This function takes a token collection listing and finds actual boundary to starting expression"""
 
-    assert len(lst) >= 2 and lst[0].type() == Token.OpeningParen  # non-empty tokens list, first should match '('.
-
-    filtered: list  # for some reason, pylint confuses about filtered type assuming it's the same type as the list
-
-    filtered = list(filter(lambda _pr: _pr[1].type() in [Token.OpeningParen, Token.ClosingParen], enumerate(lst)))
-
-    starting_opening_paren = filtered[0]
-    starting_opening_paren_position = starting_opening_paren[0]
-
-    visited = []  # define list of paren tokens we've already visited
-
-    while True:
-        if not filtered:
-            return -1  # return '-1' if there are no more paren tokens
-
-        nearest_closing_paren = find_nearest_closing_paren(filtered, visited)
-        nearest_closing_paren_position = nearest_closing_paren[0]
-
-        reversed_filtered = list(reversed(filtered[:filtered.index(nearest_closing_paren) + 1]))
+    assert len(lst) - start >= 2 and lst[start].type() == Token.OpeningParen  # first token should match the '('.
 
-        nearest_opening_paren_to_that_closing = find_nearest_opening_paren(reversed_filtered, visited)
-        nearest_opening_paren_to_that_closing_position = nearest_opening_paren_to_that_closing[0]
+    depth = 0  # <-------------- number of the parens opened, but not closed yet, so one pass is enough to find it
 
-        if nearest_opening_paren_to_that_closing_position == starting_opening_paren_position:
-            return nearest_closing_paren_position  # if matches exact same position, its valid expression boundary
+    for idx in range(start, len(lst)):
+        token_type = lst[idx].type()
+        if token_type == Token.OpeningParen:
+            depth += 1
+        elif token_type == Token.ClosingParen:
+            depth -= 1
+            if not depth:
+                return idx  # <---------------------------------- if it closes starting paren, its the boundary
 
-        visited.append(nearest_closing_paren)
-        visited.append(nearest_opening_paren_to_that_closing)  # then, append these two tokens to the visited list
+    raise SyntaxError('Parser::boundary() there is no ClosingParen token for the OpeningParen one')
 
 
 def read(tokens: List[Token]) -> Nodes:
@@ -108,9 +75,9 @@ def read(tokens: List[Token]) -> Nodes:
     while idx < len(tokens):
         current_token = tokens[idx]
         if current_token.type() == Token.OpeningParen:  # <- if read() function has encountered OpeningParen token
-            left_boundary, right_boundary = idx + 1, boundary(tokens[idx:]) + idx   # define expression boundaries
+            left_boundary, right_boundary = idx + 1, boundary(tokens, idx)  # <------ define expression boundaries
             if not is_commented:  # <----------------------- if current expression is not intended to be commented
-                nodes.append(Expression(read(tokens[left_boundary:right_boundary]),    is_inline_fn=is_inline_fn))
+                nodes.append(hoist(Expression(read(tokens[left_boundary:right_boundary]), is_inline_fn=is_inline_fn)))
             is_inline_fn = False  # <--------------------------------------- reset (previously set) inline fm flag
             is_commented = False  # <--------------------------------------- reset (previously set) commented flag
             idx = right_boundary + 1  # <--- and let the read() function to advance to the next one token instance
@@ -0,0 +1,146 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import time
+import threading
+from typing import Any, IO
+from chiakilisp import hooks
+from chiakilisp.models import expression
+
+# cProfile can not tell one ChiakiLisp function from another: each of them is the same `handle` closure running the
+# same Expression.execute() method. So while the profiler is on, it's an enter/exit hook (see chiakilisp.hooks) and
+# it keeps the (function name, position of its definition) call stack for each thread (top-level forms are frames
+# too), so the calls, self and cumulative time are attributed to ChiakiLisp functions and to the `.cl` positions.
+
+# Collapsed stacks file has one 'outer;inner;innermost microseconds' line per stack, like stackcollapse-*.pl tools
+# produce, so flamegraph.pl, speedscope or inferno can render it as a flame graph (time spent in the innermost).
+
+
+def label(key: tuple) -> str:
+
+    """Returns 'name (file:line:column)' label of the profiled key"""
+
+    name, where = key
+    return f'{name} ({":".join(map(str, where))})'
+
+
+def position(node: Any) -> tuple:
+
+    """Returns position of the top-level form (its first token)"""
+
+    while isinstance(node, expression.Expression):
+        node = node.nodes()[0]
+    return node.token().position()
+
+
+class Profiler:
+
+    """Deterministic profiler for the ChiakiLisp function calls"""
+
+    def __init__(self) -> None:
+
+        self._lock = threading.Lock()
+        self._local = threading.local()  # <------------------------ each thread has its own call stack and path
+        self._stats = {}  # <-------------------------------------------- key -> [calls, self time, cumulative]
+        self._stacks = {}  # <---------------------------------------- 'outer;inner' path -> self time, seconds
+
+    def start(self) -> 'Profiler':
+
+        """Makes function handles report to this profiler"""
+
+        hooks.add(hooks.ENTER, self._entered)
+        hooks.add(hooks.EXIT, self._exited)
+        return self
+
+    def stop(self) -> None:
+
+        """Makes function handles stop reporting to the profiler"""
+
+        hooks.remove(hooks.ENTER, self._entered)
+        hooks.remove(hooks.EXIT, self._exited)
+
+    def _entered(self, name: str, where: tuple, _: tuple) -> None:
+
+        """The enter hook: a function is called"""
+
+        self.enter(name, where)
+
+    def _exited(self, *_) -> None:
+
+        """The exit hook: a function has returned"""
+
+        self.leave()
+
+    def _thread(self) -> tuple:
+
+        """Returns ([key, path, started, children time], active)"""
+
+        if not hasattr(self._local, 'frames'):
+            self._local.frames, self._local.active = [], {}
+        return self._local.frames, self._local.active  # <------------------------- active is key -> its frames on the stack
+
+    def enter(self, name: str, where: tuple) -> None:
+
+        """Pushes a frame, when a function (or a form) is entered"""
+
+        frames, active = self._thread()
+        key = (name, where)
+        frame = label(key).replace(';', ':')  # <--------------------------------- ';' separates stack frames
+        path = f'{frames[-1][1]};{frame}' if frames else frame
+        active[key] = active.get(key, 0) + 1
+        frames.append([key, path, time.perf_counter(), 0.0])
+
+    def leave(self) -> None:
+
+        """Pops a frame, when a function (or a form) has returned"""
+
+        frames, active = self._thread()
+        key, path, started, children = frames.pop()
+        elapsed = time.perf_counter() - started
+        if frames:
+            frames[-1][3] += elapsed
+        active[key] -= 1
+        recursive = active[key] > 0  # <-------------- cumulative time of the recursive calls is only counted once
+        with self._lock:
+            stats = self._stats.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed - children
+            if not recursive:
+                stats[2] += elapsed
+            self._stacks[path] = self._stacks.get(path, 0.0) + elapsed - children
+
+    def execute(self, node: Any, environment: dict) -> Any:
+
+        """Executes top-level form, it becomes the outermost frame"""
+
+        self.enter('<top-level form>', position(node))
+        try:
+            return node.execute(environment)
+        finally:
+            self.leave()
+
+    def stats(self) -> list:
+
+        """Returns [(key, calls, self, cumulative)], slowest first"""
+
+        with self._lock:
+            rows = [(key, calls, own, cumulative) for key, (calls, own, cumulative) in self._stats.items()]
+        return sorted(rows, key=lambda row: (row[3], row[2]), reverse=True)
+
+    def report(self, writer: IO, limit: int = None) -> None:
+
+        """Writes text report, sorted by the cumulative time"""
+
+        rows = self.stats()
+        writer.write(f'{"calls":>10} {"self, s":>12} {"cumulative, s":>14}  function (defined at)\n')
+        for key, calls, own, cumulative in rows[:limit]:
+            writer.write(f'{calls:>10} {own:>12.6f} {cumulative:>14.6f}  {label(key)}\n')
+
+    def collapsed(self, writer: IO) -> None:
+
+        """Writes collapsed stacks, weighted by the microseconds"""
+
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        for path, own in stacks:
+            writer.write(f'{path} {round(own * 1_000_000)}\n')
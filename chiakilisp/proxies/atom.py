@@ -0,0 +1,86 @@
+"""The Atom proxy class implementation"""
+
+import threading
+from typing import Any, Callable
+from chiakilisp.utils import wrap
+
+
+class Atom:
+
+    """Atom Proxy Class, a reference that can be shared between threads"""
+
+    # swap() does not hold the lock while calling a function: it computes new
+    # value, then it commits the value only if the atom has not been changed,
+    # otherwise it retries, so the function may be called more than once; the
+    # lock just makes compare_and_set() atomic, as there is no hardware CAS.
+
+    def __init__(self, value: Any) -> None:
+
+        self._value = value
+        self._lock = threading.Lock()
+
+    def deref(self) -> Any:
+
+        """Returns the current value"""
+
+        return self._value
+
+    def compare_and_set(self, old: Any, new: Any) -> bool:
+
+        """Sets new value only if the current one is identical to old"""
+
+        with self._lock:
+            if self._value is not old:
+                return False
+            self._value = new
+            return True
+
+    def swap(self, function: Callable, *arguments) -> Any:
+
+        """Sets value to (function value & arguments), returns it"""
+
+        while True:
+            old = self._value
+            new = function(old, *arguments)
+            if self.compare_and_set(old, new):
+                return new
+
+    def reset(self, new: Any) -> Any:
+
+        """Sets value to new without regard to the current value"""
+
+        with self._lock:
+            self._value = new
+            return new
+
+    def __str__(self) -> str:
+
+        return f'#<Atom {wrap(self._value)}>'
+
+
+def is_atom(something: Any) -> bool:
+
+    """Returns whether something is an atom"""
+
+    return isinstance(something, Atom)
+
+
+def swap(reference: Atom, function: Callable, *arguments) -> Any:
+
+    """A function-shaped shortcut for the Atom.swap()"""
+
+    return reference.swap(function, *arguments)
+
+
+def reset(reference: Atom, new: Any) -> Any:
+
+    """A function-shaped shortcut for the Atom.reset()"""
+
+    return reference.reset(new)
+
+
+def compare_and_set(reference: Atom, old: Any, new: Any) -> bool:
+
+    """A function-shaped shortcut for the Atom.compare_and_set()"""
+
+    return reference.compare_and_set(old, new)
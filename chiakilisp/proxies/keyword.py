@@ -1,5 +1,14 @@
 """The Keyword proxy class implementation"""
 
+import weakref
+
+# Keywords are interned: Keyword(':a') returns the same object each time, so the str hash is computed once for it
+# (str caches its hash), and comparing two keywords compares their identities first, like str does for interned
+# strings. The table holds keywords weakly, so keywordized data (EDN, CSV headers) does not leak. A keyword still
+# equals to (and hashes as) its name string, so {:a 1} and {"a" 1} keep being interchangeable for (get).
+
+_INTERNED = weakref.WeakValueDictionary()
+
 
 class Keyword(str):
 
@@ -7,4 +16,21 @@ class Keyword(str):
 
     def __new__(cls, raw: str) -> 'Keyword':
 
-        return super().__new__(cls, raw[1:])
+        keyword = _INTERNED.get(raw[1:])
+        if keyword is None:
+            keyword = _INTERNED.setdefault(raw[1:], super().__new__(cls, raw[1:]))  # another thread may win
+        return keyword
+
+    def __getnewargs__(self) -> tuple:
+
+        # pickle and deepcopy call __new__() with these arguments, so give back the colon __new__() strips off
+
+        return (f':{self}',)
+
+    def __copy__(self) -> 'Keyword':
+
+        return self  # <--------------------------------------------------------- keywords are immutable and interned
+
+    def __deepcopy__(self, _: dict) -> 'Keyword':
+
+        return self  # <------------------------------------------------- so threading macros do not copy them over
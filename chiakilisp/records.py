@@ -0,0 +1,91 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+
+import csv
+import json
+from itertools import chain, islice
+from typing import Any, Generator, Iterable, Iterator
+from chiakilisp.proxies.keyword import Keyword
+
+# Readers are generators: a file is read line by line through the buffer of open(), and only the current record
+# (or the current batch) is kept in memory, so gigabyte-sized logs can be processed by (for), (map), (filter) and
+# (reduce) in a constant memory. The file is closed as soon as the last record is read (or the reader is dropped).
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def _batched(records: Iterator, batch_size: int or None) -> Iterator:
+
+    """Returns records as is, or lists of batch_size records"""
+
+    if batch_size is None:
+        return records
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError('records: batch size should be a positive integer')
+    return iter(lambda: list(islice(records, batch_size)), [])
+
+
+def _jsonable(value: Any) -> Any:
+
+    """Returns JSON-serializable presentation of a set"""
+
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'write-jsonl: {type(value).__name__} value can not be written as JSON')
+
+
+def read_jsonl(path: str, batch_size: int = None) -> Generator:
+
+    """Yields values from the JSON lines file, blank lines skipped"""
+
+    with open(path, 'r', encoding='utf-8', buffering=DEFAULT_BUFFER_SIZE) as reader:
+        yield from _batched((json.loads(line) for line in reader if not line.isspace()), batch_size)
+
+
+def read_csv(path: str, batch_size: int = None, header: bool = True, delimiter: str = ',') -> Generator:
+
+    """Yields {:column value} maps (or row lists) from CSV file"""
+
+    with open(path, 'r', encoding='utf-8', newline='', buffering=DEFAULT_BUFFER_SIZE) as reader:
+        rows = csv.reader(reader, delimiter=delimiter)
+        if header:
+            columns = [Keyword(f':{column}') for column in next(rows, ())]
+            rows = (dict(zip(columns, row)) for row in rows)
+        yield from _batched(rows, batch_size)
+
+
+def write_jsonl(path: str, records: Iterable, append: bool = False) -> int:
+
+    """Writes values to the file, one per line, returns the count"""
+
+    count = 0
+    with open(path, 'a' if append else 'w', encoding='utf-8', buffering=DEFAULT_BUFFER_SIZE) as writer:
+        for record in records:
+            writer.write(json.dumps(record, ensure_ascii=False, default=_jsonable))
+            writer.write('\n')
+            count += 1
+    return count
+
+
+def write_csv(path: str, records: Iterable, columns: list = None, append: bool = False, delimiter: str = ',') -> int:
+
+    """Writes maps (or row lists) to CSV file, returns the count"""
+
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0
+
+    count = 0
+    with open(path, 'a' if append else 'w', encoding='utf-8', newline='', buffering=DEFAULT_BUFFER_SIZE) as writer:
+        if isinstance(first, dict):
+            columns = list(first.keys()) if columns is None else columns
+            rows = csv.DictWriter(writer, columns, delimiter=delimiter)
+            if writer.tell() == 0:
+                rows.writeheader()  # <------------------------- a file which is appended to already has a header
+        else:
+            rows = csv.writer(writer, delimiter=delimiter)
+        for record in chain((first,), records):
+            rows.writerow(record)
+            count += 1
+    return count
@@ -0,0 +1,248 @@
+# pylint: disable=line-too-long
+# pylint: disable=global-statement
+# pylint: disable=too-few-public-methods
+# pylint: disable=missing-module-docstring
+# pylint: disable=import-outside-toplevel
+
+import os
+import types
+import hashlib
+import threading
+from typing import Callable, List
+from concurrent.futures import wait, FIRST_COMPLETED
+from chiakilisp.models.literal import Literal
+from chiakilisp.parallel import pool_size
+
+# The registry plays the role of sys.modules for ChiakiLisp modules: (require) returns the module loaded already,
+# unless its file has been changed (its mtime and size are checked on each (require), and only when they differ,
+# the contents hash is compared too), or any module it has required has been reloaded since, so the dependents of
+# the changed module see its new version. Modules are loaded under the lock, so that every module is loaded once.
+
+# Before a module is loaded, its top-level (require)s are scanned, and the modules it requires (and the ones they
+# require, and so on) which are not loaded yet are lexed and parsed concurrently, in a pool of worker processes, as
+# soon as the module which requires them is parsed; so the parsing takes as long as the longest dependency chain,
+# not as long as all the modules. Modules are still executed one by one, in the dependency order, by (require)s.
+# A lone module to parse (with nothing else in flight) is parsed in this process: shipping it would take longer.
+
+MODULE_EXTENSION = '.cl'
+
+_POOL = None  # <------------------------------------------------- ProcessPoolExecutor, created on the first use
+_POOL_LOCK = threading.Lock()
+
+
+class _Parsed:
+
+    """A parsed module: its file stats, contents hash, and AST"""
+
+    def __init__(self, mtime: int, size: int, digest: str, nodes: list) -> None:
+
+        self.mtime, self.size = mtime, size
+        self.digest = digest
+        self.nodes = nodes
+
+
+def _parse(path: str, parse: Callable[[str, str], list]) -> _Parsed:
+
+    """Reads and parses the module (maybe, in a worker process)"""
+
+    stat = os.stat(path)
+    with open(path, 'r', encoding='utf-8') as reader:
+        source_code = reader.read()
+    return _Parsed(stat.st_mtime_ns,
+                   stat.st_size,
+                   hashlib.sha256(source_code.encode('utf-8')).hexdigest(),
+                   parse(source_code, os.path.basename(path)))
+
+
+def _parser_pool():
+
+    """Returns parser process pool, it's created on the first use"""
+
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            from concurrent.futures import ProcessPoolExecutor
+            _POOL = ProcessPoolExecutor(pool_size())  # <----------- parsing does not need the core, so no warm up
+        return _POOL
+
+
+def shutdown() -> None:
+
+    """Shuts the parser pool down, it is re-created on demand"""
+
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown()
+        _POOL = None
+
+
+def _required(nodes: list) -> List[str]:
+
+    """Returns names of the modules required by top-level forms"""
+
+    names = []
+    for node in nodes:
+        if isinstance(node, Literal):
+            continue
+        children = node.nodes()
+        if (len(children) == 2
+                and isinstance(children[0], Literal) and children[0].token().value() == 'require'
+                and isinstance(children[1], Literal)):
+            names.append(children[1].token().value())
+    return names
+
+
+class _Entry:
+
+    """A loaded module, its file stats and required modules"""
+
+    def __init__(self, module: types.ModuleType, mtime: int, size: int, digest: str) -> None:
+
+        self.module = module
+        self.mtime, self.size = mtime, size
+        self.digest = digest
+        self.dependencies = []  # <------------------------------------ (path, module) pairs the module required
+
+
+class ModuleRegistry:
+
+    """Loaded ChiakiLisp modules by their resolved file path"""
+
+    search_path: List[str]
+
+    def __init__(self, parse: Callable[[str, str], list], search_path: List[str] = None) -> None:
+
+        self.search_path = ['.'] if search_path is None else search_path
+        self._parse = parse
+        self._parsed = {}  # <--------------------------------------------- modules parsed ahead, by their paths
+        self._entries = {}
+        self._loading = []  # <------------------------------------------------ entries which are being loaded
+        self._visiting = []  # <------------------------------------ paths which are being checked or loaded
+        self._lock = threading.RLock()
+
+    def resolve(self, name: str) -> str:
+
+        """Returns the resolved path of the module, by its name"""
+
+        path = name if name.endswith(MODULE_EXTENSION) else name + MODULE_EXTENSION
+        candidates = [path] if os.path.isabs(path) else [os.path.join(directory, path) for directory in self.search_path]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return os.path.realpath(candidate)
+        raise FileNotFoundError(f"require: there is no '{path}' module in: {', '.join(self.search_path)}")
+
+    def require(self, name: str, load: Callable[[str, list], types.ModuleType]) -> types.ModuleType:
+
+        """Returns the module; calls load(path, nodes) if needed"""
+
+        with self._lock:
+            path = self.resolve(name)
+            module = self._get(path, load)
+            if self._loading:
+                self._loading[-1].dependencies.append((path, module))
+            return module
+
+    def modules(self) -> dict:
+
+        """Returns {path: module} of all the loaded modules"""
+
+        with self._lock:
+            return {path: entry.module for path, entry in self._entries.items()}
+
+    def _get(self, path: str, load: Callable[[str, list], types.ModuleType]) -> types.ModuleType:
+
+        """Returns a fresh module for the path, (re)loading it"""
+
+        if path in self._visiting:
+            cycle = ' -> '.join(self._visiting[self._visiting.index(path):] + [path])
+            raise ImportError(f'require: circular dependency: {cycle}')
+
+        self._visiting.append(path)
+        try:
+            return self._fresh(path, load)
+        finally:
+            self._visiting.pop()
+
+    def _fresh(self, path: str, load: Callable[[str, list], types.ModuleType]) -> types.ModuleType:
+
+        """Returns cached module, if it's still fresh, or loads it"""
+
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        if entry is not None and (entry.mtime, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            with open(path, 'r', encoding='utf-8') as reader:
+                source_code = reader.read()
+            if hashlib.sha256(source_code.encode('utf-8')).hexdigest() == entry.digest:
+                entry.mtime, entry.size = stat.st_mtime_ns, stat.st_size  # <------- it's touched, not changed
+            else:
+                entry = None
+        if entry is not None and all(self._get(dependency, load) is module for dependency, module in entry.dependencies):
+            return entry.module
+
+        parsed = self._prefetch(path)
+        entry = _Entry(None, parsed.mtime, parsed.size, parsed.digest)
+        self._loading.append(entry)
+        try:
+            entry.module = load(path, parsed.nodes)
+        finally:
+            self._loading.pop()
+        self._entries[path] = entry
+        return entry.module
+
+    def _stale(self, path: str) -> bool:
+
+        """Returns whether module has not been loaded, or it changed"""
+
+        entry = self._entries.get(path)
+        if entry is None:
+            return True
+        stat = os.stat(path)
+        return (entry.mtime, entry.size) != (stat.st_mtime_ns, stat.st_size)
+
+    def _prefetch(self, path: str) -> _Parsed:
+
+        """Parses module and (concurrently) modules it requires"""
+
+        parsed = self._parsed.pop(path, None)
+        stat = os.stat(path)
+        if parsed is None or (parsed.mtime, parsed.size) != (stat.st_mtime_ns, stat.st_size):
+            parsed = _parse(path, self._parse)  # <--------- it's needed right now, so it is parsed right here
+
+        if pool_size() < 2:
+            return parsed  # <------------------ there is only one CPU, so each module is parsed when required
+
+        futures = {}
+        pending = [parsed]
+        while pending or futures:
+            wanted = []
+            for module in pending:
+                for name in _required(module.nodes):
+                    try:
+                        dependency = self.resolve(name)
+                    except FileNotFoundError:
+                        continue  # <----------------------------------- (require) raises it with a position
+                    if (dependency in self._parsed or dependency in futures.values() or dependency in wanted
+                            or dependency in self._visiting or not self._stale(dependency)):
+                        continue
+                    wanted.append(dependency)
+            pending = []
+            if len(wanted) == 1 and not futures:  # <- nothing to parse along with it, shipping it takes longer
+                try:
+                    self._parsed[wanted[0]] = _parse(wanted[0], self._parse)
+                    pending.append(self._parsed[wanted[0]])
+                except (Exception,):  # pylint: disable=broad-except  # <- it is raised again, when required
+                    pass
+                continue
+            executor = _parser_pool() if wanted else None
+            for dependency in wanted:
+                futures[executor.submit(_parse, dependency, self._parse)] = dependency
+            done, _ = wait(tuple(futures), return_when=FIRST_COMPLETED) if futures else ((), ())
+            for future in done:
+                dependency = futures.pop(future)
+                if future.exception() is None:  # <---------- a broken module is parsed again when required,
+                    self._parsed[dependency] = future.result()  # so the error is raised at the right time
+                    pending.append(future.result())
+        return parsed
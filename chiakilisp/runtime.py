@@ -1,21 +1,31 @@
 # pylint: disable=line-too-long
 # pylint: disable=missing-module-docstring
 
+import os
+import types
+import builtins
+import importlib.util
+from typing import Any
 from functools import reduce
 import hashedcolls  # <---- to use hashed dict and hashed list
 from chiakilisp.utils import pprint  # our lovely custom print
+from chiakilisp.lexer import Lexer  # to load the core library
+from chiakilisp.parser import Parser  # to load core library
+from chiakilisp import image  # <--- to load core library fast
+from chiakilisp import constants  # collection literal builders
+from chiakilisp import optimizer  # <--- optional optimizer pass
+from chiakilisp.registry import ModuleRegistry  # for (require)
 
-ENVIRONMENT = {
+RUNTIME = {
     '+': lambda *args: reduce(lambda acc, cur: acc+cur,  args),
     '*': lambda *args: reduce(lambda acc, cur: acc*cur,  args),
     '/': lambda *args: reduce(lambda acc, cur: acc/cur,  args),
     '-': lambda *args: reduce(lambda acc, cur: acc-cur,  args),
     'mod': lambda *args: reduce(lambda ac, cr: ac % cr,  args),
-    'setty': lambda *args: set(args),       # <------  set cast
-    'listy': lambda *args: list(args),      # <------ list cast
-    'dicty': lambda *args: {args[idx]: args[idx+1]  # dict cast
-                            for idx in range(0, len(args), 2)},
-    'tuply': lambda *args: tuple(args),     # <----- tuple cast
+    'setty': constants.setty,               # <------  set cast
+    'listy': constants.listy,               # <------ list cast
+    'dicty': constants.dicty,               # <------ dict cast
+    'tuply': constants.tuply,               # <----- tuple cast
     'hashed-list': hashedcolls.HashedList,  # <---- embed later
     'hashed-dict': hashedcolls.HashedDict,  # <---- embed later
     'prn': pprint,
@@ -26,3 +36,214 @@ ENVIRONMENT = {
     'apply': lambda fn, args: fn(*args),  # built-in apply func
     '...': Ellipsis  # make it possible to write '...' for user
 }
+
+ENVIRONMENT = dict(RUNTIME)  # <- global one, RUNTIME is intact
+
+SEARCH_PATH_VARIABLE = 'CHIAKILISP_PATH'  # <- for (require)s
+
+# Builtins below are proven to cause bugs when proxied, or they
+# are just useless: `__build_class__` - as there is `type`, and
+# `__debug__` - as there is `running-in-debug-mode?` proxy var.
+
+HIDDEN_BUILTINS = ['__import__', '__loader__', '__name__',
+                   '__package__', '__spec__', '__doc__',
+                   '__debug__', '__build_class__']
+
+
+def proxy_builtins(environment: dict) -> None:
+
+    """Proxies allowed Python 3 builtins to the environment"""
+
+    environment.update({
+        name: getattr(builtins, name)
+        for name in dir(builtins) if name not in HIDDEN_BUILTINS})
+
+    environment['running-in-debug-mode?'] = __debug__  # a proxy
+
+
+def core_source_code() -> str:
+
+    """Returns ChiakiLisp core library source code"""
+
+    path = os.path.join(os.path.dirname(__file__), 'corelib', 'core.cl')
+    if os.path.exists(path):  # <- it's faster than pkgutil
+        with open(path, 'r', encoding='utf-8') as reader:
+            return reader.read()
+    import pkgutil  # pylint: disable=import-outside-toplevel
+    return pkgutil.get_data('chiakilisp',
+                            'corelib/core.cl').decode('utf-8')
+
+
+def load_core(environment: dict, images: str = None) -> None:
+
+    """Loads ChiakiLisp core library into the environment"""
+
+    # When 'images' directory is given, the parsed core library
+    # is loaded from (or saved to) the image, see chiakilisp.image
+
+    source_code = core_source_code()
+    path = image.image_path(images, source_code) if images else None
+    nodes = image.load(path) if path else None
+    if nodes is None:
+        nodes = wood(source_code, 'corelib.cl')
+        if path:
+            image.save(path, nodes)
+    for node in nodes:
+        node.execute(environment)  # <- populate the environment
+
+
+def remember_core(environment: dict) -> None:
+
+    """Remembers bindings every fresh (core-loaded) environment has"""
+
+    # chiakilisp.parallel relies on this snapshot: bindings that
+    # are still identical to the remembered ones are resolved by
+    # their names in the worker processes, instead of shipping.
+
+    environment['__core__'] = dict(environment)
+
+
+def wood(source_code: str, source_code_file_name: str) -> list:
+
+    """Returns AST (list of nodes) built from the source code"""
+
+    lexer = Lexer(source_code, source_code_file_name)
+    try:
+        lexer.lex()
+    except IndexError:  # <-------------------------------------------------- may occur when input's broken
+        formatted = ':'.join(map(str, lexer.pos()))
+        raise SyntaxError(f"{formatted}: Couldn't read a source code")  # pylint: disable=raise-missing-from
+    ast = Parser(lexer.tokens())
+    try:
+        ast.parse()
+    except AssertionError:  # <---------------------------------------------------- occurs on a missing paren
+        formatted = ':'.join(map(str, lexer.pos()))
+        raise SyntaxError(f'{formatted}: Unable to parse source code')  # pylint: disable=raise-missing-from
+    return ast.wood()
+
+
+def default_search_path() -> list:
+
+    """Returns the current directory, then CHIAKILISP_PATH ones"""
+
+    return ['.'] + [directory
+                    for directory in os.environ.get(SEARCH_PATH_VARIABLE, '').split(os.pathsep) if directory]
+
+
+class Runtime:
+
+    """ChiakiLisp runtime that owns its globals, embed it to run code"""
+
+    # The core library is loaded once, by the Runtime() itself; fork() returns a child runtime which has its own
+    # globals: bindings are shared with the parent (values are never copied), but (def)s in the child are never
+    # seen by the parent and vice versa. The globals are plain dict, since every symbol lookup is dict lookup; a
+    # shallow dict copy of the loaded core takes a few microseconds, so fork() copies it right away, instead of
+    # a lazy copy-on-write mapping which would make each lookup slower. Functions capture defining environment,
+    # so the core `eval` is defined again (from its source) in each fork, and evaluates code in the fork globals.
+    # Forks share the module registry with the root runtime, and each module is executed in a root runtime fork.
+    # With optimize=True, code and modules are rewritten by chiakilisp.optimizer before they're executed.
+
+    environment: dict
+    modules: ModuleRegistry
+    optimize: bool
+
+    def __init__(self,
+                 environment: dict = None,
+                 coreless: bool = False,
+                 images: str = None,
+                 search_path: list = None,
+                 optimize: bool = False) -> None:
+
+        self.environment = dict(RUNTIME) if environment is None else environment
+        self.optimize = optimize
+        self.modules = ModuleRegistry(wood, default_search_path() if search_path is None else search_path)
+        self._root = self
+        proxy_builtins(self.environment)
+        if not coreless:
+            load_core(self.environment, images)
+        self._bind()
+        remember_core(self.environment)
+
+    def _bind(self, inherited: Any = None) -> None:
+
+        """Binds (require) and `eval` helpers to this runtime"""
+
+        self.environment['__require__'] = self.require
+        self.environment['__globals__'] = self.environment
+        self._eval = self.environment.get('eval')
+        if self._eval is inherited and hasattr(inherited, 'x__source__x'):  # <- not redefined, not Python eval
+            self._eval = inherited.x__source__x.execute(self.environment)  # <- the same function, child globals
+            self._eval.x__custom_name__x = inherited.x__custom_name__x
+            self.environment['eval'] = self._eval
+
+    def fork(self) -> 'Runtime':
+
+        """Returns child runtime that shares parent runtime bindings"""
+
+        child = Runtime.__new__(Runtime)
+        child.environment = dict(self.environment)
+        child.modules = self.modules
+        child.optimize = self.optimize
+        child._root = self._root  # pylint: disable=protected-access  # it's the same class
+        child._bind(self._eval)  # pylint: disable=protected-access  # it's the same class
+        return child
+
+    def parse(self, source_code: str, source_code_file_name: str = '<string>') -> list:
+
+        """Returns AST of the source code, optimized if it's enabled"""
+
+        return self.optimized(wood(source_code, source_code_file_name))
+
+    def optimized(self, nodes: list) -> list:
+
+        """Returns optimized copy of the nodes if it's enabled"""
+
+        return optimizer.optimize(nodes, self.environment) if self.optimize else nodes
+
+    def execute(self, source_code: str, source_code_file_name: str = '<string>') -> Any:
+
+        """Executes the source code, returns the last form result"""
+
+        result = None
+        for node in self.parse(source_code, source_code_file_name):
+            result = node.execute(self.environment)
+        return result
+
+    def require(self, path: str, use_global_env: bool = False) -> types.ModuleType:
+
+        """Returns ChiakiLisp module (it's loaded once) as Python 3 one"""
+
+        if not use_global_env:
+            return self.modules.require(path, self._load)
+
+        path = path + '.cl' if not path.endswith('.cl') else path  # <-- settings file is loaded into globals
+        with open(path, 'r', encoding='utf-8') as reader:
+            return self._module(path, self.parse(reader.read(), os.path.basename(path)), self)
+
+    def _load(self, path: str, nodes: list) -> types.ModuleType:
+
+        """Executes module in its own environment, called by registry"""
+
+        runtime = self._root.fork()
+        return self._module(path, runtime.optimized(nodes), runtime)  # <- registry's nodes stay unoptimized
+
+    @staticmethod
+    def _module(path: str, nodes: list, runtime: 'Runtime') -> types.ModuleType:
+
+        """Executes module AST nodes, returns it as Python 3 module"""
+
+        unqualified_path = os.path.basename(path)
+        module_name = unqualified_path.replace('.cl', '')
+
+        from importlib.abc import Loader  # pylint: disable=import-outside-toplevel  # it takes a while, on demand
+
+        spec = importlib.util.spec_from_loader(module_name, Loader(), origin=path)
+        module = importlib.util.module_from_spec(spec)
+
+        for node in nodes:
+            node.execute(runtime.environment)
+
+        for name, value in tuple(runtime.environment.items()):
+            setattr(module, name, value)  # <-------------------------------------------------- populate module
+
+        return module
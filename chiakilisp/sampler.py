@@ -0,0 +1,160 @@
+# pylint: disable=line-too-long
+# pylint: disable=protected-access
+# pylint: disable=missing-module-docstring
+
+import sys
+import threading
+from typing import Any, IO
+from chiakilisp.models import expression
+from chiakilisp.profiler import label, position
+
+# The sampling profiler costs the profiled threads nothing: no hooks are installed, and the evaluator is not aware
+# of it. Instead, a background thread wakes up every interval, takes Python stacks of all the threads, and finds the
+# ChiakiLisp stack in each: every user function call is a `handle` (or an inline function `handler`) frame, and
+# their closures have the function name and its definition position; the innermost Expression.execute() frame has
+# the form that is being evaluated. Each stack is counted, so collapsed stacks can be rendered as a flame graph.
+# With the default 10 ms interval, the only cost is the sampler holding the GIL for a few dozens of microseconds.
+
+DEFAULT_INTERVAL = 0.01
+
+_EXPRESSION = expression.__file__  # <------------------------------------------- handles are closures defined there
+_HANDLES = ('handle', 'handler')
+
+
+def _form(node: Any) -> tuple:
+
+    """Returns ('(head)', position) key of the evaluated form"""
+
+    head = node.nodes()[0] if node.nodes() else None
+    name = head.token().value() if isinstance(head, expression.Literal) else '...'
+    return f'({name})', position(node)
+
+
+def stack(frame: Any) -> list:
+
+    """Returns ChiakiLisp stack of the Python one, outermost first"""
+
+    keys = []
+    form = None
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename == _EXPRESSION:
+            if code.co_name == 'execute' and form is None:
+                node = frame.f_locals.get('self')
+                if isinstance(node, expression.Expression) and node.nodes():
+                    form = _form(node)  # <-------------------------------- only the innermost form is interesting
+            elif code.co_name in _HANDLES:
+                closure = frame.f_locals
+                keys.append((closure.get('name', '<anonymous function>'), closure.get('where', ())))
+        frame = frame.f_back
+    keys.reverse()
+    if form is not None:
+        keys.append(form)
+    return keys
+
+
+class Sampler:
+
+    """Sampling profiler that runs in its own background thread"""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopping = threading.Event()
+        self._stacks = {}  # <---------------------------------------- 'outer;inner' path -> number of samples
+        self._stats = {}  # <------------------------------------------------- key -> [self samples, total samples]
+        self._samples = 0
+
+    def running(self) -> bool:
+
+        """Returns whether the sampler thread is running now"""
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'Sampler':
+
+        """Starts the sampler thread, unless it's already running"""
+
+        if not self.running():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='chiakilisp-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> 'Sampler':
+
+        """Stops the sampler thread, the samples are kept though"""
+
+        if self.running():
+            self._stopping.set()
+            self._thread.join()
+        self._thread = None
+        return self
+
+    def clear(self) -> 'Sampler':
+
+        """Forgets the samples taken so far, i.e. starts over"""
+
+        with self._lock:
+            self._stacks, self._stats, self._samples = {}, {}, 0
+        return self
+
+    def _run(self) -> None:
+
+        """Takes a sample every interval, until it's been stopped"""
+
+        own = threading.get_ident()
+        while not self._stopping.wait(self.interval):
+            self.sample(exclude=own)
+
+    def sample(self, exclude: int = None) -> None:
+
+        """Counts ChiakiLisp stacks of the threads, except one"""
+
+        stacks = [stack(frame) for ident, frame in sys._current_frames().items() if ident != exclude]
+        with self._lock:
+            self._samples += 1
+            for keys in stacks:
+                if not keys:
+                    continue  # <--------------------------------------------- the thread is not in ChiakiLisp code
+                path = ';'.join(label(key).replace(';', ':') for key in keys)
+                self._stacks[path] = self._stacks.get(path, 0) + 1
+                for key in set(keys):
+                    self._stats.setdefault(key, [0, 0])[1] += 1
+                self._stats[keys[-1]][0] += 1
+
+    def stats(self) -> list:
+
+        """Returns [(key, self, total samples)], the busiest first"""
+
+        with self._lock:
+            rows = [(key, own, total) for key, (own, total) in self._stats.items()]
+        return sorted(rows, key=lambda row: (row[1], row[2]), reverse=True)
+
+    def report(self, writer: IO, limit: int = None) -> None:
+
+        """Writes text report, sorted by the self samples count"""
+
+        samples = max(self._samples, 1)
+        writer.write(f'{self._samples} samples, every {self.interval * 1000:g} ms\n')
+        writer.write(f'{"self":>10} {"self, %":>8} {"total, %":>9}  function or form (defined at)\n')
+        for key, own, total in self.stats()[:limit]:
+            writer.write(f'{own:>10} {own / samples * 100:>8.1f} {total / samples * 100:>9.1f}  {label(key)}\n')
+
+    def collapsed(self, writer: IO) -> None:
+
+        """Writes collapsed stacks, weighted by the sample counts"""
+
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        for path, count in stacks:
+            writer.write(f'{path} {count}\n')
+
+    def dump(self, path: str) -> None:
+
+        """Writes collapsed stacks to the file, on the demand"""
+
+        with open(path, 'w', encoding='utf-8') as writer:
+            self.collapsed(writer)
@@ -234,6 +234,27 @@ class Literal(SignatureVariantType):
         return True, ''
 
 
+class _Pattern(SignatureVariantType):
+
+    @staticmethod
+    def valid(pattern) -> Tuple[bool, str]:
+
+        if not is_chiakilisp_expression(pattern):
+            return Literal(Identifier).valid(pattern)
+
+        for each in pattern.nodes():  # <------------------------------------- (let) patterns could be nested
+            valid, why = Pattern.valid(each)
+            if not valid:
+                return False, \
+                       f'should be a' \
+                       f' form, where each argument {why}'
+
+        return True, ''
+
+
+Pattern = _Pattern()
+
+
 class Signature:
 
     _specs: Tuple[SignatureVariantType]
@@ -388,13 +409,17 @@ rules = {
     'cond': Rule(Arity(Even),
                  Signature(RestOf(Anything))),
     'let': Rule(Arity(AtLeast(1)),
-                Signature(FormOf(Pair(Or(FormOf(Literal(Identifier)),
-                                         Literal(Identifier)),
+                Signature(FormOf(Pair(Pattern,
                                       Anything)),
                           RestOf(Anything))),
     'fn': Rule(Arity(AtLeast(1)),
                Signature(FormOf(Literal(Identifier)),
                          RestOf(Anything))),
+    'async-fn': Rule(Arity(AtLeast(1)),
+                     Signature(FormOf(Literal(Identifier)),
+                               RestOf(Anything))),
+    'await': Rule(Arity(Exactly(1)),
+                  Signature(Anything)),
     'def': Rule(Arity(Exactly(2)),
                 Signature(Literal(Identifier), Anything)),
     'def?': Rule(Arity(Exactly(2)),
@@ -407,6 +432,21 @@ rules = {
                   Signature(Literal(Identifier),
                             FormOf(Literal(Identifier)),
                             RestOf(Anything))),
+    'defn-memo': Rule(Arity(AtLeast(2)),
+                      Signature(Literal(Identifier),
+                                FormOf(Literal(Identifier)),
+                                RestOf(Anything))),
+    'deftest': Rule(Arity(AtLeast(1)),
+                    Signature(Literal(Identifier),
+                              RestOf(Anything))),
+    'is': Rule(Arity(AtLeast(1)),
+               Signature(Anything, Anything)),
+    'future': Rule(Arity(AtLeast(1)),
+                   Signature(RestOf(Anything))),
+    'async-defn': Rule(Arity(AtLeast(2)),
+                       Signature(Literal(Identifier),
+                                 FormOf(Literal(Identifier)),
+                                 RestOf(Anything))),
     'for': Rule(Arity(Exactly(2)),
                 Signature(FormOf(Pair(Literal(Identifier),
                                       Anything)),
@@ -0,0 +1,157 @@
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=import-outside-toplevel
+
+import io
+import os
+import sys
+import time
+import fnmatch
+import argparse
+import traceback
+import contextlib
+from typing import List
+
+# `chiakilang test` runs .cl test files in a pool of warm worker processes: a worker imports the interpreter and
+# loads the core image once, then each file is executed by a fresh Runtime (a few milliseconds, as core image is
+# in the OS page cache by then), so files never see each other's definitions. Tests are (deftest name body...)
+# forms, their bodies use (is form message), a test passes unless it raises. Files that print 'FAILED' lines (it
+# is the way the older test files report their checks) are failed as well. Directories are not searched deeper,
+# since tests/*/ directories hold fixtures. The exit code is 1 if there has been at least one failure or error.
+
+DEFAULT_PATHS = ['tests']
+
+DEFAULT_SLOWEST = 5
+
+_IMAGES: str or None = None  # <----------------------------- core images directory, it is set in a worker process
+
+
+def discover(paths: List[str]) -> List[str]:
+
+    """Returns .cl files: the given ones, and those in directories"""
+
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.endswith('.cl') and os.path.isfile(os.path.join(path, name))))
+        else:
+            found.append(path)
+    return found
+
+
+def _warm_up(images: str or None) -> None:
+
+    """Imports the interpreter and loads the core image (in a worker)"""
+
+    global _IMAGES  # pylint: disable=global-statement  # it's the worker process state
+
+    _IMAGES = images
+    from chiakilisp.runtime import Runtime
+    Runtime(images=images)  # <------------------------------------- the first one saves the image, if needed
+
+
+def run_file(path: str, pattern: str = '*') -> dict:
+
+    """Executes test file, then runs its tests, returns the result"""
+
+    from chiakilisp.runtime import Runtime, wood
+
+    result = {'path': path, 'tests': [], 'error': None, 'output': ''}
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            runtime = Runtime(images=_IMAGES)
+            runtime.modules.search_path.insert(0, os.path.dirname(os.path.abspath(path)))  # <------ Python-like
+            with open(path, 'r', encoding='utf-8') as reader:
+                for node in wood(reader.read(), os.path.basename(path)):
+                    node.execute(runtime.environment)
+        except (Exception,) as exc:  # pylint: disable=broad-except  # a broken file is reported, not raised
+            result['error'] = ''.join(traceback.format_exception_only(type(exc), exc)).strip()
+            runtime = None
+        result['seconds'] = time.perf_counter() - started  # <-------------------- the file load, tests excluded
+        tests = [] if runtime is None else [value for value in runtime.environment.values()
+                                            if getattr(value, 'x__test__x', None) is not None]
+        for test in tests:
+            name = test.x__custom_name__x
+            if not fnmatch.fnmatchcase(name, pattern):
+                continue
+            started, failure = time.perf_counter(), None
+            try:
+                test()
+            except (Exception,) as exc:  # pylint: disable=broad-except  # failed assertion, or any other error
+                failure = str(exc) if isinstance(exc, AssertionError) else f'{type(exc).__name__}: {exc}'
+            result['tests'].append((name, time.perf_counter() - started, failure))
+    result['output'] = output.getvalue()
+    return result
+
+
+def failed_checks(result: dict) -> List[str]:
+
+    """Returns the 'FAILED' lines the file has printed, if any"""
+
+    return [line for line in result['output'].splitlines() if 'FAILED' in line]
+
+
+def report(results: List[dict], slowest: int, seconds: float, stream=sys.stdout) -> bool:
+
+    """Prints failures, the slowest tests and summary, returns ok"""
+
+    passed = failed = errors = 0
+    timings = []
+    for result in results:
+        checks = failed_checks(result)
+        failures = [(name, failure) for name, _, failure in result['tests'] if failure is not None]
+        timings.extend((name, result['path'], took) for name, took, _ in result['tests'])
+        passed += len(result['tests']) - len(failures)
+        failed += len(failures) + len(checks)
+        errors += result['error'] is not None
+        status = 'ERROR' if result['error'] else 'FAIL' if failures or checks else 'ok'
+        print(f'{status:<5} {result["path"]} ({len(result["tests"])} tests, {result["seconds"]:.2f}s)', file=stream)
+        if result['error']:
+            print(f'      {result["error"]}', file=stream)
+        for name, failure in failures:
+            print(f'      {name}: {failure}', file=stream)
+        for line in checks:
+            print(f'      {line}', file=stream)
+
+    timings.sort(key=lambda timing: timing[2], reverse=True)
+    if slowest and timings:
+        print(f'\nslowest {min(slowest, len(timings))} tests:', file=stream)
+        for name, path, took in timings[:slowest]:
+            print(f'{took * 1000:>10.1f} ms  {path}: {name}', file=stream)
+
+    print(f'\n{passed} passed, {failed} failed, {errors} errors, {len(results)} files in {seconds:.2f}s', file=stream)
+    return not failed and not errors
+
+
+def main(argv: List[str]) -> int:
+
+    """Entry point of the `chiakilang test`, returns an exit code"""
+
+    parser = argparse.ArgumentParser('chiakilang test - ChiakiLisp test runner')
+    parser.add_argument('paths', nargs='*', default=DEFAULT_PATHS, help='Test files or directories with them')
+    parser.add_argument('-k', '--pattern', default='*', help='Only run tests matching the glob pattern')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='Number of worker processes')
+    parser.add_argument('--slowest', type=int, default=DEFAULT_SLOWEST, help='Number of the slowest tests to show')
+    parser.add_argument('--imageless', action='store_true', help='Do not load or save core image')
+
+    args = parser.parse_args(argv)
+
+    images = None if args.imageless else os.path.join(os.path.expanduser('~'), '.chiakilisp', 'images')
+    paths = discover(args.paths)
+    missing = [path for path in paths if not os.path.isfile(path)]
+    if missing:
+        parser.error(f'{missing[0]}: no such file')
+
+    started = time.perf_counter()
+    if args.jobs <= 1 or len(paths) <= 1:
+        _warm_up(images)  # <---------------------------------------- one file, or one job: no workers to spawn
+        results = [run_file(path, args.pattern) for path in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(args.jobs, len(paths)), initializer=_warm_up, initargs=(images,)) as workers:
+            results = list(workers.map(run_file, paths, [args.pattern] * len(paths)))
+
+    return 0 if report(results, args.slowest, time.perf_counter() - started) else 1
@@ -4,7 +4,7 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=too-many-return-statements  # it's fine. dear
 
-from typing import Callable, Sized, Generator
+from typing import Callable, Sized, Generator, List
 from chiakilisp.proxies.keyword import Keyword
 
 FORMATTERS = {'True': 'true', 'False': 'false',  'None': 'nil'}
@@ -18,6 +18,34 @@ def pairs(plain: Sized) -> Generator:
     return (plain[i:i + 2] for i in range(0, len(plain), 2))
 
 
+def steps(collections: List, get: Callable) -> Generator:
+
+    """Returns generator of (for) steps, a step has item per coll;
+    lazy ones (generators, files, map, filter) are not measured"""
+
+    exhausted = object()
+    iterators = {idx: iter(collection) for idx, collection in enumerate(collections) if not hasattr(collection, '__len__')}
+    max_length = max((len(collection) for collection in collections if hasattr(collection, '__len__')), default=0)
+    element_idx = 0
+    while True:
+        step, produced = [], element_idx < max_length
+        for idx, collection in enumerate(collections):
+            if idx not in iterators:
+                step.append(get(collection, element_idx) if element_idx < max_length else None)
+                continue
+            item = next(iterators[idx], exhausted) if iterators[idx] is not None else exhausted
+            if item is exhausted:
+                iterators[idx] = None  # <------------------ then the rest items of that lazy collection are nil
+                item = None
+            else:
+                produced = True
+            step.append(item)
+        if not produced:
+            return
+        element_idx += 1
+        yield step
+
+
 def get_assertion_closure(e_object) -> Callable:
 
     """Returns the 'ASSERT()' function for the 'e_object'"""
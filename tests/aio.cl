@@ -0,0 +1,39 @@
+;; this file contains tests for (async-fn) and (await), it fans requests out to the local echo server
+
+(import time)
+(import asyncio)
+
+(async-defn echo                        ;; <- stand-in server: replies with the line it got, but only later
+  (reader writer)
+  (let (line (await (.readline reader)))
+   (await (async-sleep 0.05))
+   (.write writer line)
+   (await (.drain writer))
+   (.close writer)))
+
+(async-defn request                     ;; <- client: sends a number and reads the number that is echoed
+  (port n)
+  (let ((reader writer) (await (asyncio/open_connection "127.0.0.1" port)))
+   (.write writer (.encode (+ (str n) "\n")))
+   (await (.drain writer))
+   (let (line (await (.readline reader)))
+    (.close writer)
+    (int line))))
+
+(async-defn fan-out                     ;; <- sends 'n' requests concurrently, at most 'limit' at a time
+  (n limit)
+  (let (server (await (asyncio/start_server echo "127.0.0.1" 0))
+        port   (get (.getsockname (first server/sockets)) 1)
+        result (await (async-gather (map (fn (x) (request port x)) (range n)) limit)))
+   (.close server)
+   (await (.wait_closed server))
+   result))
+
+(let (started  (time/monotonic)
+      result   (async-run (fan-out 50 25))
+      elapsed  (- (time/monotonic) started)
+      expected (list (range 50)))
+ (prn "(async-run (fan-out 50 25))"
+      (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result))))
+ (prn "(async-run (fan-out 50 25)) is concurrent"
+      (if (< elapsed 1) "PASSED" (+ "FAILED: it took " (str elapsed) " seconds"))))
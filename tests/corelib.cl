@@ -1,5 +1,7 @@
 ;; this file contains tests for the ChiakiLisp core library, should be updated alongside corelibrary
 
+(import tempfile)  ;; records-tests need temporary files
+
 (def identity-tests [{:run "(identity 10)" :expected 10}
                      {:run "(identity \"Hello\")" :expected "Hello"}])
 
@@ -13,6 +15,94 @@
 (def zero?-tests [])) ;; todo: implement (core/zero?) tests
 (def positive?-tests []) ;; todo: implement (core/positive? tests)
 
+(def memoize-tests [{:run "(let (f (memoize inc)) (f 1) (f 1) (:hits (memo-stats f)))" :expected 1}
+                    {:run "(let (f (memoize inc)) (f 1) (f 2) (:misses (memo-stats f)))" :expected 2}
+                    {:run "(let (f (memoize inc {:max-size 1})) (f 1) (f 2) (:evictions (memo-stats f)))" :expected 1}
+                    {:run "(let (f (memoize identity)) (f [1 {:a #{2}}]) (f [1 {:a #{2}}]) (:hits (memo-stats f)))" :expected 1}
+                    {:run "(let (f (memoize identity)) (f :a) (f \"a\") (:size (memo-stats f)))" :expected 2}
+                    {:run "(let (f (memoize inc {:policy :ttl :ttl 60})) (f 1) (f 1) (:hit-rate (memo-stats f)))" :expected 0.5}])
+
+(def parallel-tests [{:run "(pmap inc [1 2 3])" :expected [2 3 4]}
+                     {:run "(let (n 10) (pmap (fn (x y) (+ x y n)) [1 2] [3 4]))" :expected [14 16]}
+                     {:run "(pcalls (fn () 1) (fn () (+ 1 1)))" :expected [1 2]}
+                     {:run "(let (n 2) (deref (future (* n 21))))" :expected 42}])
+
+(def atom-tests [{:run "(deref (atom 1))" :expected 1}
+                 {:run "(let (a (atom 1)) (swap! a + 10 100) (deref a))" :expected 111}
+                 {:run "(let (a (atom 1)) (reset! a 2) (deref a))" :expected 2}
+                 {:run "(let (a (atom 1)) (compare-and-set! a 1 2))" :expected true}
+                 {:run "(let (a (atom 1)) (compare-and-set! a 3 2) (deref a))" :expected 1}])
+
+(def async-tests [{:run "(let (f (async-fn (x) (* (await (async-sleep 0 x)) 2))) (async-run (f 21)))" :expected 42}
+                  {:run "(let (f (async-fn (x) (await (async-sleep 0 x)))) (async-run (async-gather (map f [1 2 3]) 2)))" :expected [1 2 3]}
+                  {:run "(let (f (async-fn () (when (await (async-sleep 0 true)) (+ 1 (await (future 1)))))) (async-run (f)))" :expected 2}])
+
+(def channel-tests [{:run "(let (c (chan 2)) (>! c 1) (>! c 2) (close! c) [(<! c) (<! c) (<! c)])" :expected [1 2 nil]}
+                    {:run "(let (c (chan)) (close! c) (>! c 1))" :expected false}
+                    {:run "(let (a (chan) b (chan)) (>! b 1) (first (alts! [a b])))" :expected 1}
+                    {:run "(let (a (chan)) (first (alts! [[a 5]])))" :expected true}
+                    {:run "(let (c (chan 4)) (pipeline 2 c inc (to-chan! [1 2 3])) [(<! c) (<! c) (<! c) (<! c)])" :expected [2 3 4 nil]}
+                    {:run "(<! (thread-call + 1 2))" :expected 3}
+                    {:run "(let (f (async-fn (c) (await (>! c 1)) (await (<! c)))) (async-run (f (chan))))" :expected 1}
+                    {:run "(let (c (chan 4)) (pipeline 2 c (fn (x) (/ 1 x)) (to-chan! [1 0 2 3 4 5 6])) [(<! c) (isinstance (<! c) Exception) (<! c)])" :expected [1.0 true nil]}
+                    {:run "(let (from (chan 4) done (pipeline 1 (chan 4) (fn (x) (/ 1 x)) from)) (>! from 0) [(isinstance (<! done) Exception) (>! from 1) (>! from 2) (close! from)])" :expected [true true true nil]}
+                    {:run "(let (c (chan 1) done (pipeline 1 c (fn (x) (/ 1 x)) (to-chan! [1 0]))) [(isinstance (<! done) Exception) (<! c) (<! c)])" :expected [true 1.0 nil]}
+                    {:run "(let (f (async-fn (c) (>! c 1))) (try (async-run (f (chan))) (catch RuntimeError e (.__contains__ (str e) \"not awaited\"))))" :expected true}])
+
+(def runtime-tests [{:run "(let (parent (runtime/Runtime) child (.fork parent)) (.execute child \"(def x 1)\") [(.execute child \"(inc x)\") (contains? parent/environment \"x\")])" :expected [2 false]}
+                    {:run "(.execute (runtime/Runtime nil true) \"(+ 1 2)\")" :expected 3}
+                    {:run "(let (child (.fork (runtime/Runtime))) (.execute child \"(def x 1)\") [(.execute child \"(first (list (eval (chr 120))))\") (.execute (.fork child) \"(first (list (eval (chr 120))))\")])" :expected [1 1]}
+                    {:run "(let (parent (runtime/Runtime nil true)) (.execute (.fork parent) \"(eval (chr 50))\"))" :expected 2}])
+
+(def edn-tests [{:run "(read-edn-string \"{:a [1 2] #_ :x :b nil}\")" :expected {:a [1 2] :b nil}}
+                {:run "(read-edn-string \"[1 2.5 -3N true nil sym] ; comment\")" :expected [1 2.5 -3 true nil "sym"]}
+                {:run "(contains? (read-edn-string \"#{1 #_ 2 3}\") 2)" :expected false}
+                {:run "(read-edn-string \"#point [1 2]\" {\"point\" (fn (xy) (apply + xy))})" :expected 3}])
+
+(def records-tests [{:run "(let (path (tempfile/mktemp \".jsonl\")) (write-jsonl path [{:a 1} {:a 2}]) (reduce + (map (fn (r) (.get r \"a\")) (read-jsonl path))))" :expected 3}
+                    {:run "(let (path (tempfile/mktemp \".csv\")) (write-csv path [{:a 1 :b 2}]) (write-csv path [{:a 3 :b 4}] nil true) (list (read-csv path)))" :expected [{:a "1" :b "2"} {:a "3" :b "4"}]}
+                    {:run "(let (path (tempfile/mktemp \".csv\")) (write-csv path [[1 2] [3 4] [5 6]]) (list (read-csv path 2 false)))" :expected [[["1" "2"] ["3" "4"]] [["5" "6"]]]}
+                    {:run "(let (path (tempfile/mktemp \".jsonl\") seen (atom 0)) (write-jsonl path [1 2 3]) (for (x (read-jsonl path)) (swap! seen + x)) (deref seen))" :expected 6}])
+
+(def files-tests [{:run "(let (path (tempfile/mktemp)) (spit path [\"a\" (chr 10) \"b\"]) (spit path [(chr 10) \"c\"] true) (list (line-seq path)))" :expected ["a" "b" "c"]}
+                  {:run "(let (path (tempfile/mktemp)) (spit path \"0123456789\") [(read-region path 2 3) (bytes (.__getitem__ (slurp-bytes path) (slice 8 nil)))])" :expected [(bytes "234" "ascii") (bytes "89" "ascii")]}
+                  {:run "(let (path (tempfile/mktemp)) (spit path \"\") (bytes (slurp-bytes path)))" :expected (bytes "" "ascii")}
+                  {:run "(let (path (tempfile/mktemp)) (spit path \"log\") (str (type (getattr (slurp-bytes path) \"obj\"))))" :expected "<class 'mmap.mmap'>"}
+                  {:run "(let (path (tempfile/mktemp)) (spit path (json/dumps {\"a\" 1})) (slurp-json path))" :expected {"a" 1}}])
+
+(def get-tests [{:run "[(get [1 2] 0) (get [1 2] -1) (get [1 2] 2) (get [1 2] -3 :x) (get \"ab\" 5 :x)]" :expected [1 2 nil :x :x]}
+                {:run "[(get {:a 1} :b) (get {:a 1} :b 2) (get [1 2 3] (slice 1 nil)) (first []) (second [1])]" :expected [nil 2 [2 3] nil nil]}])
+
+(def keyword-tests [{:run "(:a {:a 1})" :expected 1}
+                    {:run "(:b {:a 1} 2)" :expected 2}
+                    {:run "(:a {\"a\" 1})" :expected 1}
+                    {:run "(:a nil)" :expected nil}
+                    {:run "(:a [1 2] 3)" :expected 3}
+                    {:run "[(:a nil 3) (:a #{:b} 4) (:b #{:b} 4)]" :expected [3 4 :b]}
+                    {:run "[(= (id :a) (id :a)) (= (id :a) (id (first (list (.keys (read-edn-string \"{:a 1}\"))))))]" :expected [true true]}])
+
+(def literal-tests [{:run "(let (f (fn () [1 2])) (.append (f) 3) (f))" :expected [1 2]}
+                    {:run "(let (f (fn () {:a [1] :b #{2}})) (.append (:a (f)) 2) (.add (:b (f)) 3) (f))" :expected {:a [1] :b #{2}}}
+                    {:run "(let (f (fn () #[1 [2]])) (.append (second (f)) 3) (f))" :expected #[1 [2]]}
+                    {:run "(let (f (fn () #[1 :a \"b\"])) (= (id (f)) (id (f))))" :expected true}
+                    {:run "(let (x 1) [x {:a x} #[x]])" :expected [1 {:a 1} #[1]]}
+                    {:run "[(->> 1 [2]) (-> 1 #[2])]" :expected [[2 1] #[1 2]]}])
+
+(def destructuring-tests [{:run "(let ((a b c) [1 2]) [a b c])" :expected [1 2 nil]}
+                          {:run "(let ([a b] #[1 2 3]) [a b])" :expected [1 2]}
+                          {:run "(let ({a b} {:a 1}) [a b])" :expected [1 nil]}
+                          {:run "(let ((a & rest) [1 2 3]) [a rest])" :expected [1 [2 3]]}
+                          {:run "(let ((a & rest) [1]) [a rest])" :expected [1 nil]}
+                          {:run "(let (((a b) {c d} & (e)) [[1 2] {:c 3} 4]) [a b c d e])" :expected [1 2 3 nil 4]}
+                          {:run "(let ((a b) \"xy\") [a b])" :expected ["x" "y"]}
+                          {:run "(let ((a b) nil) [a b])" :expected [nil nil]}])
+
+(def dot-form-tests [{:run "(list (map (fn (x) (.__len__ x)) [\"ab\" [1] #[1 2 3] {:a 1} #{1 2} (bytes 5)]))" :expected [2 1 3 1 2 5]}
+                     {:run "(let (f (fn (x) (.upper x))) (f \"a\") (f \"b\"))" :expected "B"}
+                     {:run "(let (f (fn (x) (.bit_length x))) (f 1) (f 255))" :expected 8}
+                     {:run "(try (let (f (fn (x) (.nope x))) (f 1)) (catch Exception e (.__contains__ (str e) \"has no method 'nope'\")))" :expected true}
+                     {:run "(try (let (f (fn (x) (.index x 5))) (f [1]) (f [1])) (catch Exception e (.__contains__ (str e) \"ValueError\")))" :expected true}])
+
 (def all-tests [identity-tests
                 constantly-tests
                 inc-tests
@@ -20,7 +110,21 @@
                 odd?-tests
                 even?-tests
                 zero?-tests
-                positive?-tests])
+                positive?-tests
+                memoize-tests
+                parallel-tests
+                atom-tests
+                async-tests
+                channel-tests
+                runtime-tests
+                edn-tests
+                records-tests
+                files-tests
+                get-tests
+                keyword-tests
+                literal-tests
+                destructuring-tests
+                dot-form-tests])
 
 (for (specific-tests all-tests)
  (for (specific-test specific-tests)
@@ -0,0 +1,76 @@
+;; this file contains tests for `chiakilang --daemon` and `chiakilang run`, each test starts its own daemon process
+
+(import os)
+(import sys)
+(import time)
+(import tempfile)
+(import subprocess)
+(import chiakilisp.daemon)
+
+(def chiakilang (.join os/path (.dirname os/path (.dirname os/path daemon/__file__)) "chiakilang"))
+
+(defn write (path source)
+  (let (writer (open path "w"))
+   (.write writer source)
+   (.close writer)))
+
+(defn eventually (predicate)   ;; <- polls the predicate for 30 seconds at most, returns its last result
+  (let (deadline (+ (time/monotonic) 30))
+   (while (and (not (predicate)) (< (time/monotonic) deadline))
+    (time/sleep 0.05))
+   (predicate)))
+
+(defn processes-of (socket)    ;; <- a forked process has the same command line as the daemon it's forked by
+  (count (list (filter (fn (pid) (.__contains__ (try (slurp (+ "/proc/" pid "/cmdline")) (catch OSError _ "")) socket))
+                       (filter (fn (name) (.isdigit name)) (os/listdir "/proc"))))))
+
+(defn fresh-socket ()
+  (.join os/path (tempfile/mkdtemp) "daemon.sock"))
+
+(defn with-daemon (socket f)
+  (let (process (subprocess/Popen ["env" "CHIAKILISP_POOL_SIZE=2" sys/executable chiakilang "--daemon" socket "--workers" "1"])
+        _       (eventually (fn () (.exists os/path socket)))
+        result  (try (f socket) (catch Exception e e)))
+   (.terminate process)
+   (.wait process)
+   result))
+
+(defn run (socket & arguments)
+  (let (process   (subprocess/Popen (+ [sys/executable chiakilang "run" "-s" socket] (list arguments))
+                                    -1 nil nil subprocess/PIPE subprocess/PIPE)
+        (out err) (.communicate process))
+   [(.decode out) (.decode err) (.wait process)]))
+
+(deftest run-streams-stdout-and-the-exit-code
+  (is (= (with-daemon (fresh-socket) (fn (socket) (run socket "-e" "(print 42)"))) ["42\n" "" 0])))
+
+(deftest run-streams-stderr-of-a-failed-script
+  (let ((out err code) (with-daemon (fresh-socket) (fn (socket) (run socket "-e" "(/ 1 0)"))))
+   (is (= [out code] ["" 1]))
+   (is (.__contains__ err "ZeroDivisionError"))))
+
+(deftest run-passes-arguments-and-the-exit-status
+  (let (script (.join os/path (tempfile/mkdtemp) "script.cl"))
+   (write script "(import sys) (print (.__getitem__ sys/argv 1)) (exit 3)")
+   (is (= (with-daemon (fresh-socket) (fn (socket) (run socket script "argument"))) ["argument\n" "" 3]))))
+
+(deftest each-script-runs-in-a-fresh-worker
+  (is (= (with-daemon (fresh-socket) (fn (socket) [(run socket "-e" "(def x 1)")
+                                                   (run socket "-e" "(print (contains? __globals__ \"x\"))")]))
+         [["" "" 0] ["False\n" "" 0]])))
+
+(deftest run-fails-without-a-daemon
+  (let ((out err code) (run (.join os/path (tempfile/mkdtemp) "missing.sock") "-e" "1"))
+   (is (= [out code] ["" 1]))
+   (is (.__contains__ err "no daemon is listening"))))
+
+(deftest workers-leave-no-parser-processes-behind
+  (let (directory (tempfile/mkdtemp)
+        main      (.join os/path directory "main.cl"))
+   (write (.join os/path directory "dep.cl") "(def value 1)")
+   (write (.join os/path directory "mid.cl") "(require dep) (def value (inc dep/value))")
+   (write main "(require mid) (print mid/value)")
+   (let (socket (.join os/path directory "daemon.sock"))
+    (is (= (with-daemon socket (fn (socket) [(run socket main) (run socket main) (run socket main)]))
+           [["2\n" "" 0] ["2\n" "" 0] ["2\n" "" 0]]))
+    (is (eventually (fn () (zero? (processes-of socket)))) "orphaned processes of the daemon"))))
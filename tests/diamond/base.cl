@@ -0,0 +1,3 @@
+;; this file is the bottom of the diamond-shaped dependency graph, tests/require.cl requires it through two modules
+
+(def loaded (object))  ;; <- a new object on each evaluation, so dependents can tell whether base is loaded once
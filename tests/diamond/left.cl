@@ -0,0 +1,5 @@
+;; this file is the left side of the diamond-shaped dependency graph
+
+(require diamond/base)
+
+(def loaded base/loaded)
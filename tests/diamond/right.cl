@@ -0,0 +1,5 @@
+;; this file is the right side of the diamond-shaped dependency graph
+
+(require diamond/base)
+
+(def loaded base/loaded)
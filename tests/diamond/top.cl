@@ -0,0 +1,7 @@
+;; this file is the top of the diamond-shaped dependency graph
+
+(require diamond/left)
+(require diamond/right)
+
+(def same-base? (= (id left/loaded) (id right/loaded)))  ;; <- objects are compared by identity
+(def left-loaded left/loaded)  ;; <---------------- qualified names have two parts, so export it for the tests
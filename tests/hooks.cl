@@ -0,0 +1,55 @@
+;; this file contains tests for the evaluator hooks, hooks are not reported to hooks, and they can be removed
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(defn square (x) (* x x))
+
+(def events (atom []))
+
+(defn remember (& arguments)
+  (swap! events conj (first arguments)))
+
+(add-hook :enter remember)
+(square 3)
+(remove-hook :enter remember)
+(square 4) ;; <- this one is not reported anymore
+(check "hooks: enter hook is called with the function name" (deref events) ["square"])
+
+(reset! events [])
+(defn on-exit (name where result) (swap! events conj result))
+(add-hook :exit on-exit)
+(square 5)
+(remove-hook :exit on-exit)
+(check "hooks: exit hook is called with the result" (deref events) [25])
+
+(reset! events [])
+(add-hook :def remember)
+(def answer 42)
+(defn answer-fn () answer)
+(remove-hook :def remember)
+(check "hooks: def hook is called for (def) and (defn)" (deref events) ["answer" "answer-fn"])
+
+(reset! events [])
+(defn on-error (form error) (swap! events conj error))
+(add-hook :error on-error)
+(try (square nil) (catch Exception _ nil))
+(remove-hook :error on-error)
+(check "hooks: error hook is called once, by the innermost form" (count (deref events)) 1)
+(check "hooks: error hook is called with the error" (.__contains__ (str (first (deref events))) "TypeError") true)
+
+(def forms (atom 0))
+(defn on-form (form environment) (swap! forms inc))
+(add-hook :before-form on-form)
+(square 6)
+(clear-hooks)
+(check "hooks: before-form hook sees nested forms" (> (deref forms) 1) true)
+(check "hooks: removing a hook that is not there returns false" (remove-hook :enter on-form) false)
+
+(defn noop (& arguments) nil)
+(defn stop-hooks () (remove-hook :enter noop) 1)
+(add-hook :enter noop)
+(check "hooks: function that removes the last hook still returns" (stop-hooks) 1)
+(add-hook :exit noop)
+(def stop-exit-hooks #(do (remove-hook :exit noop) %1))
+(check "hooks: inline function that removes the last hook still returns" (stop-exit-hooks 2) 2)
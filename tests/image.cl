@@ -0,0 +1,55 @@
+;; this file contains tests for the core library images, which keep the parsed core library between the launches
+
+(import os)
+(import tempfile)
+(import threading)
+(import chiakilisp.image)
+
+(defn write (path source)
+  (let (writer (open path "w"))
+   (.write writer source)
+   (.close writer)))
+
+(defn image-in (directory)
+  (.join os/path directory "test.image"))
+
+(deftest saved-image-is-loaded
+  (let (path (image-in (tempfile/mkdtemp)))
+   (image/save path (runtime/wood "(+ 1 2) (str 4)" "image.cl"))
+   (is (= (list (map (fn (node) (.execute node __globals__)) (image/load path))) [3 "4"]))))
+
+(deftest missing-or-broken-image-is-not-loaded
+  (let (directory (tempfile/mkdtemp))
+   (is (nil? (image/load (image-in directory))))
+   (write (image-in directory) "not a pickle")
+   (is (nil? (image/load (image-in directory))))))
+
+(deftest runtime-parses-the-core-when-its-image-is-broken
+  (let (directory (tempfile/mkdtemp))
+   (write (image/image_path directory (runtime/core_source_code)) "not a pickle")
+   (is (= (.execute (runtime/Runtime nil false directory) "(inc 1)") 2))))
+
+(deftest image-that-can-not-be-saved-leaves-nothing-behind
+  (let (directory (tempfile/mkdtemp))
+   (image/save (image-in directory) [(threading/Lock)])
+   (image/save (image-in directory) (reduce (fn (nested _) [nested]) (range 5000) []))
+   (is (= (os/listdir directory) []))))
+
+(deftest image-path-depends-on-the-source-format-and-modules
+  (let (path     (image/image_path "images" "(+ 1 2)")
+        format   image/IMAGE_FORMAT
+        modules  image/package_modules
+        module   (.join os/path (tempfile/mkdtemp) "module.py"))
+   (is (= (image/image_path "images" "(+ 1 2)") path))
+   (is (not (= (image/image_path "images" "(+ 1 3)") path)) "the source code")
+   (setattr image "IMAGE_FORMAT" (inc format))
+   (is (not (= (image/image_path "images" "(+ 1 2)") path)) "the image format")
+   (setattr image "IMAGE_FORMAT" format)
+   (write module "")
+   (setattr image "package_modules" (fn () [module]))
+   (os/utime module #[1 1])
+   (let (before (image/image_path "images" "(+ 1 2)")
+         _      (os/utime module #[2 2])
+         after  (image/image_path "images" "(+ 1 2)"))
+    (setattr image "package_modules" modules)
+    (is (not (= before after)) "the module modification time"))))
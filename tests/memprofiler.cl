@@ -0,0 +1,50 @@
+;; this file contains tests for the chiakilisp.memprofiler, allocations should be attributed to ChiakiLisp functions
+
+(import io)
+(import tracemalloc)
+(import chiakilisp.memprofiler)
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(defn allocate (n)
+  (list (map str (range n))))
+
+(defn row-of (profiler name)
+  (first (list (filter (fn (row) (= (first (first row)) name)) (.stats profiler)))))
+
+(def profiler (.start (memprofiler/MemoryProfiler)))
+(def before (memprofiler/snapshot))
+(def kept (allocate 10000))
+(def after (memprofiler/snapshot))
+(.stop profiler)
+
+(let (row (row-of profiler "allocate")
+      (_ calls own) row)
+  (check "memprofiler: calls are counted" calls 1)
+  (check "memprofiler: function is keyed by its definition position" (second (first row)) #["memprofiler.cl" 10 2])
+  (check "memprofiler: retained allocations are attributed to the function" (> own 100000) true))
+
+(let ((key calls own) (first (memprofiler/compare before after)))
+  (check "memprofiler: snapshot diff shows the function that has allocated" [(first key) calls (> own 100000)]
+                                                                            ["allocate" 1 true]))
+
+(let (report (io/StringIO)
+      _      (memprofiler/diff before after report))
+  (check "memprofiler: diff report names the function position"
+         (.__contains__ (.getvalue report) "allocate (memprofiler.cl:10:2)") true))
+
+(check "memprofiler: snapshot requires the running profiler"
+       (try (memprofiler/snapshot) (catch Exception error (.__contains__ (str error) "not running"))) true)
+
+(def reset-peak tracemalloc/reset_peak)
+(def forms-profiler (.start (memprofiler/MemoryProfiler)))
+(delattr tracemalloc "reset_peak")  ;; <- Python 3.8 does not have it
+(def forms-result (try (.execute forms-profiler (first (runtime/wood "(allocate 10000)" "peak.cl")) __globals__)
+                    (catch Exception error error)))
+(setattr tracemalloc "reset_peak" reset-peak)
+(.stop forms-profiler)
+
+(let (row (row-of forms-profiler "<top-level form>"))
+  (check "memprofiler: top-level form peak is measured without tracemalloc/reset_peak"
+         [(if (list? forms-result) (count forms-result) forms-result) (> (last row) 100000)] [10000 true]))
@@ -0,0 +1,52 @@
+;; this file contains differential tests for the optimizer pass, each program has to give the same result either way
+
+(import chiakilisp.optimizer)
+
+(def plain (runtime/Runtime))
+(def optimized (runtime/Runtime nil false nil nil true))
+
+(defn same (source)
+  (let (expected (.execute (.fork plain) source)
+        actual   (.execute (.fork optimized) source))
+    (is (= expected actual) source)))
+
+(deftest folds-pure-calls
+  (same "(* 60 60 24)")
+  (same "(+ (* 2 3) (- 10 4) (mod 7 3))")
+  (same "[(inc 1) (str 10) (max 1 5 3) (= 1 1.0) (not nil) (count #[1 2])]")
+  (same "(defn f (x) (+ x (* 2 3))) (f 1)"))
+
+(deftest prunes-dead-branches
+  (same "(if true :a :b)")
+  (same "(if nil :a)")
+  (same "(when false 1)")
+  (same "(when true 1 2 3)")
+  (same "(if (< 1 2) :less :more)")
+  (same "(cond false 1 nil 2 :else 3 true 4)")
+  (same "(cond (= 1 2) 1 (= 1 1) 2)")
+  (same "(cond false 1)"))
+
+(deftest flattens-do-blocks
+  (same "(do 1 (do 2 (do 3)) (do))")
+  (same "(do 1 (do 2) (do))")
+  (same "(do (do) 1)")
+  (is (= (.execute (.fork optimized) "(do 1 (do 2) (do))") nil))
+  (same "(let (a (atom 0)) (do (swap! a inc) (do (swap! a inc))) (deref a))"))
+
+(deftest respects-rebinding
+  (same "(def + -) (+ 5 3)")
+  (same "(let (* +) (* 5 3))")
+  (same "(defn f (= x) (if (= 1 1) :yes :no)) (f (fn (a b) false) 1)")
+  (same "(def str (fn (x) :mine)) (str 1)")
+  (same "(defn g () (+ 1 2)) (def + -) (g)"))
+
+(deftest leaves-errors-to-runtime
+  (same "(try (/ 1 0) (catch Exception e :raised))")
+  (same "(try (if true (def x 1)) (catch SyntaxError e :raised))")
+  (same "(-> 1 (+ 2) (* 3))"))
+
+(deftest does-fold-and-prune
+  (let (nodes (optimizer/optimize (runtime/wood "(if true 1 2) (when false 1) (+ 1 2)" "<test>") __globals__))
+    (is (= (.value (.token (first nodes))) "1"))
+    (is (= (.type (.token (second nodes))) "Nil"))
+    (is (= (getattr (getattr (third nodes) "_folded") "value") 3))))
@@ -0,0 +1,29 @@
+;; this file contains tests for the chiakilisp.profiler, function calls should be attributed to their definitions
+
+(import io)
+(import chiakilisp.profiler)
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(defn countdown (n)
+  (when (> n 0) (countdown (dec n))))
+
+(defn row-of (profiler name)
+  (first (list (filter (fn (row) (= (first (first row)) name)) (.stats profiler)))))
+
+(def profiler (.start (profiler/Profiler)))
+(countdown 5)
+(.stop profiler)
+(countdown 5) ;; <- this one is not profiled anymore
+
+(let (row (row-of profiler "countdown")
+      (_ calls own cumulative) row)
+  (check "profiler: recursive calls are counted" calls 6)
+  (check "profiler: function is keyed by its definition position" (second (first row)) #["profiler.cl" 9 2])
+  (check "profiler: cumulative time is counted once for the recursion" (<= own (+ cumulative 0.001)) true))
+
+(let (stacks (io/StringIO)
+      _      (.collapsed profiler stacks))
+  (check "profiler: collapsed stacks nest recursive calls"
+         (.__contains__ (.getvalue stacks) "countdown (profiler.cl:9:2);countdown (profiler.cl:9:2);") true))
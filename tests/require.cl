@@ -0,0 +1,92 @@
+;; this file contains tests for (require) module registry, tests/diamond/ is a diamond-shaped dependency graph
+
+(import os)
+(import time)
+(import tempfile)
+(import chiakilisp.registry)
+
+(require diamond/top)   ;; <- requires diamond/left and diamond/right, and they both require diamond/base
+(require diamond/base)
+
+(defn write (path source)
+  (let (writer (open path "w"))
+   (.write writer source)
+   (.close writer)))
+
+(defn value-of (path)
+  (let (module (__require__ path))
+   module/value))
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(deftest diamond-modules-are-loaded-once
+  (is (= top/same-base? true) "diamond: base is loaded once")
+  (is (= (id base/loaded) (id top/left-loaded)) "diamond: requiring base again returns the same module")
+  (is (= (id (__require__ "diamond/top")) (id top)) "(require) returns the loaded module"))
+
+(def directory (tempfile/mkdtemp))
+(def leaf-path (.join os/path directory "leaf.cl"))
+(def root-path (.join os/path directory "root.cl"))
+
+(write leaf-path "(def value 1)")
+(write root-path (+ "(require " (.join os/path directory "leaf") ") (def value (+ leaf/value 10))"))
+
+(check "changed module: it's loaded" (value-of root-path) 11)
+(os/utime leaf-path (tuply (+ (time/time) 10) (+ (time/time) 10)))
+(check "touched module: it's not reloaded" (= (value-of leaf-path) 1) true)
+(write leaf-path "(def value 2)")
+(os/utime leaf-path (tuply (+ (time/time) 20) (+ (time/time) 20)))
+(check "changed module: it's reloaded" (value-of leaf-path) 2)
+(check "changed module: its dependents are reloaded" (value-of root-path) 12)
+
+(write leaf-path (+ "(require " (.join os/path directory "root") ")"))
+(os/utime leaf-path (tuply (+ (time/time) 30) (+ (time/time) 30)))
+(check "circular dependency: ImportError is raised"
+       (try (__require__ root-path) (catch Exception error (.__contains__ (str error) "ImportError"))) true)
+(check "missing module: FileNotFoundError is raised"
+       (try (__require__ "diamond/missing") (catch Exception error (.__contains__ (str error) "FileNotFoundError"))) true)
+
+(defn modules (sources)     ;; <- writes {name source} modules to a new directory, "@" in source is the directory
+  (let (directory (tempfile/mkdtemp))
+   (for (name (list (.keys sources)))
+    (write (.join os/path directory (+ name ".cl")) (.replace (.__getitem__ sources name) "@" directory)))
+   directory))
+
+(defn with-pool-of-two (f)
+  (.__setitem__ os/environ "CHIAKILISP_POOL_SIZE" "2")
+  (registry/shutdown)
+  (let (result (try (f) (catch Exception error error)))
+   (.pop os/environ "CHIAKILISP_POOL_SIZE")
+   (registry/shutdown)
+   result))
+
+(deftest prefetched-modules-are-executed-in-dependency-order
+  (let (directory (modules {"c"    "(import time) (def loaded (time/perf_counter_ns))"
+                            "a"    "(import time) (require @/c) (def loaded (time/perf_counter_ns))"
+                            "b"    "(import time) (def loaded (time/perf_counter_ns))"
+                            "main" "(import time) (require @/a) (require @/b) (def loaded (time/perf_counter_ns))"})
+        main      (with-pool-of-two (fn () [(__require__ (.join os/path directory "main")) registry/_POOL])))
+   (is (not (nil? (second main))) "the dependencies are parsed by the pool")
+   (let ((main _) main
+         a         (getattr main "a"))
+    (is (= (list (map (fn (module) (getattr module "loaded")) [(getattr a "c") a (getattr main "b") main]))
+           (sorted (list (map (fn (module) (getattr module "loaded")) [(getattr a "c") a (getattr main "b") main]))))))))
+
+(deftest syntax-error-of-prefetched-module-is-raised-by-its-require
+  (let (directory (modules {"good" "(def value 1)"
+                            "bad"  "(def value"
+                            "main" "(require @/good) (require @/bad)"})
+        error     (with-pool-of-two (fn () (__require__ (.join os/path directory "main")))))
+   (is (isinstance error SyntaxError))
+   (is (.__contains__ (str error) "no ClosingParen token"))
+   (is (contains? (set (map (fn (path) (.basename os/path path)) (.keys (.modules (getattr (getattr __require__ "__self__") "modules")))))
+                  "good.cl")
+       "modules required before the broken one are loaded")))
+
+(deftest single-dependency-is-parsed-without-the-pool
+  (let (directory (modules {"one"  "(def value 1)"
+                            "solo" "(require @/one) (def value (inc one/value))"})
+        solo      (with-pool-of-two (fn () [(__require__ (.join os/path directory "solo")) registry/_POOL])))
+   (is (= (getattr (first solo) "value") 2))
+   (is (nil? (second solo)) "no pool is started for a single module")))
@@ -0,0 +1,32 @@
+;; this file contains tests for the chiakilisp.sampler, sampled stacks should be the ChiakiLisp function stacks
+
+(import io)
+(import time)
+(import chiakilisp.sampler)
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(defn spin (deadline)
+  (while (< (time/monotonic) deadline) (spin-again 10)))
+
+(defn spin-again (n)
+  (when (> n 0) (spin-again (dec n))))
+
+(def sampler (.start (sampler/Sampler 0.001)))
+(check "sampler: sampler thread is running once started" (.running sampler) true)
+(spin (+ (time/monotonic) 0.3))
+(.stop sampler)
+(check "sampler: sampler thread is not running once stopped" (.running sampler) false)
+
+(let (rows (.stats sampler)
+      spin (first (list (filter (fn (row) (= (first (first row)) "spin")) rows))))
+  (check "sampler: the busy function has been sampled" (> (last spin) 0) true)
+  (check "sampler: function is keyed by its definition position" (second (first spin)) #["sampler.cl" 10 2]))
+
+(let (stacks (io/StringIO)
+      _      (.collapsed sampler stacks))
+  (check "sampler: collapsed stacks nest the function calls"
+         (.__contains__ (.getvalue stacks) "spin (sampler.cl:10:2);spin-again (sampler.cl:13:2);spin-again (sampler.cl:13:2)") true))
+
+(check "sampler: clear forgets the samples" (.stats (.clear sampler)) [])
@@ -0,0 +1,42 @@
+;; this file contains tests for the qualified symbols resolution, which is cached by each reference site
+
+(import sys)
+(import types)
+
+(defn check (description result expected)
+  (prn description (if (= result expected) "PASSED" (+ "FAILED: expected: " (str expected) " got: " (str result)))))
+
+(def first-module (types/ModuleType "first"))
+(def second-module (types/ModuleType "second"))
+(setattr first-module "value" 1)
+(setattr second-module "value" 2)
+
+(def m first-module)
+(defn read-value () m/value)
+(check "symbols: module member is resolved" [(read-value) (read-value)] [1 1])
+
+(def m second-module)
+(check "symbols: (def) of the module alias is seen by the cached reference site" (read-value) 2)
+
+(setattr second-module "value" 3)
+(check "symbols: a member rebound by (setattr) is seen by the cached reference site" (read-value) 3)
+
+(def argv sys/argv)
+(defn show-argv () sys/argv)
+(show-argv)
+(setattr sys "argv" ["changed"])
+(check "symbols: a member of the Python 3 module rebound by (setattr) is seen" (show-argv) ["changed"])
+(setattr sys "argv" argv)
+
+(defn read-from (m) m/value)
+(check "symbols: the same site with a local module alias" [(read-from first-module) (read-from second-module)] [1 3])
+
+(def namespace (types/SimpleNamespace))
+(setattr namespace "value" 4)
+(defn read-namespace () namespace/value)
+(read-namespace)
+(setattr namespace "value" 5)
+(check "symbols: attributes of the objects other than modules are not cached" (read-namespace) 5)
+
+(check "symbols: missing member is still a NameError"
+       (try (read-from (types/ModuleType "empty")) (catch NameError e (.__contains__ (str e) "no such a member named: 'value'"))) true)
@@ -0,0 +1,26 @@
+;; this file contains tests for the (deftest) and (is) forms, which `chiakilang test` runs in its worker processes
+
+(defn square (x) (* x x))
+
+(deftest is-returns-true
+  (is (= (square 3) 9))
+  (is (= true (is (positive? 1)))))
+
+(deftest is-reports-expected-and-actual
+  (is (= (try (is (= 1 (square 2)) "square") (catch AssertionError e (.__contains__ (str e) "square: expected: 1, got: 4")))
+         true)))
+
+(deftest is-reports-the-plain-assertion
+  (is (try (is (nil? 1)) (catch AssertionError e (.__contains__ (str e) "is: the assertion failed")))))
+
+(deftest is-respects-rebound-equality
+  (let (= (fn (a b) true))
+    (is (= 1 2))))
+
+(deftest deftest-defines-a-function
+  (is (callable is-returns-true)))
+
+(deftest is-fails-on-mismatched-types
+  (is (try (is (= nil 3)) (catch AssertionError e true)))
+  (is (try (is (= #[1 2] [1 2])) (catch AssertionError e true)))
+  (is (= 1 1.0)))